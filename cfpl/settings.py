@@ -119,3 +119,30 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/2.2/howto/static-files/
 
 STATIC_URL = '/static/'
+
+
+# How the web view and `manage.py run_program` run programs: 'tree' walks the syntax
+# tree, 'quickening' walks it with operators that specialise on their first operands,
+# 'closure' compiles it once into Python closures, 'vm' compiles it into bytecode
+# for a stack machine, 'python' translates it into Python source for compile(),
+# 'native' does the same with values held as Python ints, floats, bools and strs, see
+# programming_language/semantics/program.py
+
+PROGRAM_ENGINE = 'python'
+
+
+# Parsed program cache of the web view, see programming_language/program_cache.py
+# EVICTION is 'LRU' or 'FIFO', a CAPACITY of 0 disables the cache
+
+PROGRAM_CACHE = {
+    'CAPACITY': 256,
+    'EVICTION': 'LRU',
+}
+
+
+# Compiled programs shared by all workers through the database, MAX_SIZE is the
+# total size in bytes of the stored programs, 0 disables it
+
+COMPILED_PROGRAM_CACHE = {
+    'MAX_SIZE': 64 * 1024 * 1024,
+}
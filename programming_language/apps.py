@@ -2,4 +2,5 @@ from django.apps import AppConfig
 
 
 class ProgrammingLanguageConfig(AppConfig):
+    default_auto_field = 'django.db.models.AutoField'
     name = 'programming_language'
@@ -31,6 +31,11 @@ class InvalidSyntaxError(Error):
     def __init__(self, pos_start, details):
         super().__init__(pos_start, 'Invalid Syntax', details)
 
+class IllegalTypeError(Error):
+    
+    def __init__(self, pos_start, details):
+        super().__init__(pos_start, 'Illegal Type', details)
+
 class RuntimeError(Error):
     
     def __init__(self, pos_start, details, context):
@@ -52,4 +57,11 @@ class RuntimeError(Error):
             pos = ctx.parent_entry_pos
             ctx = ctx.parent
         
-        return 'Traceback (most recent call last):\n' + result
\ No newline at end of file
+        return 'Traceback (most recent call last):\n' + result
+class RuntimeException(Exception):
+
+    # carries a RuntimeError out of the Interpreter, which catches it once where the visit started
+
+    def __init__(self, error):
+        super().__init__(error.details)
+        self.error = error
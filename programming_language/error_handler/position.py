@@ -5,10 +5,13 @@ class Position:
         self.line = line
         self.text = text
 
+    def __reduce__(self):
+        return (Position, (self.index, self.line, self.text))
+
     def advance(self, current_char=None):
         self.index += 1
 
-        if current_char == ';':
+        if current_char == ';' or current_char == '\n':
             self.line += 1
 
         return self
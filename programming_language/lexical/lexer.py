@@ -1,15 +1,20 @@
+import re
+from bisect import bisect_left
+
 from programming_language.error_handler.error import IllegalCharacterError
-from programming_language.error_handler.error import IllegalVariableDeclarationError
 from programming_language.error_handler.error import InvalidSyntaxError
 from programming_language.error_handler.position import Position
+from programming_language.lexical.source import Source
+from programming_language.lexical.token import SourceToken
 from programming_language.lexical.token import Token
-from programming_language.semantics.number import Number
-from programming_language.semantics.string import String
 
 class Lexer:
 
-    def __init__(self, text):
+    def __init__(self, text, scanner=None):
         self.text = text
+        self.scanner = scanner if scanner != None else Lexer.SCANNER
+        self.source = None
+        self.error = None
         self.pos = Position(-1, 0, text)
         self.current_char = None
         self.advance()
@@ -19,6 +24,11 @@ class Lexer:
         self.current_char = self.text[self.pos.index] if self.pos.index < len(self.text) else None
     
     def make_tokens(self):
+        if self.scanner == Lexer.REGEX_SCANNER:
+            return self.scan_tokens()
+        return self.make_tokens_by_character()
+
+    def make_tokens_by_character(self):
         tokens = []
 
         while self.current_char != None:
@@ -31,18 +41,19 @@ class Lexer:
                     self.advance()
                 else:
                     tokens.append(self.skip_comment())
-            elif self.current_char == ';':
+            elif self.current_char in ';\n':
                 tokens.append(Token(Token.NEWLINE, pos_start=self.pos))
                 self.advance()
+            elif self.current_char == '\r' and self.text[self.pos.index + 1:self.pos.index + 2] == '\n':
+                tokens.append(Token(Token.NEWLINE, pos_start=self.pos))
+                self.advance()
+                self.advance()
             elif self.current_char in Token.DIGITS:
                 tokens.append(self.make_number())
             elif self.current_char in Token.LETTERS:
-                pos_start = self.pos.copy()
                 tokens.append(self.make_keywords())
-                tokens, error = self.set_default_values(tokens)
-                if error:
-                    return tokens, IllegalVariableDeclarationError(pos_start, "'" + error + "'")
             elif self.current_char in '"\'':
+                pos_start = self.pos.copy()
                 token, error = self.make_string()
                 if error:
                     return tokens, InvalidSyntaxError(pos_start, "" + error + "")
@@ -89,6 +100,131 @@ class Lexer:
         tokens.append(Token(Token.EOL, pos_start=self.pos))
         return tokens, None
 
+    def scan_tokens(self):
+        tokens = list(self.iter_tokens())
+        if isinstance(self.error, IllegalCharacterError):
+            return [], self.error
+        return tokens, self.error
+
+    def relex(self, tokens, offset, deleted, inserted):
+        text = self.text[:offset] + inserted + self.text[offset + deleted:]
+        self.text = text
+        self.pos = Position(-1, 0, text)
+        self.current_char = None
+        self.advance()
+
+        if self.scanner != Lexer.REGEX_SCANNER or not tokens or tokens[-1].type != Token.EOL or not isinstance(tokens[-1], SourceToken):
+            return self.make_tokens()
+
+        shift = len(inserted) - deleted
+        old_source = tokens[-1].source
+
+        # rescan from the start of the line holding the first edited character
+        low, high = 0, len(tokens) - 1
+        while low < high:
+            middle = (low + high) // 2
+            if tokens[middle].end <= offset:
+                low = middle + 1
+            else:
+                high = middle
+        restart = low
+        while restart > 0 and tokens[restart - 1].type != Token.NEWLINE:
+            restart -= 1
+
+        restart_index = tokens[restart - 1].end if restart > 0 else 0
+        previous = tokens[restart - 1] if restart > 0 else None
+        source = Source(text)
+        source.newlines = old_source.newlines[:bisect_left(old_source.newlines, restart_index)]
+
+        new_tokens = tokens[:restart]
+        old_index = restart
+        edit_end = offset + deleted
+
+        for token in self.iter_tokens(source, restart_index, previous, restart):
+            new_tokens.append(token)
+            if token.type != Token.NEWLINE:
+                continue
+
+            # the streams line up again at a newline both of them share after the edit
+            while old_index < len(tokens) and (tokens[old_index].start < edit_end or tokens[old_index].start + shift < token.start):
+                old_index += 1
+            if old_index < len(tokens) and tokens[old_index].start + shift == token.start and tokens[old_index].type == Token.NEWLINE:
+                for old_token in tokens[old_index + 1:]:
+                    new_tokens.append(SourceToken(old_token.type, old_token.start + shift, old_token.end + shift, source, old_token.literal))
+                old_newlines = old_source.newlines
+                source.newlines.extend(newline + shift for newline in old_newlines[bisect_left(old_newlines, tokens[old_index].end):])
+                self.source = source
+                self.error = None
+                return new_tokens, None
+
+        if isinstance(self.error, IllegalCharacterError):
+            return [], self.error
+        return new_tokens, self.error
+
+    def iter_tokens(self, source=None, index=0, previous=None, token_count=0):
+        text = self.text
+        length = len(text)
+        if source == None: source = Source(text)
+        newlines = source.newlines
+        self.source = source
+        match = Lexer.PATTERN.match
+        eol_index = length
+        self.error = None
+
+        while True:
+            lexeme = match(text, index)
+            group = lexeme.lastgroup
+            start = lexeme.start(group)
+            index = lexeme.end()
+            literal = None
+
+            if group == 'WORD':
+                token_type = Lexer.WORDS.get(lexeme.group(group), Token.IDENTIFIER)
+            elif group == 'NEWLINE':
+                token_type = Token.NEWLINE
+                newlines.append(index - 1)
+            elif group == 'OPERATOR':
+                token_type = Lexer.OPERATORS[lexeme.group(group)]
+            elif group == 'NUMBER':
+                token_type = Token.FLOAT if text.find('.', start, index) != -1 else Token.INT
+            elif group == 'STRING':
+                closed = index - start > 1 and text[index - 1] in '"\''
+                value_end = index - 1 if closed else index
+                if not closed: eol_index = length + 1
+                if SourceToken.ESCAPES.search(text, start + 1, value_end):
+                    if text.find('[', start + 1, value_end) != -1 and text.find(']', start + 1, value_end) == -1:
+                        self.error = InvalidSyntaxError(source.position(start), "Expected ']'")
+                        return
+                    literal = SourceToken.decode_string(text[start + 1:value_end])
+                elif value_end - start - 1 in (4, 5):
+                    literal = text[start + 1:value_end]
+                token_type = Token.BOOL if literal in Lexer.BOOL_VALUES else Token.CHAR
+                source.add_newlines(start, index)
+            elif group == 'STAR':
+                if token_count > 1 and previous.type != Token.NEWLINE:
+                    token_type = Token.MUL
+                else:
+                    token_type = Token.COMMENT
+                    line_end = Lexer.LINE_END.search(text, index)
+                    if line_end:
+                        index = line_end.end()
+                    else:
+                        index = length
+                        eol_index = length + 1
+                    source.add_newlines(start, index)
+            elif group == 'END':
+                break
+            else:
+                self.error = IllegalCharacterError(source.position(start), "'" + lexeme.group(group) + "'")
+                return
+
+            token = SourceToken(token_type, start, index, source, literal)
+            token_count += 1
+            previous = token
+            yield token
+
+        yield SourceToken(Token.EOL, eol_index, eol_index, source)
+
     def make_number(self):
         num_str = ''
         dot_count = 0
@@ -157,42 +293,13 @@ class Lexer:
             self.advance()
 
         if id_str in Token.KEYWORDS:
-            token_type = Token.KEYWORD
+            token_type = Token.KEYWORD_KINDS[id_str]
         elif id_str in Token.DATA_TYPES:
             token_type = Token.DATA_TYPE
         else:
             token_type = Token.IDENTIFIER
         return Token(token_type, id_str, pos_start)
 
-    def set_default_values(self, tokens):
-        length = len(tokens)-1
-        if length > 0:
-            data_type = tokens[length].value
-            if data_type in Token.DATA_TYPES:
-                pos_start = self.pos.copy()
-                data_value = None
-                for token in reversed(tokens):
-                    if token.value == Token.VAR: break
-                    if token.type == Token.IDENTIFIER:
-                        if data_value == None and tokens[length+1].type != Token.EQ:
-                            tokens.insert(length+1, Token(Token.EQ, None, pos_start))
-                            if data_type == Token.INT:
-                                tokens.insert(length+2, Token(Token.INT, Number(0), pos_start))
-                            elif data_type == Token.FLOAT:
-                                tokens.insert(length+2, Token(Token.FLOAT, Number(0), pos_start))
-                            elif data_type == Token.BOOL:
-                                tokens.insert(length+2, Token(Token.BOOL, Token.FALSE, pos_start))
-                            else:
-                                tokens.insert(length+2, Token(Token.CHAR, String(""), pos_start))
-                        else:
-                            if data_type != tokens[length+2].type:
-                                return [], tokens[length].value
-                            data_value = None
-                    elif token.type in Token.DATA_TYPES:
-                        data_value = token.value
-                    length -= 1
-        return tokens, None
-
     def make_equals(self):
         token_type = Token.EQ
         pos_start = self.pos.copy()
@@ -234,9 +341,53 @@ class Lexer:
 
         self.advance()
 
-        while self.current_char != ';':
+        while self.current_char != None and self.current_char not in ';\n':
             self.advance()
 
         self.advance()
 
-        return Token(Token.COMMENT, pos_start=pos_start)
\ No newline at end of file
+        return Token(Token.COMMENT, pos_start=pos_start)
+
+Lexer.CHARACTER_SCANNER = 'CHARACTER'
+Lexer.REGEX_SCANNER     = 'REGEX'
+Lexer.SCANNER           = Lexer.REGEX_SCANNER
+
+Lexer.PATTERN = re.compile(r'''
+    [ \t]*
+    (?:
+        (?P<WORD>[A-Za-z][A-Za-z0-9_]*)
+      | (?P<NEWLINE>;|\r?\n)
+      | (?P<OPERATOR><[=>]?|>=?|==?|[-+/%()&:,])
+      | (?P<NUMBER>[0-9]+(?:\.[0-9]*)?)
+      | (?P<STRING>["'][^"']*["']?)
+      | (?P<STAR>\*)
+      | (?P<END>\Z)
+      | (?P<ILLEGAL>.)
+    )
+''', re.VERBOSE | re.DOTALL)
+
+Lexer.LINE_END = re.compile(r';|\r?\n')
+
+Lexer.BOOL_VALUES = frozenset(Token.BOOL_VALUES)
+
+Lexer.WORDS = dict(Token.KEYWORD_KINDS)
+Lexer.WORDS.update((data_type, Token.DATA_TYPE) for data_type in Token.DATA_TYPES)
+
+Lexer.OPERATORS = {
+    '+': Token.PLUS,
+    '-': Token.MINUS,
+    '/': Token.DIV,
+    '%': Token.MOD,
+    '(': Token.LPAREN,
+    ')': Token.RPAREN,
+    '&': Token.CONCAT,
+    ':': Token.COLON,
+    ',': Token.COMMA,
+    '=': Token.EQ,
+    '==': Token.EE,
+    '<': Token.LT,
+    '<=': Token.LTE,
+    '<>': Token.NE,
+    '>': Token.GT,
+    '>=': Token.GTE
+}
@@ -0,0 +1,21 @@
+import re
+from array import array
+from bisect import bisect_left
+
+from programming_language.error_handler.position import Position
+
+class Source:
+
+    def __init__(self, text):
+        self.text = text
+        self.newlines = array('I')
+
+    def add_newlines(self, start, end):
+        for newline in Source.NEWLINES.finditer(self.text, start, end):
+            self.newlines.append(newline.start())
+
+    def position(self, index):
+        return Position(index, bisect_left(self.newlines, index), self.text)
+
+
+Source.NEWLINES = re.compile(r'[;\n]')
@@ -1,38 +1,157 @@
+import re
 import string
 
+class TokenKind:
+    IDENTIFIER               = 1
+    KEYWORD                  = 2
+    DATA_TYPE                = 3
+    EQUAL                    = 4
+    INT                      = 5
+    CHAR                     = 6
+    BOOL                     = 7
+    FLOAT                    = 8
+    PLUS                     = 9
+    MINUS                    = 10
+    MUL                      = 11
+    DIV                      = 12
+    MOD                      = 13
+    EQUAL_TO                 = 14
+    NOT_EQUAL_TO             = 15
+    LESS_THAN                = 16
+    GREATER_THAN             = 17
+    LESS_THAN_OR_EQUAL_TO    = 18
+    GREATER_THAN_OR_EQUAL_TO = 19
+    LPAREN                   = 20
+    RPAREN                   = 21
+    CONCAT                   = 22
+    COMMA                    = 23
+    COLON                    = 24
+    NEWLINE                  = 25
+    COMMENT                  = 26
+    EOL                      = 27
+
+    # every keyword has its own kind so that it is matched with one comparison
+    VAR                      = 32
+    AS                       = 33
+    AND                      = 34
+    OR                       = 35
+    NOT                      = 36
+    TRUE                     = 37
+    FALSE                    = 38
+    IF                       = 39
+    ELIF                     = 40
+    ELSE                     = 41
+    WHILE                    = 42
+    START                    = 43
+    STOP                     = 44
+    OUTPUT                   = 45
+
 class Token:
+    __slots__ = ('type', 'value', 'pos_start', 'end')
 
-    def __init__(self, type_, value=None, pos_start=None):
+    def __init__(self, type_, value=None, pos_start=None, end=None):
         self.type = type_
         self.value = value
+        self.pos_start = pos_start.copy() if pos_start else None
+        self.end = end
 
-        if pos_start:
-            self.pos_start = pos_start.copy()
+    def __reduce__(self):
+        return (Token, (self.type, self.value, self.pos_start, self.end))
 
     def __repr__(self):
-        if self.value != None: return f'{self.type}:{self.value}'
-        return f'{self.type}'
+        name = 'KEYWORD' if self.is_keyword() else TokenKind.NAMES[self.type]
+        if self.value != None: return f'{name}:{self.value}'
+        return f'{name}'
 
     def matches(self, type_, value):
+        if type_ == Token.KEYWORD:
+            return self.type == Token.KEYWORD_KINDS.get(value)
         return self.type == type_ and self.value == value
 
+    def is_keyword(self):
+        return self.type >= TokenKind.VAR
+
+class SourceToken:
+    __slots__ = ('type', 'start', 'end', 'source', 'literal')
+
+    def __init__(self, type_, start, end, source, literal=None):
+        self.type = type_
+        self.start = start
+        self.end = end
+        self.source = source
+        self.literal = literal
+
+    def __reduce__(self):
+        return (SourceToken, (self.type, self.start, self.end, self.source, self.literal))
+
+    __repr__ = Token.__repr__
+    matches = Token.matches
+    is_keyword = Token.is_keyword
+
+    @property
+    def pos_start(self):
+        return self.source.position(self.start)
+
+    @property
+    def value(self):
+        if self.literal == None:
+            token_type = self.type
+            if token_type >= TokenKind.VAR:
+                return TokenKind.NAMES[token_type]
+            elif token_type == Token.IDENTIFIER or token_type == Token.DATA_TYPE:
+                self.literal = self.source.text[self.start:self.end]
+            elif token_type == Token.INT:
+                self.literal = int(self.source.text[self.start:self.end])
+            elif token_type == Token.FLOAT:
+                self.literal = float(self.source.text[self.start:self.end])
+            elif token_type == Token.CHAR or token_type == Token.BOOL:
+                text = self.source.text
+                closed = self.end - self.start > 1 and text[self.end - 1] in '"\''
+                self.literal = SourceToken.decode_string(text[self.start + 1:self.end - 1 if closed else self.end])
+        return self.literal
+
+    @staticmethod
+    def decode_string(string):
+        if not SourceToken.ESCAPES.search(string):
+            return string
+
+        characters = []
+        has_left_square_bracket = False
+        has_right_square_bracket = False
+
+        for char in string:
+            if char == '\\':
+                continue
+            if char == '[' and not has_left_square_bracket:
+                has_left_square_bracket = True
+            elif char == ']' and not has_right_square_bracket:
+                has_right_square_bracket = True
+            elif char == '#' and not has_left_square_bracket and not has_right_square_bracket:
+                characters.append('\n')
+            else:
+                characters.append(char)
+
+        return ''.join(characters)
+
+
+TokenKind.NAMES = {kind: name for name, kind in vars(TokenKind).items() if not name.startswith('_')}
 
 Token.DIGITS         = '0123456789'
 Token.LETTERS        = string.ascii_letters
 Token.LETTERS_DIGITS = Token.LETTERS + Token.DIGITS
 
-Token.IDENTIFIER     = 'IDENTIFIER'
-Token.KEYWORD        = 'KEYWORD'
-Token.DATA_TYPE      = 'DATA_TYPE'
+Token.IDENTIFIER     = TokenKind.IDENTIFIER
+Token.KEYWORD        = TokenKind.KEYWORD
+Token.DATA_TYPE      = TokenKind.DATA_TYPE
 
 Token.VAR            = 'VAR'
 Token.AS             = 'AS'
-Token.EQ             = 'EQUAL'
+Token.EQ             = TokenKind.EQUAL
 
-Token.INT            = 'INT'
-Token.CHAR           = 'CHAR'
-Token.BOOL           = 'BOOL'
-Token.FLOAT          = 'FLOAT'
+Token.INT            = TokenKind.INT
+Token.CHAR           = TokenKind.CHAR
+Token.BOOL           = TokenKind.BOOL
+Token.FLOAT          = TokenKind.FLOAT
 
 Token.TRUE           = 'TRUE'
 Token.FALSE          = 'FALSE'
@@ -41,18 +160,18 @@ Token.AND            = 'AND'
 Token.OR             = 'OR'
 Token.NOT            = 'NOT'
 
-Token.PLUS           = 'PLUS'
-Token.MINUS          = 'MINUS'
-Token.MUL            = 'MUL'
-Token.DIV            = 'DIV'
-Token.MOD            = 'MOD'
+Token.PLUS           = TokenKind.PLUS
+Token.MINUS          = TokenKind.MINUS
+Token.MUL            = TokenKind.MUL
+Token.DIV            = TokenKind.DIV
+Token.MOD            = TokenKind.MOD
 
-Token.EE             = 'EQUAL_TO'
-Token.NE             = 'NOT_EQUAL_TO'
-Token.LT             = 'LESS_THAN'
-Token.GT             = 'GREATER_THAN'
-Token.LTE            = 'LESS_THAN_OR_EQUAL_TO'
-Token.GTE            = 'GREATER_THAN_OR_EQUAL_TO'
+Token.EE             = TokenKind.EQUAL_TO
+Token.NE             = TokenKind.NOT_EQUAL_TO
+Token.LT             = TokenKind.LESS_THAN
+Token.GT             = TokenKind.GREATER_THAN
+Token.LTE            = TokenKind.LESS_THAN_OR_EQUAL_TO
+Token.GTE            = TokenKind.GREATER_THAN_OR_EQUAL_TO
 
 Token.IF             = 'IF'
 Token.ELIF           = 'ELIF'
@@ -60,18 +179,18 @@ Token.ELSE           = 'ELSE'
 
 Token.WHILE          = 'WHILE'
 
-Token.LPAREN         = 'LPAREN'
-Token.RPAREN         = 'RPAREN'
-Token.CONCAT         = 'CONCAT'
-Token.COMMA          = 'COMMA'
-Token.COLON          = 'COLON'
+Token.LPAREN         = TokenKind.LPAREN
+Token.RPAREN         = TokenKind.RPAREN
+Token.CONCAT         = TokenKind.CONCAT
+Token.COMMA          = TokenKind.COMMA
+Token.COLON          = TokenKind.COLON
 
 Token.OUTPUT         = 'OUTPUT'
 Token.START          = 'START'
 Token.STOP           = 'STOP'
-Token.NEWLINE        = 'NEWLINE'
-Token.COMMENT        = 'COMMENT'
-Token.EOL            = 'EOL'
+Token.NEWLINE        = TokenKind.NEWLINE
+Token.COMMENT        = TokenKind.COMMENT
+Token.EOL            = TokenKind.EOL
 
 Token.KEYWORDS = [
     'VAR',
@@ -100,4 +219,22 @@ Token.DATA_TYPES = [
 Token.BOOL_VALUES = [
     'TRUE',
     'FALSE'
-]
\ No newline at end of file
+]
+
+Token.KEYWORD_KINDS = {keyword: getattr(TokenKind, keyword) for keyword in Token.KEYWORDS}
+
+Token.DATA_TYPE_KINDS = {
+    'INT': Token.INT,
+    'FLOAT': Token.FLOAT,
+    'CHAR': Token.CHAR,
+    'BOOL': Token.BOOL
+}
+
+Token.DEFAULT_VALUES = {
+    'INT': 0,
+    'FLOAT': 0,
+    'CHAR': '',
+    'BOOL': 'FALSE'
+}
+
+SourceToken.ESCAPES = re.compile(r'[\\\[\]#]')
\ No newline at end of file
@@ -0,0 +1,73 @@
+from array import array
+
+from programming_language.lexical.token import SourceToken
+from programming_language.lexical.token import Token
+
+class TokenBuffer:
+
+    def __init__(self, lexer):
+        self.kinds = array('B')
+        self.starts = array('I')
+        self.ends = array('I')
+        self.literals = {}
+
+        for token in lexer.iter_tokens():
+            if token.literal != None:
+                self.literals[len(self.kinds)] = token.literal
+            self.kinds.append(token.type)
+            self.starts.append(token.start)
+            self.ends.append(token.end)
+
+        self.source = lexer.source
+        self.error = lexer.error
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def __iter__(self):
+        for index in range(len(self.kinds)):
+            yield self.token(index)
+
+    def token(self, index):
+        return SourceToken(
+            self.kinds[index],
+            self.starts[index],
+            self.ends[index],
+            self.source,
+            self.literals.get(index)
+        )
+
+    def cursor(self):
+        return TokenCursor(self)
+
+class TokenCursor:
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.index = 0
+        self.length = len(buffer.kinds)
+        self.error = buffer.error
+        self.end_token = None
+
+    def peek(self, offset=0):
+        index = self.index + offset
+        if index < self.length:
+            return self.buffer.token(index)
+        return self.final_token()
+
+    def next(self):
+        index = self.index
+        if index < self.length:
+            self.index = index + 1
+            return self.buffer.token(index)
+        return self.final_token()
+
+    def final_token(self):
+        if self.end_token == None:
+            # a lexer error ends the buffer where it was found
+            if self.error:
+                self.end_token = Token(Token.EOL, pos_start=self.error.pos_start)
+            else:
+                self.end_token = self.buffer.token(self.length - 1)
+        return self.end_token
+
@@ -0,0 +1,45 @@
+from collections import deque
+
+from programming_language.lexical.token import Token
+
+class TokenStream:
+
+    def __init__(self, lexer):
+        self.lexer = lexer
+        self.tokens = lexer.iter_tokens()
+        self.buffer = deque()
+        self.last_token = None
+        self.end_token = None
+        self.error = None
+
+    def peek(self, offset=0):
+        while len(self.buffer) <= offset:
+            token = next(self.tokens, None)
+            if token == None:
+                return self.final_token()
+            self.buffer.append(token)
+            self.last_token = token
+        return self.buffer[offset]
+
+    def next(self):
+        token = self.peek()
+        if self.buffer:
+            self.buffer.popleft()
+        return token
+
+    def finish(self):
+        # lexes the rest of the source, a lexer error further on is only found this way
+        self.buffer.extend(self.tokens)
+        if self.buffer:
+            self.last_token = self.buffer[-1]
+        return self.final_token()
+
+    def final_token(self):
+        if self.end_token == None:
+            # a lexer error ends the stream where it was found
+            self.error = self.lexer.error
+            if self.error:
+                self.end_token = Token(Token.EOL, pos_start=self.error.pos_start)
+            else:
+                self.end_token = self.last_token
+        return self.end_token
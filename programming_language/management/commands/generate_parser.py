@@ -0,0 +1,26 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from programming_language.syntax.grammar import Grammar
+
+class Command(BaseCommand):
+    help = 'Generates programming_language/syntax/parse_table.py from grammar.txt'
+
+    def handle(self, *args, **options):
+        with open(os.path.join(settings.BASE_DIR, 'grammar.txt')) as grammar_file:
+            try:
+                grammar = Grammar(grammar_file.read())
+                source = grammar.generate()
+            except ValueError as error:
+                raise CommandError(f'grammar.txt: {error}')
+
+        with open(os.path.join(settings.BASE_DIR, 'programming_language', 'syntax', 'parse_table.py'), 'w') as table_file:
+            table_file.write(source)
+
+        if options['verbosity'] > 1:
+            for name, kind in grammar.conflicts:
+                self.stdout.write(f"'{name}' prefers its earlier alternative on {kind}")
+        self.stdout.write(self.style.SUCCESS('Generated programming_language/syntax/parse_table.py'))
@@ -0,0 +1,43 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from programming_language.semantics.bytecode_compiler import BytecodeCompiler
+from programming_language.semantics.program import Program
+from programming_language.views import compile_source
+
+class Command(BaseCommand):
+    help = 'Runs a CFPL program from a file and prints its OUTPUT'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--inputs', default='', help='comma separated values of the declared variables')
+        parser.add_argument('--engine', default=settings.PROGRAM_ENGINE, choices=Program.ENGINES)
+        parser.add_argument('--disassemble', action='store_true', help='print the bytecode instead of running it')
+
+    def handle(self, *args, **options):
+        try:
+            with open(options['path']) as source_file:
+                source_code = source_file.read()
+        except OSError as error:
+            raise CommandError(error)
+
+        tokens, program, error = compile_source(source_code)
+        if error:
+            raise CommandError(error.message())
+
+        if options['verbosity'] > 1:
+            self.stdout.write(f'Optimizer removed {program.removed_nodes} nodes')
+
+        if options['disassemble']:
+            self.stdout.write(BytecodeCompiler().compile(program.node).disassemble())
+            return
+
+        output, error = program.run(options['inputs'], options['engine'])
+        if options['verbosity'] > 1 and options['engine'] == 'quickening':
+            self.stdout.write(f'Quickened operators hit {program.hits} times and missed {program.misses} times')
+        if error:
+            raise CommandError(error.message())
+
+        if output != None:
+            self.stdout.write(str(output))
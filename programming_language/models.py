@@ -1,3 +1,77 @@
+import gc
+import pickle
+import zlib
+
+from django.db import DatabaseError
+from django.db import IntegrityError
 from django.db import models
+from django.db.models import Sum
+
+class CompiledProgramManager(models.Manager):
+
+    def load(self, source_hash, compiler_version):
+        try:
+            data = self.filter(
+                source_hash=source_hash,
+                compiler_version=compiler_version
+            ).values_list('data', flat=True).first()
+        except DatabaseError:
+            return None
+
+        if data == None: return None
+
+        # a program is many small objects, collecting while they are created only slows loading
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return pickle.loads(zlib.decompress(data))
+        except (pickle.UnpicklingError, zlib.error, AttributeError, ImportError, EOFError):
+            return None
+        finally:
+            if gc_enabled: gc.enable()
+
+    def store(self, source_hash, compiler_version, entry, max_size):
+        try:
+            data = zlib.compress(pickle.dumps(entry, pickle.HIGHEST_PROTOCOL), 1)
+        except RecursionError:
+            # trees nested too deep for pickle are only kept in memory
+            return
+
+        if len(data) > max_size: return
+
+        try:
+            self.create(source_hash=source_hash, compiler_version=compiler_version, data=data, size=len(data))
+            self.evict(max_size)
+        except IntegrityError:
+            # another worker stored the same program first
+            return
+        except DatabaseError:
+            return
+
+    def evict(self, max_size):
+        total_size = self.aggregate(total_size=Sum('size'))['total_size'] or 0
+        if total_size <= max_size: return
+
+        # the oldest programs go first until the cache fits again
+        expired = []
+        for program_id, size in self.order_by('id').values_list('id', 'size'):
+            if total_size <= max_size: break
+            expired.append(program_id)
+            total_size -= size
+
+        self.filter(id__in=expired).delete()
+
+class CompiledProgram(models.Model):
+    source_hash = models.CharField(max_length=64)
+    compiler_version = models.CharField(max_length=32)
+    data = models.BinaryField()
+    size = models.PositiveIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = CompiledProgramManager()
+
+    class Meta:
+        unique_together = ('source_hash', 'compiler_version')
 
-# Create your models here.
+    def __str__(self):
+        return f'{self.source_hash[:12]} ({self.compiler_version}, {self.size} bytes)'
@@ -0,0 +1,63 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+class ProgramCache:
+
+    def __init__(self, capacity, eviction='LRU'):
+        if eviction not in ('LRU', 'FIFO'):
+            raise ValueError(f"Unknown eviction '{eviction}', expected 'LRU' or 'FIFO'")
+        self.capacity = capacity
+        self.eviction = eviction
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, source_code, compile):
+        # cached entries are shared by concurrent requests, their tokens and trees are
+        # never changed after compile returns them, what a Program keeps between runs
+        # (its compiled engines, inline caches and counters) is changed under its own lock
+        source_code = ProgramCache.normalize(source_code)
+        key = hashlib.sha256(source_code.encode()).hexdigest()
+
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry != None:
+                self.hits += 1
+                if self.eviction == 'LRU':
+                    self.entries.move_to_end(key)
+                return entry
+            self.misses += 1
+
+        entry = compile(source_code, key)
+        if self.capacity <= 0:
+            return entry
+
+        with self.lock:
+            self.entries[key] = entry
+            while len(self.entries) > self.capacity:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+        return entry
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self):
+        with self.lock:
+            return {
+                'size': len(self.entries),
+                'capacity': self.capacity,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+    @staticmethod
+    def normalize(source_code):
+        # the lexer reads '\r\n' as one newline, so both spellings share an entry
+        return source_code.replace('\r\n', '\n')
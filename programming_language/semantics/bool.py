@@ -5,6 +5,8 @@ from programming_language.semantics.value import Value
 
 class Bool(Value):
 
+    __slots__ = ('value',)
+
     def __init__(self, value):
         super().__init__()
         self.value = value
@@ -17,23 +19,30 @@ class Bool(Value):
 
     def get_comparison_and(self, other):
         if isinstance(other, Bool):
-            self.value = True if self.value == Token.TRUE else False
-            other.value = True if other.value == Token.TRUE else False
-            return Bool(Token.TRUE if self.value and other.value else Token.FALSE).set_context(self.context), None
+            return self.get_comparison_and_bool(other), None
         else:
             return None, Value.illegal_operation(self, other)
 
+    def get_comparison_and_bool(self, other):
+        return Bool(Token.TRUE if self.value == Token.TRUE and other.value == Token.TRUE else Token.FALSE).set_context(self.context)
+
     def get_comparison_or(self, other):
         if isinstance(other, Bool):
-            self.value = True if self.value == Token.TRUE else False
-            other.value = True if other.value == Token.TRUE else False
-            return Bool(Token.TRUE if self.value or other.value else Token.FALSE).set_context(self.context), None
+            return self.get_comparison_or_bool(other), None
         else:
             return None, Value.illegal_operation(self, other)
 
+    def get_comparison_or_bool(self, other):
+        return Bool(Token.TRUE if self.value == Token.TRUE or other.value == Token.TRUE else Token.FALSE).set_context(self.context)
+
+    def decide_and(self):
+        return None if self.is_true() else Bool(Token.FALSE).set_context(self.context)
+
+    def decide_or(self):
+        return Bool(Token.TRUE).set_context(self.context) if self.is_true() else None
+
     def get_comparison_not(self):
-        self.value = True if self.value == Token.TRUE else False
-        return Bool(Token.TRUE if self.value == False else Token.FALSE).set_context(self.context), None
+        return Bool(Token.FALSE if self.value == Token.TRUE else Token.TRUE).set_context(self.context), None
 
     def copy(self):
         copy = Bool(self.value)
@@ -42,5 +51,4 @@ class Bool(Value):
         return copy
 
     def is_true(self):
-        self.value = True if self.value == Token.TRUE else False
-        return self.value != False
\ No newline at end of file
+        return self.value == Token.TRUE
\ No newline at end of file
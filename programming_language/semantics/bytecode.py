@@ -0,0 +1,110 @@
+from array import array
+
+from programming_language.lexical.token import Token
+from programming_language.lexical.token import TokenKind
+
+NUMBER        = 0
+STRING        = 1
+BOOL          = 2
+LOAD          = 3
+STORE         = 4
+INPUT         = 5
+BINARY        = 6
+NEGATE        = 7
+NOT           = 8
+POP           = 9
+NONE          = 10
+ZERO          = 11
+JUMP          = 12
+JUMP_IF_FALSE = 13
+JUMP_IF_VALUE = 14
+NEW_LIST      = 15
+APPEND        = 16
+MAKE_LIST     = 17
+SAVE          = 18
+REUSE         = 19
+FORGET        = 20
+TYPED         = 21
+DECIDE_AND    = 22
+DECIDE_OR     = 23
+
+class Code:
+
+    def __init__(self):
+        self.ops = array('B')
+        self.args = array('I')
+        # line table, the source position of every instruction for values and errors
+        self.positions = []
+        self.constants = []
+        self.constant_indexes = {}
+        # the name of every slot of the frame the code reads or writes
+        self.names = {}
+        # the read positions of the operands of the operators, only looked up to locate an error
+        self.operand_positions = {}
+
+    def __len__(self):
+        return len(self.ops)
+
+    def emit(self, op, arg=0, pos_start=None):
+        self.ops.append(op)
+        self.args.append(arg)
+        self.positions.append(pos_start)
+        return len(self.ops) - 1
+
+    def patch(self, index, target=None):
+        self.args[index] = len(self.ops) if target == None else target
+
+    def constant(self, value):
+        key = (type(value), value)
+        if key not in self.constant_indexes:
+            self.constant_indexes[key] = len(self.constants)
+            self.constants.append(value)
+        return self.constant_indexes[key]
+
+    def variable(self, slot, name):
+        self.names[slot] = name
+        return slot
+
+    def disassemble(self):
+        lines = []
+
+        for index, (op, arg) in enumerate(zip(self.ops, self.args)):
+            pos_start = self.positions[index]
+            line = f'{pos_start.line + 1:>5}' if pos_start else '     '
+            text = f'{line} {index:>6} {Code.OPCODE_NAMES[op]:<14}'
+
+            if op in (NUMBER, STRING, BOOL):
+                text += f'{arg} ({self.constants[arg]!r})'
+            elif op in (LOAD, STORE):
+                text += f'{arg} ({self.names[arg]})'
+            elif op in (INPUT, SAVE, REUSE, FORGET):
+                text += f'{arg}'
+            elif op == BINARY:
+                text += f'{arg} ({TokenKind.NAMES[Code.BINARY_OPERATORS[arg]]})'
+            elif op == TYPED:
+                text += f'{arg} ({self.constants[arg].__qualname__})'
+            elif op in (JUMP, JUMP_IF_FALSE, JUMP_IF_VALUE, DECIDE_AND, DECIDE_OR):
+                text += f'{arg}'
+            lines.append(text.rstrip())
+
+        return '\n'.join(lines)
+
+
+Code.OPCODE_NAMES = {op: name for name, op in globals().items() if name.isupper() and isinstance(op, int)}
+
+Code.BINARY_OPERATORS = (
+    Token.PLUS,
+    Token.MINUS,
+    Token.MUL,
+    Token.DIV,
+    Token.MOD,
+    Token.CONCAT,
+    Token.EE,
+    Token.NE,
+    Token.LT,
+    Token.GT,
+    Token.LTE,
+    Token.GTE,
+    TokenKind.AND,
+    TokenKind.OR
+)
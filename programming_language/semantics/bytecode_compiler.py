@@ -0,0 +1,197 @@
+from types import GeneratorType
+
+from programming_language.lexical.token import Token
+from programming_language.lexical.token import TokenKind
+from programming_language.semantics.bytecode import APPEND
+from programming_language.semantics.bytecode import BINARY
+from programming_language.semantics.bytecode import BOOL
+from programming_language.semantics.bytecode import Code
+from programming_language.semantics.bytecode import DECIDE_AND
+from programming_language.semantics.bytecode import DECIDE_OR
+from programming_language.semantics.bytecode import FORGET
+from programming_language.semantics.bytecode import INPUT
+from programming_language.semantics.bytecode import JUMP
+from programming_language.semantics.bytecode import JUMP_IF_FALSE
+from programming_language.semantics.bytecode import JUMP_IF_VALUE
+from programming_language.semantics.bytecode import LOAD
+from programming_language.semantics.bytecode import MAKE_LIST
+from programming_language.semantics.bytecode import NEGATE
+from programming_language.semantics.bytecode import NEW_LIST
+from programming_language.semantics.bytecode import NONE
+from programming_language.semantics.bytecode import NOT
+from programming_language.semantics.bytecode import NUMBER
+from programming_language.semantics.bytecode import POP
+from programming_language.semantics.bytecode import REUSE
+from programming_language.semantics.bytecode import SAVE
+from programming_language.semantics.bytecode import STORE
+from programming_language.semantics.bytecode import STRING
+from programming_language.semantics.bytecode import TYPED
+from programming_language.semantics.bytecode import ZERO
+from programming_language.syntax.nodes import BoolNode
+from programming_language.syntax.nodes import NumberNode
+from programming_language.syntax.nodes import StringNode
+from programming_language.syntax.nodes import read_position
+
+class BytecodeCompiler:
+
+    # every node leaves exactly one value on the stack of the VirtualMachine,
+    # the same value the tree-walking Interpreter would return for it
+
+    def compile(self, node):
+        self.code = Code()
+        self.compile_methods = {}
+
+        # like Interpreter.visit, compile methods of nodes with children are generators that
+        # yield the child to emit in place, so nesting does not grow the call stack
+        compiles = []
+        result = self.compile_method(node)(node)
+
+        while True:
+            if type(result) is GeneratorType:
+                compiles.append(result)
+            elif not compiles:
+                return self.code
+
+            try:
+                node = next(compiles[-1])
+            except StopIteration:
+                compiles.pop()
+                result = None
+            else:
+                method = self.compile_methods.get(type(node))
+                if method == None:
+                    method = self.compile_method(node)
+                result = method(node)
+
+    def compile_method(self, node):
+        method = getattr(self, f'compile_{type(node).__name__}', self.no_compile_method)
+        self.compile_methods[type(node)] = method
+        return method
+
+    def no_compile_method(self, node):
+        raise Exception(f'No compile_{type(node).__name__} method defined')
+
+    def compile_NumberNode(self, node):
+        self.code.emit(NUMBER, self.code.constant(node.token.value), node.pos_start)
+
+    def compile_StringNode(self, node):
+        self.code.emit(STRING, self.code.constant(node.token.value), node.pos_start)
+
+    def compile_BoolNode(self, node):
+        self.code.emit(BOOL, self.code.constant(node.token.value), node.pos_start)
+
+    def compile_ListNode(self, node):
+        self.code.emit(NEW_LIST)
+
+        for element_node in node.element_nodes:
+            yield element_node
+            self.code.emit(APPEND)
+
+        self.code.emit(MAKE_LIST, 0, node.pos_start)
+
+    def compile_InputNode(self, node):
+        # INPUT pushes the bound input and skips the declared value that follows it
+        if type(node.value_node) not in (NumberNode, StringNode, BoolNode):
+            raise Exception(f'INPUT cannot skip a {type(node.value_node).__name__}')
+
+        self.code.emit(INPUT, node.slot, node.pos_start)
+        yield node.value_node
+
+    def compile_VarAccessNode(self, node):
+        self.code.emit(LOAD, self.code.variable(node.slot, node.var_name_token.value), node.pos_start)
+
+    def compile_VarAssignNode(self, node):
+        yield node.value_node
+        self.code.emit(STORE, self.code.variable(node.slot, node.var_name_token.value), node.pos_start)
+
+    def compile_BinaryOperatorNode(self, node):
+        yield node.left_node
+        yield node.right_node
+        index = self.code.emit(BINARY, BytecodeCompiler.BINARY_INDEXES[node.operator_token.type], node.pos_start)
+        self.code.operand_positions[index] = (read_position(node.left_node), read_position(node.right_node))
+
+    def compile_TypedBinaryOperatorNode(self, node):
+        # the method of the operand class is kept with the constants
+        yield node.left_node
+        yield node.right_node
+        self.code.emit(TYPED, self.code.constant(node.operation), node.pos_start)
+
+    def compile_AndNode(self, node):
+        return self.compile_logical(node, DECIDE_AND)
+
+    def compile_OrNode(self, node):
+        return self.compile_logical(node, DECIDE_OR)
+
+    def compile_logical(self, node, decide):
+        # DECIDE_AND and DECIDE_OR replace the left operand with the value and jump past
+        # the right operand when the left one decides it
+        yield node.left_node
+        jump = self.code.emit(decide, 0, node.pos_start)
+        yield node.right_node
+        index = self.code.emit(BINARY, BytecodeCompiler.BINARY_INDEXES[node.operator_token.type], node.pos_start)
+        self.code.operand_positions[index] = (read_position(node.left_node), read_position(node.right_node))
+        self.code.patch(jump)
+
+    def compile_UnaryOperatorNode(self, node):
+        yield node.node
+
+        # + leaves its operand as it is
+        if node.operator_token.type != Token.PLUS:
+            index = self.code.emit(BytecodeCompiler.UNARY_OPS[node.operator_token.type], 0, node.pos_start)
+            self.code.operand_positions[index] = (read_position(node.node),)
+
+    def compile_IfNode(self, node):
+        # NONE stands for no true case yet, every true case replaces the value below it
+        self.code.emit(NONE)
+
+        for condition, expr in node.cases:
+            yield condition
+            jump = self.code.emit(JUMP_IF_FALSE, 0, condition.pos_start)
+            self.code.emit(POP)
+            yield expr
+            self.code.patch(jump)
+
+        jump = self.code.emit(JUMP_IF_VALUE)
+        self.code.emit(POP)
+        if node.else_case:
+            yield node.else_case
+        else:
+            self.code.emit(ZERO)
+        self.code.patch(jump)
+
+    def compile_WhileNode(self, node):
+        for slot in node.saved_slots:
+            self.code.emit(FORGET, slot)
+
+        self.code.emit(NEW_LIST)
+        start = len(self.code)
+        yield node.condition_node
+        jump = self.code.emit(JUMP_IF_FALSE, 0, node.pos_start)
+
+        for expr in node.body_node:
+            yield expr
+            self.code.emit(APPEND)
+
+        self.code.emit(JUMP, start)
+        self.code.patch(jump)
+        self.code.emit(MAKE_LIST, 0, node.pos_start)
+
+    def compile_SaveNode(self, node):
+        yield node.node
+        self.code.emit(SAVE, node.slot)
+
+    def compile_ReuseNode(self, node):
+        # REUSE pushes the saved value and goes on to the JUMP, otherwise it skips the JUMP
+        self.code.emit(REUSE, node.slot, node.pos_start)
+        jump = self.code.emit(JUMP)
+        yield node.node
+        self.code.emit(SAVE, node.slot)
+        self.code.patch(jump)
+
+
+BytecodeCompiler.BINARY_INDEXES = {kind: index for index, kind in enumerate(Code.BINARY_OPERATORS)}
+
+BytecodeCompiler.UNARY_OPS = {
+    Token.MINUS: NEGATE,
+    TokenKind.NOT: NOT
+}
@@ -0,0 +1,275 @@
+from programming_language.error_handler.error import RuntimeError
+from programming_language.lexical.token import Token
+from programming_language.semantics.bool import Bool
+from programming_language.semantics.list import List
+from programming_language.semantics.number import Number
+from programming_language.semantics.operations import BINARY_OPERATIONS
+from programming_language.semantics.operations import DECIDE_OPERATIONS
+from programming_language.semantics.operations import UNARY_OPERATIONS
+from programming_language.semantics.string import String
+from programming_language.syntax.nodes import read_position
+
+class ClosureCompiler:
+
+    # every node is compiled once into a closure that takes the context and
+    # returns (value, error) like the tree-walking Interpreter would
+
+    def compile(self, node):
+        method_name = f'compile_{type(node).__name__}'
+        method = getattr(self, method_name, self.no_compile_method)
+        return method(node)
+
+    def no_compile_method(self, node):
+        raise Exception(f'No compile_{type(node).__name__} method defined')
+
+    def compile_NumberNode(self, node):
+        value = node.token.value
+        pos_start = node.pos_start
+
+        def number(context):
+            return Number(value).set_context(context).set_pos(pos_start), None
+
+        return number
+
+    def compile_StringNode(self, node):
+        value = node.token.value
+        pos_start = node.pos_start
+
+        def string(context):
+            return String(value).set_context(context).set_pos(pos_start), None
+
+        return string
+
+    def compile_BoolNode(self, node):
+        value = node.token.value
+        pos_start = node.pos_start
+
+        def bool_(context):
+            return Bool(value).set_context(context).set_pos(pos_start), None
+
+        return bool_
+
+    def compile_ListNode(self, node):
+        element_codes = [self.compile(element_node) for element_node in node.element_nodes]
+        pos_start = node.pos_start
+
+        def list_(context):
+            elements = []
+
+            for element_code in element_codes:
+                element, error = element_code(context)
+                if error: return None, error
+                elements.append(element)
+
+            return List(elements).set_context(context).set_pos(pos_start), None
+
+        return list_
+
+    def compile_InputNode(self, node):
+        slot = node.slot
+        value_code = self.compile(node.value_node)
+
+        def input_(context):
+            if context.inputs and context.inputs[slot] != None:
+                return self.compile(context.inputs[slot])(context)
+            return value_code(context)
+
+        return input_
+
+    def compile_VarAccessNode(self, node):
+        var_name = node.var_name_token.value
+        slot = node.slot
+        pos_start = node.pos_start
+
+        def var_access(context):
+            value = context.frame[slot]
+
+            if value is None:
+                return None, RuntimeError(
+                    pos_start,
+                    f"'{var_name}' is not defined",
+                    context
+                )
+
+            return value, None
+
+        return var_access
+
+    def compile_VarAssignNode(self, node):
+        slot = node.slot
+        value_code = self.compile(node.value_node)
+
+        def var_assign(context):
+            value, error = value_code(context)
+            if error: return None, error
+
+            context.frame[slot] = value
+            return value, None
+
+        return var_assign
+
+    def compile_BinaryOperatorNode(self, node):
+        left_code = self.compile(node.left_node)
+        right_code = self.compile(node.right_node)
+        operation = BINARY_OPERATIONS[node.operator_token.type]
+        left_read = read_position(node.left_node)
+        right_read = read_position(node.right_node)
+        pos_start = node.pos_start
+
+        def binary_operator(context):
+            left, error = left_code(context)
+            if error: return None, error
+            right, error = right_code(context)
+            if error: return None, error
+
+            answer, error = operation(left, right)
+            if error: return None, right.locate(left.locate(error, left_read), right_read)
+            return answer.set_pos(pos_start), None
+
+        return binary_operator
+
+    def compile_TypedBinaryOperatorNode(self, node):
+        left_code = self.compile(node.left_node)
+        right_code = self.compile(node.right_node)
+        operation = node.operation
+        pos_start = node.pos_start
+
+        def typed_binary_operator(context):
+            left, error = left_code(context)
+            if error: return None, error
+            right, error = right_code(context)
+            if error: return None, error
+
+            return operation(left, right).set_pos(pos_start), None
+
+        return typed_binary_operator
+
+    def compile_AndNode(self, node):
+        return self.compile_logical(node)
+
+    def compile_OrNode(self, node):
+        return self.compile_logical(node)
+
+    def compile_logical(self, node):
+        # the right operand is only evaluated when the left one does not decide the value
+        left_code = self.compile(node.left_node)
+        right_code = self.compile(node.right_node)
+        decide = DECIDE_OPERATIONS[node.operator_token.type]
+        operation = BINARY_OPERATIONS[node.operator_token.type]
+        left_read = read_position(node.left_node)
+        right_read = read_position(node.right_node)
+        pos_start = node.pos_start
+
+        def logical_operator(context):
+            left, error = left_code(context)
+            if error: return None, error
+
+            answer = decide(left)
+            if answer is None:
+                right, error = right_code(context)
+                if error: return None, error
+
+                answer, error = operation(left, right)
+                if error: return None, right.locate(left.locate(error, left_read), right_read)
+            return answer.set_pos(pos_start), None
+
+        return logical_operator
+
+    def compile_UnaryOperatorNode(self, node):
+        code = self.compile(node.node)
+        operation = UNARY_OPERATIONS[node.operator_token.type]
+        operand_read = read_position(node.node)
+        pos_start = node.pos_start
+
+        # + gives its operand as it is
+        if node.operator_token.type == Token.PLUS:
+            return code
+
+        def unary_operator(context):
+            number, error = code(context)
+            if error: return None, error
+
+            answer, error = operation(number)
+            if error: return None, number.locate(error, operand_read)
+            return answer.set_pos(pos_start), None
+
+        return unary_operator
+
+    def compile_IfNode(self, node):
+        case_codes = [(self.compile(condition), self.compile(expr)) for condition, expr in node.cases]
+        else_code = self.compile(node.else_case) if node.else_case else None
+
+        def if_(context):
+            is_condition = False
+            expr_value = None
+
+            for condition_code, expr_code in case_codes:
+                condition_value, error = condition_code(context)
+                if error: return None, error
+
+                if condition_value.is_true():
+                    expr_value, error = expr_code(context)
+                    if error: return None, error
+                    is_condition = True
+
+            if is_condition:
+                return expr_value, None
+
+            if else_code:
+                return else_code(context)
+
+            return Number(0).set_context(context), None
+
+        return if_
+
+    def compile_WhileNode(self, node):
+        condition_code = self.compile(node.condition_node)
+        body_codes = [self.compile(expr) for expr in node.body_node]
+        saved_slots = node.saved_slots
+        pos_start = node.pos_start
+
+        def while_(context):
+            elements = []
+
+            for slot in saved_slots:
+                context.saved.pop(slot, None)
+
+            while True:
+                condition, error = condition_code(context)
+                if error: return None, error
+
+                if not condition.is_true(): break
+
+                for body_code in body_codes:
+                    expr_value, error = body_code(context)
+                    if error: return None, error
+                    elements.append(expr_value)
+
+            return List(elements).set_context(context).set_pos(pos_start), None
+
+        return while_
+
+    def compile_SaveNode(self, node):
+        code = self.compile(node.node)
+        slot = node.slot
+
+        def save(context):
+            value, error = code(context)
+            if error: return None, error
+
+            context.saved[slot] = value
+            return value, None
+
+        return save
+
+    def compile_ReuseNode(self, node):
+        save = self.compile_SaveNode(node)
+        slot = node.slot
+
+        def reuse(context):
+            value = context.saved.get(slot)
+            if value == None:
+                return save(context)
+            return value, None
+
+        return reuse
@@ -4,4 +4,7 @@ class Context:
         self.display_name = display_name
         self.parent = parent
         self.parent_entry_pos = parent_entry_pos
-        self.symbol_table = None
\ No newline at end of file
+        self.symbol_table = None
+        self.frame = None
+        self.inputs = None
+        self.saved = {}
\ No newline at end of file
@@ -1,71 +1,126 @@
+from types import GeneratorType
+
 from programming_language.error_handler.error import RuntimeError
+from programming_language.error_handler.error import RuntimeException
 from programming_language.lexical.token import Token
+from programming_language.lexical.token import TokenKind
 from programming_language.semantics.bool import Bool
 from programming_language.semantics.list import List
 from programming_language.semantics.number import Number
+from programming_language.semantics.operations import BINARY_OPERATIONS
 from programming_language.semantics.string import String
 from programming_language.semantics.runtime_result import RuntimeResult
+from programming_language.semantics.type_checker import TypeChecker
+from programming_language.syntax.nodes import BinaryOperatorNode
+from programming_language.syntax.nodes import UnaryOperatorNode
+from programming_language.syntax.nodes import read_position
 
 class Interpreter:
 
+    def __init__(self, inline_caches=None):
+        self.visit_methods = {}
+        self.inline_caches = inline_caches
+        self.hits = 0
+        self.misses = 0
+
+        # quickening, operators remember the classes of their first operands
+        if inline_caches != None:
+            self.visit_methods[BinaryOperatorNode] = self.quicken_BinaryOperatorNode
+            self.visit_methods[UnaryOperatorNode] = self.quicken_UnaryOperatorNode
+
     def visit(self, node, context):
-        method_name = f'visit_{type(node).__name__}'
-        method = getattr(self, method_name, self.no_visit_method)
-        return method(node, context)
+        # the visit methods give the value of their node and raise RuntimeException for an
+        # error, which ends the whole visit here
+        try:
+            return RuntimeResult().success(self.evaluate(node, context))
+        except RuntimeException as exception:
+            return RuntimeResult().failure(exception.error)
+
+    def evaluate(self, node, context):
+        # visit methods of nodes with children are generators that yield the child to
+        # evaluate and receive its value, so nesting grows this list instead of the call stack
+        visit_methods = self.visit_methods
+        visits = []
+        result = self.visit_method(node)(node, context)
+
+        while True:
+            if type(result) is GeneratorType:
+                visits.append(result)
+                result = None
+            elif not visits:
+                return result
+
+            try:
+                node = visits[-1].send(result)
+            except StopIteration as stop:
+                visits.pop()
+                result = stop.value
+            else:
+                method = visit_methods.get(type(node))
+                if method == None:
+                    method = self.visit_method(node)
+                result = method(node, context)
+
+    def visit_method(self, node):
+        method = getattr(self, f'visit_{type(node).__name__}', self.no_visit_method)
+        self.visit_methods[type(node)] = method
+        return method
 
     def no_visit_method(self, node, context):
         raise Exception(f'No visit_{type(node).__name__} method defined')
 
     def visit_NumberNode(self, node, context):
-        return RuntimeResult().success(Number(node.token.value).set_context(context).set_pos(node.pos_start))
+        return Number(node.token.value).set_context(context).set_pos(node.pos_start)
 
     def visit_StringNode(self, node, context):
-        return RuntimeResult().success(String(node.token.value).set_context(context).set_pos(node.pos_start))
+        return String(node.token.value).set_context(context).set_pos(node.pos_start)
 
     def visit_BoolNode(self, node, context):
-        return RuntimeResult().success(Bool(node.token.value).set_context(context).set_pos(node.pos_start))
+        return Bool(node.token.value).set_context(context).set_pos(node.pos_start)
 
     def visit_ListNode(self, node, context):
-        result = RuntimeResult()
         elements = []
 
         for element_node in node.element_nodes:
-            elements.append(result.register(self.visit(element_node, context)))
-            if result.error: return result
+            elements.append((yield element_node))
+
+        return List(elements).set_context(context).set_pos(node.pos_start)
 
-        return result.success(List(elements).set_context(context).set_pos(node.pos_start))
+    def visit_InputNode(self, node, context):
+        if context.inputs and context.inputs[node.slot] != None:
+            return (yield context.inputs[node.slot])
+        return (yield node.value_node)
 
     def visit_VarAccessNode(self, node, context):
-        result = RuntimeResult()
-        var_name = node.var_name_token.value
-        value = context.symbol_table.get(var_name)
+        value = context.frame[node.slot]
 
-        if not value:
-            return result.failure(RuntimeError(
+        if value is None:
+            raise RuntimeException(RuntimeError(
                 node.pos_start,
-                f"'{var_name}' is not defined",
+                f"'{node.var_name_token.value}' is not defined",
                 context
             ))
 
-        value = value.copy().set_pos(node.pos_start).set_context(context)
-        return result.success(value)
+        return value
 
     def visit_VarAssignNode(self, node, context):
-        result = RuntimeResult()
-        var_name = node.var_name_token.value
-        value = result.register(self.visit(node.value_node, context))
-        if result.error: return result
+        value = yield node.value_node
 
-        context.symbol_table.set(var_name, value)
-        return result.success(value)
+        context.frame[node.slot] = value
+        return value
 
     def visit_BinaryOperatorNode(self, node, context):
-        result = RuntimeResult()
-        left = result.register(self.visit(node.left_node, context))
-        if result.error: return result
-        right = result.register(self.visit(node.right_node, context))
-        if result.error: return result
+        left = yield node.left_node
+        right = yield node.right_node
+
+        answer, error = self.binary_operation(node, left, right)
+        if error:
+            raise RuntimeException(right.locate(left.locate(error, read_position(node.left_node)), read_position(node.right_node)))
+        else:
+            return answer.set_pos(node.pos_start)
 
+    def binary_operation(self, node, left, right):
+        answer = None
         error = None
 
         if node.operator_token.type == Token.PLUS:
@@ -92,73 +147,189 @@ class Interpreter:
             answer, error = left.get_comparison_lte(right)
         elif node.operator_token.type == Token.GTE:
             answer, error = left.get_comparison_gte(right)
-        elif node.operator_token.matches(Token.KEYWORD, Token.AND):
+        elif node.operator_token.type == TokenKind.AND:
             answer, error = left.get_comparison_and(right)
-        elif node.operator_token.matches(Token.KEYWORD, Token.OR):
+        elif node.operator_token.type == TokenKind.OR:
             answer, error = left.get_comparison_or(right)
 
+        return answer, error
+
+    def quicken_BinaryOperatorNode(self, node, context):
+        # the first run picks the method for the classes of the operands, later runs call it
+        # straight away while the classes stay the same and take the generic path otherwise
+        left = yield node.left_node
+        right = yield node.right_node
+
+        # an entry that found no method is looked up again, the classes of a variable can change
+        # between visits and the lookup costs no more than the generic path it would take anyway
+        cache = self.inline_caches.get(id(node))
+        if cache == None or cache[2] == None:
+            operation = Interpreter.QUICK_BINARY_OPERATIONS.get((type(left), node.operator_token.type, type(right)))
+            cache = self.inline_caches[id(node)] = (type(left), type(right), operation)
+
+        if cache[2] != None:
+            if type(left) is cache[0] and type(right) is cache[1]:
+                answer = cache[2](left, right)
+                if answer is not None:
+                    self.hits += 1
+                    return answer.set_pos(node.pos_start)
+            self.misses += 1
+
+        answer, error = self.binary_operation(node, left, right)
         if error:
-            return result.failure(error)
+            raise RuntimeException(right.locate(left.locate(error, read_position(node.left_node)), read_position(node.right_node)))
         else:
-            return result.success(answer.set_pos(node.pos_start))
+            return answer.set_pos(node.pos_start)
+
+    def visit_TypedBinaryOperatorNode(self, node, context):
+        left = yield node.left_node
+        right = yield node.right_node
+
+        return node.operation(left, right).set_pos(node.pos_start)
+
+    def visit_AndNode(self, node, context):
+        # the right operand is only evaluated when the left one does not decide the value
+        left = yield node.left_node
+        answer = left.decide_and()
+        if answer is None:
+            answer = yield from self.logical_operation(node, left)
+        return answer.set_pos(node.pos_start)
+
+    def visit_OrNode(self, node, context):
+        left = yield node.left_node
+        answer = left.decide_or()
+        if answer is None:
+            answer = yield from self.logical_operation(node, left)
+        return answer.set_pos(node.pos_start)
+
+    def logical_operation(self, node, left):
+        right = yield node.right_node
+
+        answer, error = self.binary_operation(node, left, right)
+        if error:
+            raise RuntimeException(right.locate(left.locate(error, read_position(node.left_node)), read_position(node.right_node)))
+        return answer
 
     def visit_UnaryOperatorNode(self, node, context):
-        result = RuntimeResult()
-        number = result.register(self.visit(node.node, context))
-        if result.error: return result
+        number = yield node.node
+
+        # + gives its operand as it is
+        if node.operator_token.type == Token.PLUS:
+            return number
+
+        answer, error = self.unary_operation(node, number)
+        if error:
+            raise RuntimeException(number.locate(error, read_position(node.node)))
+        else:
+            return answer.set_pos(node.pos_start)
 
+    def unary_operation(self, node, number):
+        answer = None
         error = None
 
         if node.operator_token.type == Token.MINUS:
             answer, error = number.multiply(Number(-1))
-        elif node.operator_token.matches(Token.KEYWORD, Token.NOT):
+        elif node.operator_token.type == TokenKind.NOT:
             answer, error = number.get_comparison_not()
 
+        return answer, error
+
+    def quicken_UnaryOperatorNode(self, node, context):
+        number = yield node.node
+
+        # + gives its operand as it is
+        if node.operator_token.type == Token.PLUS:
+            return number
+
+        cache = self.inline_caches.get(id(node))
+        if cache == None or cache[1] == None:
+            operation = Interpreter.QUICK_UNARY_OPERATIONS.get((node.operator_token.type, type(number)))
+            cache = self.inline_caches[id(node)] = (type(number), operation)
+
+        if cache[1] != None:
+            if type(number) is cache[0]:
+                answer = cache[1](number)
+                if answer is not None:
+                    self.hits += 1
+                    return answer.set_pos(node.pos_start)
+            self.misses += 1
+
+        answer, error = self.unary_operation(node, number)
         if error:
-            return result.failure(error)
+            raise RuntimeException(number.locate(error, read_position(node.node)))
         else:
-            return result.success(answer.set_pos(node.pos_start))
+            return answer.set_pos(node.pos_start)
 
     def visit_IfNode(self, node, context):
-        result = RuntimeResult()
         is_condition = False
         expr_value = None
         
         for condition, expr in node.cases:
-            condition_value = result.register(self.visit(condition, context))
-            if result.error: return result
+            condition_value = yield condition
             
             if condition_value.is_true():
-                expr_value = result.register(self.visit(expr, context))
-                if result.error: return result
+                expr_value = yield expr
                 if not is_condition:
                     is_condition = True
 
         if is_condition:
-            return result.success(expr_value)
+            return expr_value
 
         if node.else_case:
-            expr_value = result.register(self.visit(node.else_case, context))
-            if result.error: return result
-            return result.success(expr_value)
+            return (yield node.else_case)
 
-        return result.success(Number(0))
+        return Number(0).set_context(context)
 
     def visit_WhileNode(self, node, context):
-        result = RuntimeResult()
         elements = []        
 
+        for slot in node.saved_slots:
+            context.saved.pop(slot, None)
+
         while True:
-            condition = result.register(self.visit(node.condition_node, context))
-            if result.error: return result
+            condition = yield node.condition_node
 
             if not condition.is_true(): break
 
             for expr in node.body_node:
-                expr_value = result.register(self.visit(expr, context))
-                if result.error: return result
+                expr_value = yield expr
                 elements.append(expr_value)
 
-        return result.success(
-            List(elements).set_context(context).set_pos(node.pos_start)
+        return List(elements).set_context(context).set_pos(node.pos_start)
+
+    def visit_SaveNode(self, node, context):
+        value = yield node.node
+
+        context.saved[node.slot] = value
+        return value
+
+    def visit_ReuseNode(self, node, context):
+        value = context.saved.get(node.slot)
+        if value == None:
+            return self.visit_SaveNode(node, context)
+
+        return value
+
+
+# the operand classes of the TypeChecker that are not classes of values never come up here,
+# a String can be the & written as a value, which Number.concat does not take
+Interpreter.QUICK_BINARY_OPERATIONS = {
+    key: operation for key, operation in TypeChecker.OPERATIONS.items()
+    if key[0] not in TypeChecker.TEXT_NUMBERS and key[2] not in TypeChecker.TEXT_NUMBERS
+}
+del Interpreter.QUICK_BINARY_OPERATIONS[(Number, Token.CONCAT, String)]
+
+# a Number can hold the text of a comparison or an &, so arithmetic and ordering on numbers
+# keep the checks of the generic methods, an operation that gives no answer takes the
+# generic path, which reports the error
+for operator in TypeChecker.ARITHMETIC_OPERATORS + TypeChecker.ORDER_OPERATORS:
+    if (Number, operator, Number) in Interpreter.QUICK_BINARY_OPERATIONS:
+        Interpreter.QUICK_BINARY_OPERATIONS[(Number, operator, Number)] = (
+            lambda left, right, operation=BINARY_OPERATIONS[operator]: operation(left, right)[0]
         )
+
+Interpreter.QUICK_UNARY_OPERATIONS = {
+    (Token.MINUS, Number): lambda number: number.multiply(Number(-1))[0],
+    (TokenKind.NOT, Number): lambda number: number.get_comparison_not()[0],
+    (TokenKind.NOT, Bool): lambda value: value.get_comparison_not()[0]
+}
@@ -4,6 +4,8 @@ from programming_language.semantics.value import Value
 
 class List(Value):
 
+    __slots__ = ('elements',)
+
     def __init__(self, elements):
         super().__init__()
         self.elements = elements
@@ -45,7 +47,8 @@ class List(Value):
     def divide(self, other):
         if isinstance(other, Number):
             try:
-                return self.elements[other.value], None
+                # a copy, the element takes the position of the operator that got it
+                return self.elements[other.value].copy(), None
             except:
                 return None, RuntimeError(
                     other.pos_start,
@@ -0,0 +1,283 @@
+from programming_language.lexical.token import Token
+from programming_language.lexical.token import TokenKind
+from programming_language.semantics.native_types import NativeTypes
+from programming_language.semantics.python_compiler import PythonCompiler
+from programming_language.syntax.nodes import BoolNode
+
+class NativeCompiler(PythonCompiler):
+
+    # like PythonCompiler, but the generated function holds INT and FLOAT as int and float,
+    # BOOL as True and False and CHAR as str, the position of an error is taken from the
+    # node that fails and the variables are made into values when they go back to the frame
+
+    def compile(self, node):
+        # None when a value the program reads can be of more than one kind
+        self.native_types = NativeTypes()
+        if not self.native_types.native(node):
+            return None
+        return super().compile(node)
+
+    def generate(self, node):
+        self.source = []
+        self.lines = []
+        self.line = 1
+        self.indent = 1
+        self.temps = 0
+        self.constants = []
+        self.positions = []
+        self.position_indexes = {}
+        self.slots = set()
+        self.slot_kinds = {}
+        self.compile_methods = {}
+        self.root = node
+
+        self.generate_node(node)
+        self.emit('')
+        for slot in sorted(self.slot_kinds):
+            self.emit(f'if v{slot} is not None: frame[{slot}] = {self.box(self.slot_kinds[slot], f"v{slot}")}')
+        # the value of the program is never read, the statements do not keep theirs
+        self.emit('return None, None')
+
+        header = ['def program(context):', '    inputs = context.inputs', '    saved = context.saved', '    frame = context.frame']
+        header.extend(f'    v{slot} = None' for slot in sorted(self.slots))
+        source = header + self.source
+        lines = [1] * len(header) + self.lines
+        return '\n'.join(source) + '\n', lines
+
+    def kind(self, node):
+        return self.native_types.types[id(node)]
+
+    def used(self, node):
+        return id(node) not in self.native_types.unused
+
+    def follow(self, pos_start):
+        # keeps the line table current without keeping the position
+        if pos_start != None:
+            self.line = pos_start.line + 1
+
+    def box(self, kind, value):
+        if kind in (NativeTypes.NUMBER, NativeTypes.NUMBER_TEXT):
+            return f'Number({value}).set_context(context)'
+        if kind == NativeTypes.NUMBER_BOOL:
+            return f'Number({self.text(kind, value)}).set_context(context)'
+        if kind == NativeTypes.CHAR:
+            return f'String({value}).set_context(context)'
+        if kind == NativeTypes.BOOL:
+            return f'Bool({self.text(kind, value)}).set_context(context)'
+        return value
+
+    def truth(self, kind, value):
+        # what is_true gives for the value, a Number is only true when it holds TRUE
+        if kind in (NativeTypes.NUMBER_BOOL, NativeTypes.BOOL):
+            return value
+        if kind == NativeTypes.NUMBER_TEXT:
+            return f'({value} == {Token.TRUE!r})'
+        if kind == NativeTypes.CHAR:
+            return f'(len({value}) > 0)'
+        return 'False'
+
+    def text(self, kind, value):
+        # what str gives for the value
+        if kind == NativeTypes.NUMBER:
+            return f'str({value})'
+        if kind in (NativeTypes.NUMBER_BOOL, NativeTypes.BOOL):
+            return f'({Token.TRUE!r} if {value} else {Token.FALSE!r})'
+        return value
+
+    def generate_literal(self, node):
+        self.follow(node.pos_start)
+        if type(node) is BoolNode:
+            return repr(node.token.value == Token.TRUE)
+        return self.constant(node.token.value)
+
+    def generate_NumberNode(self, node):
+        return self.generate_literal(node)
+
+    def generate_StringNode(self, node):
+        return self.generate_literal(node)
+
+    def generate_BoolNode(self, node):
+        return self.generate_literal(node)
+
+    def generate_ListNode(self, node):
+        if node is self.root or not self.used(node):
+            for element_node in node.element_nodes:
+                yield element_node
+            return 'None'
+
+        elements = self.temp()
+        self.emit(f'{elements} = []')
+
+        for element_node in node.element_nodes:
+            element = yield element_node
+            self.emit(f'{elements}.append({self.box(self.kind(element_node), element)})')
+
+        position = self.position(node.pos_start)
+        value = self.temp()
+        self.emit(f'{value} = List({elements}).set_context(context).set_pos({position})')
+        return value
+
+    def generate_InputNode(self, node):
+        if type(node.value_node) not in PythonCompiler.INPUT_VALUES:
+            raise Exception(f'INPUT cannot default to a {type(node.value_node).__name__}')
+
+        self.follow(node.pos_start)
+        value = self.temp()
+        self.emit(f'if inputs and inputs[{node.slot}] is not None:')
+        if type(node.value_node) is BoolNode:
+            self.emit(f'    {value} = inputs[{node.slot}].token.value == {Token.TRUE!r}')
+        else:
+            self.emit(f'    {value} = inputs[{node.slot}].token.value')
+        self.emit('else:')
+        self.indent += 1
+        default = yield node.value_node
+        self.emit(f'{value} = {default}')
+        self.indent -= 1
+        return value
+
+    def generate_VarAssignNode(self, node):
+        value = yield node.value_node
+        self.follow(node.pos_start)
+        self.slot_kinds[node.slot] = self.native_types.variables[node.var_name_token.value]
+        self.emit(f'{self.slot(node.slot)} = {value}')
+        return value
+
+    def generate_BinaryOperatorNode(self, node):
+        left = yield node.left_node
+        right = yield node.right_node
+        self.follow(node.pos_start)
+
+        kind = self.kind(node)
+        if kind == None:
+            # an operand never gives a value, this is never reached
+            return 'None'
+
+        operator = node.operator_token.type
+        left_kind = self.kind(node.left_node)
+        right_kind = self.kind(node.right_node)
+        value = self.temp()
+
+        if operator == Token.DIV:
+            position = self.position(self.native_types.division_position(node))
+            self.emit(f"if {right} == 0: return None, RuntimeError({position}, 'Division by zero', context)")
+
+        if operator in NativeCompiler.OPERATORS:
+            self.emit(f'{value} = {left} {NativeCompiler.OPERATORS[operator]} {right}')
+        elif operator == Token.CONCAT:
+            self.emit(f'{value} = {self.text(left_kind, left)} + {self.text(right_kind, right)}')
+        else:
+            logic = 'and' if operator == TokenKind.AND else 'or'
+            self.emit(f'{value} = {self.truth(left_kind, left)} {logic} {self.truth(right_kind, right)}')
+        return value
+
+    def generate_TypedBinaryOperatorNode(self, node):
+        return self.generate_BinaryOperatorNode(node)
+
+    def generate_AndNode(self, node):
+        return self.generate_logical(node)
+
+    def generate_OrNode(self, node):
+        return self.generate_logical(node)
+
+    def generate_logical(self, node):
+        # the right operand is only evaluated when the truth of the left one leaves the value open
+        left = yield node.left_node
+        value = self.temp()
+        self.emit(f'{value} = {self.truth(self.kind(node.left_node), left)}')
+        self.emit(f'if {value}:' if node.operator_token.type == TokenKind.AND else f'if not {value}:')
+        self.indent += 1
+        right = yield node.right_node
+        self.emit(f'{value} = {self.truth(self.kind(node.right_node), right)}')
+        self.indent -= 1
+        self.follow(node.pos_start)
+        return value
+
+    def generate_UnaryOperatorNode(self, node):
+        operand = yield node.node
+        self.follow(node.pos_start)
+
+        kind = self.kind(node)
+        if kind == None or node.operator_token.type == Token.PLUS:
+            return operand if kind != None else 'None'
+
+        # NOT compares the truth of a number with FALSE, which it never equals
+        if kind == NativeTypes.NUMBER_BOOL:
+            return 'False'
+
+        value = self.temp()
+        if node.operator_token.type == Token.MINUS:
+            self.emit(f'{value} = {operand} * -1')
+        else:
+            self.emit(f'{value} = not {operand}')
+        return value
+
+    def generate_IfNode(self, node):
+        # an IF whose value nobody reads keeps True for a case that was true
+        used = self.used(node)
+        value = self.temp()
+        self.emit(f'{value} = None')
+
+        for condition, expr in node.cases:
+            condition_value = yield condition
+            self.emit(f'if {self.truth(self.kind(condition), condition_value)}:')
+            self.indent += 1
+            expr_value = yield expr
+            self.emit(f'{value} = {expr_value if used else True}')
+            self.indent -= 1
+
+        self.follow(node.pos_start)
+        if used or node.else_case:
+            self.emit(f'if {value} is None:')
+            self.indent += 1
+            if node.else_case:
+                else_value = yield node.else_case
+                self.emit(f'{value} = {else_value if used else True}')
+            else:
+                self.emit(f'{value} = 0')
+            self.indent -= 1
+        return value if used else 'None'
+
+    def generate_WhileNode(self, node):
+        # a WHILE whose value nobody reads does not keep the values of its body
+        used = self.used(node)
+        self.follow(node.pos_start)
+        for slot in node.saved_slots:
+            self.emit(f'saved.pop({slot}, None)')
+
+        if used:
+            elements = self.temp()
+            self.emit(f'{elements} = []')
+        self.emit('while True:')
+        self.indent += 1
+
+        condition = yield node.condition_node
+        self.emit(f'if not {self.truth(self.kind(node.condition_node), condition)}: break')
+
+        for expr in node.body_node:
+            expr_value = yield expr
+            if used:
+                self.emit(f'{elements}.append({self.box(self.kind(expr), expr_value)})')
+
+        self.indent -= 1
+        if not used:
+            return 'None'
+
+        position = self.position(node.pos_start)
+        value = self.temp()
+        self.emit(f'{value} = List({elements}).set_context(context).set_pos({position})')
+        return value
+
+
+NativeCompiler.OPERATORS = {
+    Token.PLUS: '+',
+    Token.MINUS: '-',
+    Token.MUL: '*',
+    Token.DIV: '/',
+    Token.MOD: '%',
+    Token.EE: '==',
+    Token.NE: '!=',
+    Token.LT: '<',
+    Token.GT: '>',
+    Token.LTE: '<=',
+    Token.GTE: '>='
+}
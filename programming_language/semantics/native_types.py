@@ -0,0 +1,215 @@
+from programming_language.lexical.token import Token
+from programming_language.lexical.token import TokenKind
+from programming_language.semantics.type_checker import TypeChecker
+from programming_language.semantics.value import Value
+from programming_language.syntax.nodes import BinaryOperatorNode
+from programming_language.syntax.nodes import IfNode
+from programming_language.syntax.nodes import InputNode
+from programming_language.syntax.nodes import ListNode
+from programming_language.syntax.nodes import READ_NODES
+from programming_language.syntax.nodes import ReuseNode
+from programming_language.syntax.nodes import SaveNode
+from programming_language.syntax.nodes import UnaryOperatorNode
+from programming_language.syntax.nodes import VarAccessNode
+from programming_language.syntax.nodes import VarAssignNode
+from programming_language.syntax.nodes import WhileNode
+
+class NativeTypes(TypeChecker):
+
+    # works out how the NativeCompiler holds the value of every node, a NUMBER is an int
+    # or a float, a NUMBER_TEXT (a Number made by &) and a CHAR a str, a NUMBER_BOOL (a Number
+    # made by a comparison) and a BOOL a bool and a LIST the List itself
+
+    def native(self, node):
+        # a program runs natively when every value that is read has one kind, and every
+        # division by zero can be reported where the value methods would report it
+        self.infer(node)
+        self.unused = self.find_unused(node)
+        self.infer_sources()
+
+        for child in self.nodes:
+            if self.types[id(child)] is Value and not (type(child) is IfNode and id(child) in self.unused):
+                return False
+            if type(child) is BinaryOperatorNode and child.operator_token.type == Token.DIV:
+                if self.types[id(child)] != None and self.division_position(child) == None:
+                    return False
+
+        # the variables go back to the frame as values of their kind
+        return Value not in self.variables.values()
+
+    def find_unused(self, node):
+        # nobody reads the value of a statement, nor the values of the cases of an IF or
+        # the body of a WHILE whose own value nobody reads
+        unused = set()
+        if type(node) is ListNode:
+            unused.update(id(element_node) for element_node in node.element_nodes)
+
+        for child in self.walk(node):
+            if id(child) not in unused:
+                continue
+            if type(child) is IfNode:
+                unused.update(id(expr) for condition, expr in child.cases)
+                if child.else_case:
+                    unused.add(id(child.else_case))
+            elif type(child) is WhileNode:
+                unused.update(id(expr) for expr in child.body_node)
+
+        return unused
+
+    def infer_sources(self):
+        # the positions the value of every node can have been made at, an input is made at
+        # its own position and the Number(0) of an IF at none
+        assigns = [child for child in self.nodes if type(child) is VarAssignNode]
+        self.positions = {}
+        variables = {}
+
+        while True:
+            self.sources = {}
+            for child in self.nodes:
+                if type(child) in (VarAssignNode, SaveNode, ReuseNode):
+                    inner = child.value_node if type(child) is VarAssignNode else child.node
+                    sources = self.sources[id(inner)]
+                elif type(child) is UnaryOperatorNode and child.operator_token.type == Token.PLUS:
+                    sources = self.sources[id(child.node)]
+                elif type(child) is VarAccessNode:
+                    sources = variables.get(child.var_name_token.value, frozenset())
+                elif type(child) is InputNode:
+                    sources = self.sources[id(child.value_node)] | {('input', child.slot)}
+                elif type(child) is IfNode:
+                    sources = self.sources[id(child.else_case)] if child.else_case else frozenset((None,))
+                    for condition, expr in child.cases:
+                        sources = sources | self.sources[id(expr)]
+                elif child.pos_start == None:
+                    sources = frozenset((None,))
+                else:
+                    self.positions[id(child.pos_start)] = child.pos_start
+                    sources = frozenset((id(child.pos_start),))
+                self.sources[id(child)] = sources
+
+            assigned = {}
+            for assign in assigns:
+                var_name = assign.var_name_token.value
+                assigned[var_name] = assigned.get(var_name, frozenset()) | self.sources[id(assign.value_node)]
+
+            if assigned == variables:
+                return
+            variables = assigned
+
+    def division_position(self, node):
+        # Number.divide reports the position of the right operand, which Value.locate moves
+        # to the node that read it, to the left one first when both carry the same position
+        left_node = node.left_node
+        right_node = node.right_node
+        right_sources = self.sources[id(right_node)]
+
+        if type(left_node) in READ_NODES:
+            read = self.read_key(left_node)
+            if read != None and read == self.read_key(right_node):
+                return left_node.pos_start
+            if self.sources[id(left_node)] & right_sources:
+                return None
+
+        if type(right_node) in READ_NODES:
+            return right_node.pos_start
+        if len(right_sources) == 1:
+            source, = right_sources
+            return self.positions.get(source)
+        return None
+
+    def read_key(self, node):
+        # two reads with the same key give the same value
+        while type(node) is UnaryOperatorNode and node.operator_token.type == Token.PLUS:
+            node = node.node
+        if type(node) is VarAccessNode:
+            return ('variable', node.var_name_token.value)
+        if type(node) is ReuseNode:
+            return ('reuse', node.slot)
+        return None
+
+    def infer_NumberNode(self, node):
+        if type(node.token.value) in (int, float):
+            return NativeTypes.NUMBER
+        return NativeTypes.NUMBER_TEXT if type(node.token.value) is str else Value
+
+    def infer_StringNode(self, node):
+        return NativeTypes.CHAR if type(node.token.value) is str else Value
+
+    def infer_BoolNode(self, node):
+        return NativeTypes.BOOL if node.token.value in (Token.TRUE, Token.FALSE) else Value
+
+    def infer_ListNode(self, node):
+        return NativeTypes.LIST
+
+    def infer_BinaryOperatorNode(self, node):
+        left_kind = self.types[id(node.left_node)]
+        right_kind = self.types[id(node.right_node)]
+        if left_kind == None or right_kind == None:
+            return None
+        return NativeTypes.BINARY_KINDS.get((left_kind, node.operator_token.type, right_kind), Value)
+
+    def infer_AndNode(self, node):
+        # a right operand that never gives a value leaves the value of a deciding left one
+        left_kind = self.types[id(node.left_node)]
+        right_kind = self.types[id(node.right_node)]
+        if left_kind == None:
+            return None
+        if right_kind == None:
+            right_kind = left_kind
+        return NativeTypes.BINARY_KINDS.get((left_kind, node.operator_token.type, right_kind), Value)
+
+    def infer_OrNode(self, node):
+        return self.infer_AndNode(node)
+
+    def infer_TypedBinaryOperatorNode(self, node):
+        return self.infer_BinaryOperatorNode(node)
+
+    def infer_UnaryOperatorNode(self, node):
+        operand_kind = self.types[id(node.node)]
+        if operand_kind == None or node.operator_token.type == Token.PLUS:
+            return operand_kind
+        return NativeTypes.UNARY_KINDS.get((node.operator_token.type, operand_kind), Value)
+
+    def infer_IfNode(self, node):
+        kind = self.types[id(node.else_case)] if node.else_case else NativeTypes.NUMBER
+        for condition, expr in node.cases:
+            kind = self.join(kind, self.types[id(expr)])
+        return kind
+
+    def infer_WhileNode(self, node):
+        return NativeTypes.LIST
+
+
+NativeTypes.NUMBER = 'NUMBER'
+NativeTypes.NUMBER_TEXT = 'NUMBER_TEXT'
+NativeTypes.NUMBER_BOOL = 'NUMBER_BOOL'
+NativeTypes.CHAR = 'CHAR'
+NativeTypes.BOOL = 'BOOL'
+NativeTypes.LIST = 'LIST'
+
+NativeTypes.NUMBERS = (NativeTypes.NUMBER, NativeTypes.NUMBER_TEXT, NativeTypes.NUMBER_BOOL)
+
+# the kind an operator gives for the kinds of its operands, the pairs not in it are left
+# to the value methods
+NativeTypes.BINARY_KINDS = {}
+for operator in (Token.PLUS, Token.MINUS, Token.MUL, Token.DIV, Token.MOD):
+    NativeTypes.BINARY_KINDS[(NativeTypes.NUMBER, operator, NativeTypes.NUMBER)] = NativeTypes.NUMBER
+for operator in (Token.EE, Token.NE, Token.LT, Token.GT, Token.LTE, Token.GTE):
+    NativeTypes.BINARY_KINDS[(NativeTypes.NUMBER, operator, NativeTypes.NUMBER)] = NativeTypes.NUMBER_BOOL
+for left_kind in NativeTypes.NUMBERS:
+    for right_kind in NativeTypes.NUMBERS:
+        NativeTypes.BINARY_KINDS[(left_kind, TokenKind.AND, right_kind)] = NativeTypes.NUMBER_BOOL
+        NativeTypes.BINARY_KINDS[(left_kind, TokenKind.OR, right_kind)] = NativeTypes.NUMBER_BOOL
+    for right_kind in NativeTypes.NUMBERS + (NativeTypes.CHAR, NativeTypes.BOOL):
+        NativeTypes.BINARY_KINDS[(left_kind, Token.CONCAT, right_kind)] = NativeTypes.NUMBER_TEXT
+for right_kind in NativeTypes.NUMBERS + (NativeTypes.CHAR,):
+    NativeTypes.BINARY_KINDS[(NativeTypes.CHAR, Token.CONCAT, right_kind)] = NativeTypes.CHAR
+NativeTypes.BINARY_KINDS[(NativeTypes.BOOL, TokenKind.AND, NativeTypes.BOOL)] = NativeTypes.BOOL
+NativeTypes.BINARY_KINDS[(NativeTypes.BOOL, TokenKind.OR, NativeTypes.BOOL)] = NativeTypes.BOOL
+
+NativeTypes.UNARY_KINDS = {
+    (Token.MINUS, NativeTypes.NUMBER): NativeTypes.NUMBER,
+    (TokenKind.NOT, NativeTypes.NUMBER): NativeTypes.NUMBER_BOOL,
+    (TokenKind.NOT, NativeTypes.NUMBER_TEXT): NativeTypes.NUMBER_BOOL,
+    (TokenKind.NOT, NativeTypes.NUMBER_BOOL): NativeTypes.NUMBER_BOOL,
+    (TokenKind.NOT, NativeTypes.BOOL): NativeTypes.BOOL
+}
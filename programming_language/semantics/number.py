@@ -4,6 +4,8 @@ from programming_language.semantics.value import Value
 
 class Number(Value):
 
+    __slots__ = ('value',)
+
     def __init__(self, value):
         super().__init__()
         self.value = value
@@ -14,26 +16,43 @@ class Number(Value):
     def __repr__(self):
         return str(self.value)
 
+    def computes_with(self, other):
+        # a Number made by a comparison or an & holds text, which arithmetic does not take
+        return isinstance(other, Number) and type(self.value) is not str and type(other.value) is not str
+
+    def orders_with(self, other):
+        # text is only ordered against text
+        return isinstance(other, Number) and (type(self.value) is str) == (type(other.value) is str)
+
     def add(self, other):
-        if isinstance(other, Number):
-            return Number(self.value + other.value).set_context(self.context), None
+        if self.computes_with(other):
+            return self.add_number(other), None
         else:
             return None, Value.illegal_operation(self, other)
 
+    def add_number(self, other):
+        return Number(self.value + other.value).set_context(self.context)
+
     def subtract(self, other):
-        if isinstance(other, Number):
-            return Number(self.value - other.value).set_context(self.context), None
+        if self.computes_with(other):
+            return self.subtract_number(other), None
         else:
             return None, Value.illegal_operation(self, other)
 
+    def subtract_number(self, other):
+        return Number(self.value - other.value).set_context(self.context)
+
     def multiply(self, other):
-        if isinstance(other, Number):
-            return Number(self.value * other.value).set_context(self.context), None
+        if self.computes_with(other):
+            return self.multiply_number(other), None
         else:
             return None, Value.illegal_operation(self, other)
 
+    def multiply_number(self, other):
+        return Number(self.value * other.value).set_context(self.context)
+
     def divide(self, other):
-        if isinstance(other, Number):
+        if self.computes_with(other):
             if other.value == 0:
                 return None, RuntimeError(
                     other.pos_start,
@@ -46,72 +65,104 @@ class Number(Value):
             return None, Value.illegal_operation(self, other)
 
     def modulo(self, other):
-        if isinstance(other, Number):
-            return Number(self.value % other.value).set_context(self.context), None
+        if self.computes_with(other):
+            return self.modulo_number(other), None
         else:
             return None, Value.illegal_operation(self, other)
 
+    def modulo_number(self, other):
+        return Number(self.value % other.value).set_context(self.context)
+
     def concat(self, other):
         if isinstance(other, Number) or isinstance(other.value, str):
-            return Number(str(self.value) + str(other.value)).set_context(self.context), None
+            return self.concat_value(other), None
         else:
             return None, Value.illegal_operation(self, other)
 
+    def concat_value(self, other):
+        return Number(str(self.value) + str(other.value)).set_context(self.context)
+
     def get_comparison_eq(self, other):
         if isinstance(other, Number):
-            return Number(Token.TRUE if self.value == other.value else Token.FALSE).set_context(self.context), None
+            return self.get_comparison_eq_number(other), None
         else:
             return None, Value.illegal_operation(self, other)
 
+    def get_comparison_eq_number(self, other):
+        return Number(Token.TRUE if self.value == other.value else Token.FALSE).set_context(self.context)
+
     def get_comparison_ne(self, other):
         if isinstance(other, Number):
-            return Number(Token.TRUE if self.value != other.value else Token.FALSE).set_context(self.context), None
+            return self.get_comparison_ne_number(other), None
         else:
             return None, Value.illegal_operation(self, other)
 
+    def get_comparison_ne_number(self, other):
+        return Number(Token.TRUE if self.value != other.value else Token.FALSE).set_context(self.context)
+
     def get_comparison_lt(self, other):
-        if isinstance(other, Number):
-            return Number(Token.TRUE if self.value < other.value else Token.FALSE).set_context(self.context), None
+        if self.orders_with(other):
+            return self.get_comparison_lt_number(other), None
         else:
             return None, Value.illegal_operation(self, other)
 
+    def get_comparison_lt_number(self, other):
+        return Number(Token.TRUE if self.value < other.value else Token.FALSE).set_context(self.context)
+
     def get_comparison_gt(self, other):
-        if isinstance(other, Number):
-            return Number(Token.TRUE if self.value > other.value else Token.FALSE).set_context(self.context), None
+        if self.orders_with(other):
+            return self.get_comparison_gt_number(other), None
         else:
             return None, Value.illegal_operation(self, other)
 
+    def get_comparison_gt_number(self, other):
+        return Number(Token.TRUE if self.value > other.value else Token.FALSE).set_context(self.context)
+
     def get_comparison_lte(self, other):
-        if isinstance(other, Number):
-            return Number(Token.TRUE if self.value <= other.value else Token.FALSE).set_context(self.context), None
+        if self.orders_with(other):
+            return self.get_comparison_lte_number(other), None
         else:
             return None, Value.illegal_operation(self, other)
 
+    def get_comparison_lte_number(self, other):
+        return Number(Token.TRUE if self.value <= other.value else Token.FALSE).set_context(self.context)
+
     def get_comparison_gte(self, other):
-        if isinstance(other, Number):
-            return Number(Token.TRUE if self.value >= other.value else Token.FALSE).set_context(self.context), None
+        if self.orders_with(other):
+            return self.get_comparison_gte_number(other), None
         else:
             return None, Value.illegal_operation(self, other)
 
+    def get_comparison_gte_number(self, other):
+        return Number(Token.TRUE if self.value >= other.value else Token.FALSE).set_context(self.context)
+
     def get_comparison_and(self, other):
         if isinstance(other, Number):
-            self.value = True if self.value == Token.TRUE else False
-            other.value = True if other.value == Token.TRUE else False
-            return Number(Token.TRUE if self.value and other.value else Token.FALSE).set_context(self.context), None
+            return self.get_comparison_and_number(other), None
         else:
             return None, Value.illegal_operation(self, other)
 
+    def get_comparison_and_number(self, other):
+        return Number(Token.TRUE if self.value == Token.TRUE and other.value == Token.TRUE else Token.FALSE).set_context(self.context)
+
     def get_comparison_or(self, other):
         if isinstance(other, Number):
-            self.value = True if self.value == Token.TRUE else False
-            other.value = True if other.value == Token.TRUE else False
-            return Number(Token.TRUE if self.value or other.value else Token.FALSE).set_context(self.context), None
+            return self.get_comparison_or_number(other), None
         else:
             return None, Value.illegal_operation(self, other)
 
+    def get_comparison_or_number(self, other):
+        return Number(Token.TRUE if self.value == Token.TRUE or other.value == Token.TRUE else Token.FALSE).set_context(self.context)
+
+    def decide_and(self):
+        return None if self.is_true() else Number(Token.FALSE).set_context(self.context)
+
+    def decide_or(self):
+        return Number(Token.TRUE).set_context(self.context) if self.is_true() else None
+
     def get_comparison_not(self):
-        self.value = True if self.value == Token.TRUE else False
-        return Number(Token.TRUE if self.value == Token.FALSE else Token.FALSE).set_context(self.context), None
+        # NOT compares the truth of the number with FALSE, which it never equals
+        return Number(Token.FALSE).set_context(self.context), None
 
     def copy(self):
         copy = Number(self.value)
@@ -120,5 +171,4 @@ class Number(Value):
         return copy
 
     def is_true(self):
-        self.value = True if self.value == Token.TRUE else False
-        return self.value != 0 or self.value != False
\ No newline at end of file
+        return self.value == Token.TRUE
\ No newline at end of file
@@ -0,0 +1,35 @@
+from programming_language.lexical.token import Token
+from programming_language.lexical.token import TokenKind
+from programming_language.semantics.number import Number
+
+# the value method every operator runs, shared by the engines and the constant folding
+# of the Optimizer, each gives an (answer, error) pair
+
+BINARY_OPERATIONS = {
+    Token.PLUS: lambda left, right: left.add(right),
+    Token.MINUS: lambda left, right: left.subtract(right),
+    Token.MUL: lambda left, right: left.multiply(right),
+    Token.DIV: lambda left, right: left.divide(right),
+    Token.MOD: lambda left, right: left.modulo(right),
+    Token.CONCAT: lambda left, right: left.concat(right),
+    Token.EE: lambda left, right: left.get_comparison_eq(right),
+    Token.NE: lambda left, right: left.get_comparison_ne(right),
+    Token.LT: lambda left, right: left.get_comparison_lt(right),
+    Token.GT: lambda left, right: left.get_comparison_gt(right),
+    Token.LTE: lambda left, right: left.get_comparison_lte(right),
+    Token.GTE: lambda left, right: left.get_comparison_gte(right),
+    TokenKind.AND: lambda left, right: left.get_comparison_and(right),
+    TokenKind.OR: lambda left, right: left.get_comparison_or(right)
+}
+
+# the value of AND and OR when the left operand decides it, None otherwise
+DECIDE_OPERATIONS = {
+    TokenKind.AND: lambda left: left.decide_and(),
+    TokenKind.OR: lambda left: left.decide_or()
+}
+
+UNARY_OPERATIONS = {
+    Token.PLUS: lambda number: (number, None),
+    Token.MINUS: lambda number: number.multiply(Number(-1)),
+    TokenKind.NOT: lambda number: number.get_comparison_not()
+}
@@ -0,0 +1,500 @@
+from types import GeneratorType
+
+from programming_language.lexical.token import Token
+from programming_language.semantics.bool import Bool
+from programming_language.semantics.number import Number
+from programming_language.semantics.operations import BINARY_OPERATIONS
+from programming_language.semantics.operations import DECIDE_OPERATIONS
+from programming_language.semantics.operations import UNARY_OPERATIONS
+from programming_language.semantics.string import String
+from programming_language.syntax.nodes import AndNode
+from programming_language.syntax.nodes import BinaryOperatorNode
+from programming_language.syntax.nodes import BoolNode
+from programming_language.syntax.nodes import IfNode
+from programming_language.syntax.nodes import InputNode
+from programming_language.syntax.nodes import ListNode
+from programming_language.syntax.nodes import NumberNode
+from programming_language.syntax.nodes import OrNode
+from programming_language.syntax.nodes import ReuseNode
+from programming_language.syntax.nodes import SaveNode
+from programming_language.syntax.nodes import StringNode
+from programming_language.syntax.nodes import UnaryOperatorNode
+from programming_language.syntax.nodes import VarAccessNode
+from programming_language.syntax.nodes import VarAssignNode
+from programming_language.syntax.nodes import WhileNode
+
+class Optimizer:
+
+    # rewrites the parsed tree in place, every rewrite gives the value and the error
+    # the Interpreter would have given for the original nodes
+
+    def __init__(self):
+        self.removed = 0
+        self.hoisted = 0
+        self.shared = 0
+
+    def optimize(self, node):
+        count = self.count(node)
+        node = self.rewrite(node, 'fold')
+        self.reads = set(child.var_name_token.value for child in self.walk(node) if type(child) is VarAccessNode)
+        node = self.rewrite(node, 'prune')
+        self.removed = count - self.count(node)
+
+        self.slots = 0
+        self.keys = self.expression_keys(node)
+        if self.keys == None:
+            return node
+
+        for loop in [child for child in self.walk(node) if type(child) is WhileNode]:
+            self.hoist(loop)
+        self.counts = None
+        return self.rewrite(node, 'share')
+
+    def rewrite(self, node, stage):
+        # like Interpreter.visit, methods of nodes with children are generators that
+        # yield a child and receive its rewritten node
+        rewrites = []
+        result = self.rewrite_method(node, stage)(node)
+
+        while True:
+            if type(result) is GeneratorType:
+                rewrites.append(result)
+                result = None
+            elif not rewrites:
+                return result
+
+            try:
+                node = rewrites[-1].send(result)
+            except StopIteration as stop:
+                rewrites.pop()
+                result = stop.value
+            else:
+                result = self.rewrite_method(node, stage)(node)
+
+    def rewrite_method(self, node, stage):
+        return getattr(self, f'{stage}_{type(node).__name__}', self.keep)
+
+    def keep(self, node):
+        return node
+
+    def walk(self, node):
+        nodes = [node]
+
+        while nodes:
+            node = nodes.pop()
+            yield node
+
+            if type(node) is ListNode:
+                nodes.extend(node.element_nodes)
+            elif type(node) is InputNode:
+                nodes.append(node.value_node)
+            elif type(node) is VarAssignNode:
+                nodes.append(node.value_node)
+            elif type(node) in (BinaryOperatorNode, AndNode, OrNode):
+                nodes.extend((node.left_node, node.right_node))
+            elif type(node) is UnaryOperatorNode:
+                nodes.append(node.node)
+            elif type(node) is IfNode:
+                for condition, expr in node.cases:
+                    nodes.extend((condition, expr))
+                if node.else_case:
+                    nodes.append(node.else_case)
+            elif type(node) is WhileNode:
+                nodes.append(node.condition_node)
+                nodes.extend(node.body_node)
+            elif type(node) in (SaveNode, ReuseNode):
+                nodes.append(node.node)
+
+    def count(self, node):
+        return sum(1 for child in self.walk(node))
+
+    def literal_value(self, node):
+        value_class = Optimizer.LITERAL_VALUES.get(type(node))
+        if value_class == None:
+            return None
+        return value_class(node.token.value).set_pos(node.pos_start)
+
+    def literal_node(self, value, pos_start):
+        node_class, token_type = Optimizer.LITERAL_NODES[type(value)]
+        if node_class is NumberNode and type(value.value) is float:
+            token_type = Token.FLOAT
+        return node_class(Token(token_type, value.value, pos_start))
+
+    def fold(self, node, operation, *operands):
+        values = [self.literal_value(operand) for operand in operands]
+        if None in values:
+            return node
+
+        # the operation runs on fresh values, anything it reports is left for the program to report
+        try:
+            answer, error = operation(*values)
+        except Exception:
+            return node
+        if error or type(answer) not in Optimizer.LITERAL_NODES:
+            return node
+
+        return self.literal_node(answer, node.pos_start)
+
+    def is_true(self, node):
+        value = self.literal_value(node)
+        if value == None:
+            return None
+
+        try:
+            return value.is_true()
+        except Exception:
+            return None
+
+    def fold_ListNode(self, node):
+        for index, element_node in enumerate(node.element_nodes):
+            node.element_nodes[index] = yield element_node
+        return node
+
+    def fold_VarAssignNode(self, node):
+        node.value_node = yield node.value_node
+        return node
+
+    def fold_BinaryOperatorNode(self, node):
+        node.left_node = yield node.left_node
+        node.right_node = yield node.right_node
+        return self.fold(node, BINARY_OPERATIONS[node.operator_token.type], node.left_node, node.right_node)
+
+    def fold_AndNode(self, node):
+        # a literal left operand that decides the value leaves out the right operand
+        node.left_node = yield node.left_node
+        left = self.literal_value(node.left_node)
+        if left != None:
+            answer = DECIDE_OPERATIONS[node.operator_token.type](left)
+            if answer != None:
+                return self.literal_node(answer, node.pos_start)
+
+        node.right_node = yield node.right_node
+        return self.fold(node, BINARY_OPERATIONS[node.operator_token.type], node.left_node, node.right_node)
+
+    def fold_OrNode(self, node):
+        return self.fold_AndNode(node)
+
+    def fold_UnaryOperatorNode(self, node):
+        # also flattens -literal, which would otherwise multiply by -1 on every run
+        node.node = yield node.node
+        return self.fold(node, UNARY_OPERATIONS[node.operator_token.type], node.node)
+
+    def fold_IfNode(self, node):
+        cases = []
+        false_case = None
+        is_condition = False
+
+        for condition, expr in node.cases:
+            condition = yield condition
+            is_true = self.is_true(condition)
+            if is_true == False:
+                false_case = (condition, expr)
+                continue
+
+            cases.append((condition, (yield expr)))
+            if is_true:
+                is_condition = True
+
+        # a case that is always true makes the ELSE unreachable
+        else_case = None
+        if node.else_case and not is_condition:
+            else_case = yield node.else_case
+
+        if not cases:
+            if else_case:
+                return else_case
+            # keep one false case, the Number(0) of an IF without a true case has no position
+            node.cases = [false_case]
+            node.else_case = None
+            return node
+
+        if len(cases) == 1 and is_condition:
+            return cases[0][1]
+
+        node.cases = cases
+        node.else_case = else_case
+        return node
+
+    def fold_WhileNode(self, node):
+        node.condition_node = yield node.condition_node
+        for index, expr in enumerate(node.body_node):
+            node.body_node[index] = yield expr
+        return node
+
+    def prune_ListNode(self, node):
+        # the statements of the program are only run for what they do,
+        # a statement that only makes a value can go
+        element_nodes = []
+
+        for element_node in node.element_nodes:
+            element_node = yield element_node
+            if type(element_node) not in Optimizer.PURE_NODES:
+                element_nodes.append(element_node)
+
+        node.element_nodes = element_nodes
+        return node
+
+    def prune_VarAssignNode(self, node):
+        node.value_node = yield node.value_node
+
+        # only OUTPUT is read after the program ends
+        var_name = node.var_name_token.value
+        if var_name != Token.OUTPUT and var_name not in self.reads:
+            return node.value_node
+        return node
+
+    def prune_BinaryOperatorNode(self, node):
+        node.left_node = yield node.left_node
+        node.right_node = yield node.right_node
+        return node
+
+    def prune_AndNode(self, node):
+        return self.prune_BinaryOperatorNode(node)
+
+    def prune_OrNode(self, node):
+        return self.prune_BinaryOperatorNode(node)
+
+    def prune_UnaryOperatorNode(self, node):
+        node.node = yield node.node
+        return node
+
+    def prune_IfNode(self, node):
+        cases = []
+        for condition, expr in node.cases:
+            cases.append(((yield condition), (yield expr)))
+        node.cases = cases
+
+        if node.else_case:
+            node.else_case = yield node.else_case
+        return node
+
+    def prune_WhileNode(self, node):
+        node.condition_node = yield node.condition_node
+        for index, expr in enumerate(node.body_node):
+            node.body_node[index] = yield expr
+        return node
+
+    def list_variables(self, node):
+        # List operations share and change the elements of their operands, so nothing
+        # that can see a List is reused, whatever a variable may hold is worked out first
+        nodes = list(self.walk(node))
+        nodes.reverse()
+        assigns = [child for child in nodes if type(child) is VarAssignNode]
+        variables = set()
+
+        while True:
+            lists = set()
+            for child in nodes:
+                node_type = type(child)
+                if node_type in (ListNode, WhileNode):
+                    is_list = True
+                elif node_type is VarAccessNode:
+                    is_list = child.var_name_token.value in variables
+                elif node_type is BinaryOperatorNode:
+                    is_list = id(child.left_node) in lists
+                elif node_type in (UnaryOperatorNode, SaveNode, ReuseNode):
+                    is_list = id(child.node) in lists
+                elif node_type is VarAssignNode:
+                    is_list = id(child.value_node) in lists
+                elif node_type is IfNode:
+                    is_list = any(id(expr) in lists for condition, expr in child.cases) or id(child.else_case) in lists
+                else:
+                    is_list = False
+                if is_list:
+                    lists.add(id(child))
+
+            list_variables = set(assign.var_name_token.value for assign in assigns if id(assign.value_node) in lists)
+            if list_variables <= variables:
+                break
+            variables |= list_variables
+
+        # an element taken out of a List can be the very value a variable holds, when
+        # an operator gets a List nothing can be reused safely
+        for child in nodes:
+            if type(child) is BinaryOperatorNode and (id(child.left_node) in lists or id(child.right_node) in lists):
+                return None
+            if type(child) is UnaryOperatorNode and id(child.node) in lists:
+                return None
+        return variables
+
+    def expression_keys(self, node):
+        # every operator whose operands are operators, literals or variables gets a key,
+        # equal keys give equal values as long as the variables in them keep their values
+        list_variables = self.list_variables(node)
+        if list_variables == None:
+            return None
+
+        nodes = list(self.walk(node))
+        nodes.reverse()
+        keys = {}
+        interned = {}
+        self.variables = {}
+
+        for child in nodes:
+            node_type = type(child)
+            if node_type in Optimizer.LITERAL_VALUES:
+                # repr tells 0.0 from -0.0
+                parts = (node_type, type(child.token.value), repr(child.token.value))
+                variables = frozenset()
+            elif node_type is VarAccessNode:
+                var_name = child.var_name_token.value
+                if var_name in list_variables: continue
+                parts = (node_type, var_name)
+                variables = frozenset((var_name,))
+            elif node_type is BinaryOperatorNode:
+                if id(child.left_node) not in keys or id(child.right_node) not in keys: continue
+                parts = (node_type, child.operator_token.type, keys[id(child.left_node)], keys[id(child.right_node)])
+                variables = self.variables[id(child.left_node)] | self.variables[id(child.right_node)]
+            elif node_type is UnaryOperatorNode:
+                if id(child.node) not in keys: continue
+                parts = (node_type, child.operator_token.type, keys[id(child.node)])
+                variables = self.variables[id(child.node)]
+            else:
+                continue
+
+            keys[id(child)] = interned.setdefault(parts, len(interned))
+            self.variables[id(child)] = variables
+
+        return keys
+
+    def hoist(self, loop):
+        # an operator that only reads variables the loop never assigns gives the same value
+        # on every iteration, it is evaluated the first time and reused until the loop ends
+        self.writes = set(child.var_name_token.value for child in self.walk(loop) if type(child) is VarAssignNode)
+        self.loop_slots = {}
+        self.rewrite(loop, 'hoist')
+        loop.saved_slots = loop.saved_slots + tuple(self.loop_slots.values())
+
+    def new_slot(self):
+        self.slots += 1
+        return self.slots - 1
+
+    def hoist_operator(self, node):
+        key = self.keys.get(id(node))
+        if key != None and not self.variables[id(node)] & self.writes:
+            if key not in self.loop_slots:
+                self.loop_slots[key] = self.new_slot()
+                self.hoisted += 1
+            return ReuseNode(self.loop_slots[key], node)
+
+    def hoist_BinaryOperatorNode(self, node):
+        reuse = self.hoist_operator(node)
+        if reuse: return reuse
+        return self.prune_BinaryOperatorNode(node)
+
+    def hoist_UnaryOperatorNode(self, node):
+        reuse = self.hoist_operator(node)
+        if reuse: return reuse
+        return self.prune_UnaryOperatorNode(node)
+
+    def hoist_AndNode(self, node):
+        return self.prune_BinaryOperatorNode(node)
+
+    def hoist_OrNode(self, node):
+        return self.prune_BinaryOperatorNode(node)
+
+    def hoist_ListNode(self, node):
+        for index, element_node in enumerate(node.element_nodes):
+            node.element_nodes[index] = yield element_node
+        return node
+
+    def hoist_VarAssignNode(self, node):
+        node.value_node = yield node.value_node
+        return node
+
+    def hoist_IfNode(self, node):
+        return self.prune_IfNode(node)
+
+    def hoist_WhileNode(self, node):
+        return self.prune_WhileNode(node)
+
+    def share_operators(self, node):
+        # the operators of one expression run in order with no assignment in between,
+        # so an operator that comes again can reuse the value of the first one
+        self.counts = {}
+        nodes = [node]
+
+        while nodes:
+            child = nodes.pop()
+            key = self.keys.get(id(child))
+            if key == None or type(child) not in (BinaryOperatorNode, UnaryOperatorNode):
+                continue
+
+            if key in self.counts:
+                self.counts[key] += 1
+            else:
+                self.counts[key] = 1
+                if type(child) is BinaryOperatorNode:
+                    nodes.extend((child.right_node, child.left_node))
+                else:
+                    nodes.append(child.node)
+
+        self.counts = {key: None for key, count in self.counts.items() if count > 1}
+
+    def share_operator(self, node):
+        key = self.keys.get(id(node))
+        is_root = self.counts == None and key != None
+        if is_root:
+            self.share_operators(node)
+
+        if self.counts and key in self.counts:
+            if self.counts[key] != None:
+                return is_root, ReuseNode(self.counts[key], node), None
+            self.counts[key] = self.new_slot()
+            self.shared += 1
+            return is_root, None, self.counts[key]
+        return is_root, None, None
+
+    def share_BinaryOperatorNode(self, node):
+        is_root, reuse, slot = self.share_operator(node)
+        if reuse: return reuse
+
+        node.left_node = yield node.left_node
+        node.right_node = yield node.right_node
+        if is_root: self.counts = None
+        return SaveNode(slot, node) if slot != None else node
+
+    def share_UnaryOperatorNode(self, node):
+        is_root, reuse, slot = self.share_operator(node)
+        if reuse: return reuse
+
+        node.node = yield node.node
+        if is_root: self.counts = None
+        return SaveNode(slot, node) if slot != None else node
+
+    def share_AndNode(self, node):
+        # the right operand does not always run, so its operators are shared apart from the left ones
+        return self.prune_BinaryOperatorNode(node)
+
+    def share_OrNode(self, node):
+        return self.prune_BinaryOperatorNode(node)
+
+    def share_ListNode(self, node):
+        return self.hoist_ListNode(node)
+
+    def share_VarAssignNode(self, node):
+        return self.hoist_VarAssignNode(node)
+
+    def share_IfNode(self, node):
+        return self.prune_IfNode(node)
+
+    def share_WhileNode(self, node):
+        return self.prune_WhileNode(node)
+
+    def share_ReuseNode(self, node):
+        return node
+
+
+Optimizer.LITERAL_VALUES = {
+    NumberNode: Number,
+    StringNode: String,
+    BoolNode: Bool
+}
+
+Optimizer.LITERAL_NODES = {
+    Number: (NumberNode, Token.INT),
+    String: (StringNode, Token.CHAR),
+    Bool: (BoolNode, Token.BOOL)
+}
+
+Optimizer.PURE_NODES = (NumberNode, StringNode, BoolNode, InputNode)
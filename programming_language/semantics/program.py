@@ -0,0 +1,150 @@
+import threading
+from functools import partial
+
+from programming_language.error_handler.error import IllegalTypeError
+from programming_language.lexical.lexer import Lexer
+from programming_language.lexical.token import Token
+from programming_language.semantics.bytecode_compiler import BytecodeCompiler
+from programming_language.semantics.closure_compiler import ClosureCompiler
+from programming_language.semantics.context import Context
+from programming_language.semantics.interpreter import Interpreter
+from programming_language.semantics.native_compiler import NativeCompiler
+from programming_language.semantics.python_compiler import PythonCompiler
+from programming_language.semantics.resolver import Resolver
+from programming_language.semantics.virtual_machine import VirtualMachine
+from programming_language.syntax.parser import Parser
+from programming_language.syntax.symbol_table import SymbolTable
+
+class Program:
+
+    def __init__(self, node, input_slots, removed_nodes=0):
+        self.node = node
+        self.input_slots = input_slots
+        self.removed_nodes = removed_nodes
+        self.slots = Resolver().resolve(node, [var_name.value for var_name, data_type in input_slots])
+        self.codes = {}
+        self.inline_caches = {}
+        self.hits = 0
+        self.misses = 0
+        # a cached Program is run by concurrent requests, what it keeps between runs is
+        # only changed under this lock
+        self.lock = threading.Lock()
+
+    def __getstate__(self):
+        # compiled code is made of closures, bound methods and functions, which cannot be pickled, so it is compiled again on the first run
+        state = self.__dict__.copy()
+        state['codes'] = {}
+        # the inline caches are keyed by the ids of the nodes of this process
+        state['inline_caches'] = {}
+        state['hits'] = 0
+        state['misses'] = 0
+        del state['lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    def compile(self, engine):
+        if engine not in Program.ENGINES:
+            raise ValueError(f"Unknown engine '{engine}', expected one of {', '.join(Program.ENGINES)}")
+
+        # concurrent first runs of an engine compile it once
+        with self.lock:
+            if engine not in self.codes:
+                self.codes[engine] = self.make_code(engine)
+            return self.codes[engine]
+
+    def make_code(self, engine):
+        code = None
+        if engine == 'quickening':
+            code = self.quicken
+        elif engine == 'closure':
+            try:
+                code = ClosureCompiler().compile(self.node)
+            except RecursionError:
+                # nested deeper than closures can call each other, the tree-walker runs it instead
+                code = None
+        elif engine == 'vm':
+            code = partial(VirtualMachine().run, BytecodeCompiler().compile(self.node))
+        elif engine in ('python', 'native'):
+            try:
+                # a program whose values cannot all be held natively runs with values
+                code = NativeCompiler().compile(self.node) if engine == 'native' else None
+                if code == None:
+                    code = PythonCompiler().compile(self.node)
+            except (RecursionError, MemoryError, SyntaxError):
+                # nested deeper than Python blocks can be, the tree-walker runs it instead
+                code = None
+
+        return code
+
+    def quicken(self, context):
+        # every run quickens its own copy of the inline caches and hands it back when it
+        # ends, so runs after the first start quickened and concurrent runs share nothing
+        with self.lock:
+            inline_caches = dict(self.inline_caches)
+
+        interpreter = Interpreter(inline_caches)
+        result = interpreter.visit(self.node, context)
+
+        with self.lock:
+            self.inline_caches.update(inline_caches)
+            self.hits += interpreter.hits
+            self.misses += interpreter.misses
+        return result.value, result.error
+
+    def bind_inputs(self, input_tokens):
+        inputs = []
+        index = 0
+
+        # inputs are taken in declaration order, a missing one keeps the declared value
+        for var_name, data_type in self.input_slots:
+            token = input_tokens[index]
+            if token.type in Program.INPUT_TYPES:
+                # the TypeChecker counts on every input having the class of its declared type
+                input_class = Parser.LITERAL_NODES[token.type]
+                if input_class is not Parser.LITERAL_NODES[Token.DATA_TYPE_KINDS[data_type]]:
+                    return None, IllegalTypeError(
+                        var_name.pos_start,
+                        f"input of '{var_name.value}' is not {data_type}"
+                    )
+
+                inputs.append(input_class(token))
+                index += 1
+                token = input_tokens[index]
+            else:
+                inputs.append(None)
+
+            if token.type == Token.COMMA:
+                index += 1
+
+        return inputs, None
+
+    def run(self, inputs, engine='tree'):
+        input_tokens, error = Lexer(inputs).make_tokens()
+        if error: return None, error
+
+        context = Context('<source-code>')
+        context.frame = [None] * len(self.slots)
+        context.symbol_table = SymbolTable(context.frame, self.slots)
+        context.inputs, error = self.bind_inputs(input_tokens)
+        if error: return None, error
+
+        code = self.codes[engine] if engine in self.codes else self.compile(engine)
+        if code != None:
+            value, error = code(context)
+        else:
+            error = Interpreter().visit(self.node, context).error
+        if error: return None, error
+
+        return context.symbol_table.get(Token.OUTPUT), None
+
+
+# stored compiled programs are only reused by the same version, bump it whenever
+# the nodes, the parser or Program change what a compiled program looks like
+Program.COMPILER_VERSION = '10'
+
+Program.ENGINES = ('tree', 'quickening', 'closure', 'vm', 'python', 'native')
+
+Program.INPUT_TYPES = (Token.INT, Token.FLOAT, Token.CHAR, Token.BOOL)
@@ -0,0 +1,347 @@
+import ast
+
+from types import GeneratorType
+
+from programming_language.error_handler.error import RuntimeError
+from programming_language.lexical.token import Token
+from programming_language.lexical.token import TokenKind
+from programming_language.semantics.bool import Bool
+from programming_language.semantics.list import List
+from programming_language.semantics.number import Number
+from programming_language.semantics.string import String
+from programming_language.syntax.nodes import BoolNode
+from programming_language.syntax.nodes import NumberNode
+from programming_language.syntax.nodes import StringNode
+from programming_language.syntax.nodes import read_position
+
+class PythonCompiler:
+
+    # the program becomes the source of one Python function that takes the context and
+    # returns (value, error), calling the same value methods the tree-walking Interpreter does
+
+    def compile(self, node):
+        source, lines = self.generate(node)
+
+        # the generated lines take the CFPL line of the node they come from, so a
+        # traceback through the program points at the CFPL source
+        tree = ast.parse(source, PythonCompiler.FILENAME)
+        for python_node in ast.walk(tree):
+            if hasattr(python_node, 'lineno'):
+                python_node.lineno = python_node.end_lineno = lines[python_node.lineno - 1]
+                if python_node.end_col_offset != None:
+                    python_node.end_col_offset = max(python_node.col_offset, python_node.end_col_offset)
+
+        namespace = {
+            'Number': Number,
+            'String': String,
+            'Bool': Bool,
+            'List': List,
+            'RuntimeError': RuntimeError,
+            'INPUT_VALUES': PythonCompiler.INPUT_VALUES,
+            'K': tuple(self.constants),
+            'P': tuple(self.positions)
+        }
+        exec(compile(tree, PythonCompiler.FILENAME, 'exec'), namespace)
+        return namespace['program']
+
+    def generate(self, node):
+        self.source = []
+        self.lines = []
+        self.line = 1
+        self.indent = 1
+        self.temps = 0
+        self.constants = []
+        self.positions = []
+        self.position_indexes = {}
+        self.slots = set()
+        self.compile_methods = {}
+
+        value = self.generate_node(node)
+        self.emit('')
+        # variables live in locals while running, the frame gets them at the end
+        for slot in sorted(self.slots):
+            self.emit(f'frame[{slot}] = v{slot}')
+        self.emit(f'return {value}, None')
+
+        header = ['def program(context):', '    inputs = context.inputs', '    saved = context.saved', '    frame = context.frame']
+        header.extend(f'    v{slot} = frame[{slot}]' for slot in sorted(self.slots))
+        source = header + self.source
+        lines = [1] * len(header) + self.lines
+        return '\n'.join(source) + '\n', lines
+
+    def generate_node(self, node):
+        # like Interpreter.visit, methods of nodes with children are generators that yield
+        # the child to generate first and receive the name holding its value
+        generates = []
+        result = self.generate_method(node)(node)
+
+        while True:
+            if type(result) is GeneratorType:
+                generates.append(result)
+                result = None
+            elif not generates:
+                return result
+
+            try:
+                node = generates[-1].send(result)
+            except StopIteration as stop:
+                generates.pop()
+                result = stop.value
+            else:
+                method = self.compile_methods.get(type(node))
+                if method == None:
+                    method = self.generate_method(node)
+                result = method(node)
+
+    def generate_method(self, node):
+        method = getattr(self, f'generate_{type(node).__name__}', self.no_generate_method)
+        self.compile_methods[type(node)] = method
+        return method
+
+    def no_generate_method(self, node):
+        raise Exception(f'No generate_{type(node).__name__} method defined')
+
+    def emit(self, text):
+        if self.indent >= PythonCompiler.MAX_INDENT:
+            # fail before generating the rest of a program Python would not compile
+            raise SyntaxError('too many levels of indentation')
+        self.source.append('    ' * self.indent + text if text else '')
+        self.lines.append(self.line)
+
+    def temp(self):
+        self.temps += 1
+        return f't{self.temps}'
+
+    def constant(self, value):
+        if type(value) in (int, str) or value == None:
+            return repr(value)
+        self.constants.append(value)
+        return f'K[{len(self.constants) - 1}]'
+
+    def position(self, pos_start):
+        # keeps the line table current for everything emitted from here on
+        if pos_start != None:
+            self.line = pos_start.line + 1
+        if id(pos_start) not in self.position_indexes:
+            self.position_indexes[id(pos_start)] = len(self.positions)
+            self.positions.append(pos_start)
+        return f'P[{self.position_indexes[id(pos_start)]}]'
+
+    def slot(self, slot):
+        self.slots.add(slot)
+        return f'v{slot}'
+
+    def generate_literal(self, value_class, node):
+        position = self.position(node.pos_start)
+        value = self.temp()
+        self.emit(f'{value} = {value_class}({self.constant(node.token.value)}).set_context(context).set_pos({position})')
+        return value
+
+    def generate_NumberNode(self, node):
+        return self.generate_literal('Number', node)
+
+    def generate_StringNode(self, node):
+        return self.generate_literal('String', node)
+
+    def generate_BoolNode(self, node):
+        return self.generate_literal('Bool', node)
+
+    def generate_ListNode(self, node):
+        elements = self.temp()
+        self.emit(f'{elements} = []')
+
+        for element_node in node.element_nodes:
+            element = yield element_node
+            self.emit(f'{elements}.append({element})')
+
+        position = self.position(node.pos_start)
+        value = self.temp()
+        self.emit(f'{value} = List({elements}).set_context(context).set_pos({position})')
+        return value
+
+    def generate_InputNode(self, node):
+        if type(node.value_node) not in (NumberNode, StringNode, BoolNode):
+            raise Exception(f'INPUT cannot default to a {type(node.value_node).__name__}')
+
+        self.position(node.pos_start)
+        value = self.temp()
+        self.emit(f'if inputs and inputs[{node.slot}] is not None:')
+        self.emit(f'    {value} = INPUT_VALUES[type(inputs[{node.slot}])](inputs[{node.slot}].token.value)'
+                  f'.set_context(context).set_pos(inputs[{node.slot}].pos_start)')
+        self.emit('else:')
+        self.indent += 1
+        default = yield node.value_node
+        self.emit(f'{value} = {default}')
+        self.indent -= 1
+        return value
+
+    def generate_VarAccessNode(self, node):
+        var_name = node.var_name_token.value
+        variable = self.slot(node.slot)
+        position = self.position(node.pos_start)
+        message = f"'{var_name}' is not defined"
+        value = self.temp()
+        self.emit(f'if {variable} is None: return None, RuntimeError({position}, {message!r}, context)')
+        self.emit(f'{value} = {variable}')
+        return value
+
+    def generate_VarAssignNode(self, node):
+        value = yield node.value_node
+        self.position(node.pos_start)
+        self.emit(f'{self.slot(node.slot)} = {value}')
+        return value
+
+    def generate_BinaryOperatorNode(self, node):
+        left = yield node.left_node
+        right = yield node.right_node
+        position = self.position(node.pos_start)
+        value = self.temp()
+        self.emit(f'{value}, error = {left}.{PythonCompiler.BINARY_METHODS[node.operator_token.type]}({right})')
+        self.emit(f'if error: return None, {right}.locate({left}.locate(error, {self.constant(read_position(node.left_node))}), {self.constant(read_position(node.right_node))})')
+        self.emit(f'{value}.set_pos({position})')
+        return value
+
+    def generate_TypedBinaryOperatorNode(self, node):
+        left = yield node.left_node
+        right = yield node.right_node
+        position = self.position(node.pos_start)
+        value = self.temp()
+        self.emit(f'{value} = {left}.{node.operation.__name__}({right}).set_pos({position})')
+        return value
+
+    def generate_AndNode(self, node):
+        return self.generate_logical(node)
+
+    def generate_OrNode(self, node):
+        return self.generate_logical(node)
+
+    def generate_logical(self, node):
+        # the right operand is only evaluated when the left one does not decide the value
+        operator = node.operator_token.type
+        left = yield node.left_node
+        value = self.temp()
+        self.emit(f'{value} = {left}.{PythonCompiler.DECIDE_METHODS[operator]}()')
+        self.emit(f'if {value} is None:')
+        self.indent += 1
+        right = yield node.right_node
+        self.emit(f'{value}, error = {left}.{PythonCompiler.BINARY_METHODS[operator]}({right})')
+        self.emit(f'if error: return None, {right}.locate({left}.locate(error, {self.constant(read_position(node.left_node))}), {self.constant(read_position(node.right_node))})')
+        self.indent -= 1
+        position = self.position(node.pos_start)
+        self.emit(f'{value}.set_pos({position})')
+        return value
+
+    def generate_UnaryOperatorNode(self, node):
+        operand = yield node.node
+        position = self.position(node.pos_start)
+
+        # + gives its operand as it is
+        if node.operator_token.type == Token.PLUS:
+            return operand
+
+        value = self.temp()
+        if node.operator_token.type == Token.MINUS:
+            self.emit(f'{value}, error = {operand}.multiply(Number(-1))')
+        else:
+            self.emit(f'{value}, error = {operand}.get_comparison_not()')
+        self.emit(f'if error: return None, {operand}.locate(error, {self.constant(read_position(node.node))})')
+        self.emit(f'{value}.set_pos({position})')
+        return value
+
+    def generate_IfNode(self, node):
+        # every true case runs and the last one gives the value, None means no case was true
+        value = self.temp()
+        self.emit(f'{value} = None')
+
+        for condition, expr in node.cases:
+            condition_value = yield condition
+            self.emit(f'if {condition_value}.is_true():')
+            self.indent += 1
+            expr_value = yield expr
+            self.emit(f'{value} = {expr_value}')
+            self.indent -= 1
+
+        self.position(node.pos_start)
+        self.emit(f'if {value} is None:')
+        self.indent += 1
+        if node.else_case:
+            else_value = yield node.else_case
+            self.emit(f'{value} = {else_value}')
+        else:
+            self.emit(f'{value} = Number(0).set_context(context)')
+        self.indent -= 1
+        return value
+
+    def generate_WhileNode(self, node):
+        self.position(node.pos_start)
+        for slot in node.saved_slots:
+            self.emit(f'saved.pop({slot}, None)')
+
+        elements = self.temp()
+        self.emit(f'{elements} = []')
+        self.emit('while True:')
+        self.indent += 1
+
+        condition = yield node.condition_node
+        self.emit(f'if not {condition}.is_true(): break')
+
+        for expr in node.body_node:
+            expr_value = yield expr
+            self.emit(f'{elements}.append({expr_value})')
+
+        self.indent -= 1
+        position = self.position(node.pos_start)
+        value = self.temp()
+        self.emit(f'{value} = List({elements}).set_context(context).set_pos({position})')
+        return value
+
+    def generate_SaveNode(self, node):
+        value = yield node.node
+        self.emit(f'saved[{node.slot}] = {value}')
+        return value
+
+    def generate_ReuseNode(self, node):
+        self.position(node.pos_start)
+        value = self.temp()
+        self.emit(f'{value} = saved.get({node.slot})')
+        self.emit(f'if {value} is None:')
+        self.indent += 1
+        computed = yield node.node
+        self.emit(f'saved[{node.slot}] = {computed}')
+        self.emit(f'{value} = {computed}')
+        self.indent -= 1
+        return value
+
+
+PythonCompiler.FILENAME = '<source-code>'
+
+# the deepest indentation the Python tokenizer accepts
+PythonCompiler.MAX_INDENT = 100
+
+PythonCompiler.BINARY_METHODS = {
+    Token.PLUS: 'add',
+    Token.MINUS: 'subtract',
+    Token.MUL: 'multiply',
+    Token.DIV: 'divide',
+    Token.MOD: 'modulo',
+    Token.CONCAT: 'concat',
+    Token.EE: 'get_comparison_eq',
+    Token.NE: 'get_comparison_ne',
+    Token.LT: 'get_comparison_lt',
+    Token.GT: 'get_comparison_gt',
+    Token.LTE: 'get_comparison_lte',
+    Token.GTE: 'get_comparison_gte',
+    TokenKind.AND: 'get_comparison_and',
+    TokenKind.OR: 'get_comparison_or'
+}
+
+PythonCompiler.DECIDE_METHODS = {
+    TokenKind.AND: 'decide_and',
+    TokenKind.OR: 'decide_or'
+}
+
+PythonCompiler.INPUT_VALUES = {
+    NumberNode: Number,
+    StringNode: String,
+    BoolNode: Bool
+}
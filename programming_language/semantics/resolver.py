@@ -0,0 +1,57 @@
+from programming_language.syntax.nodes import AndNode
+from programming_language.syntax.nodes import BinaryOperatorNode
+from programming_language.syntax.nodes import IfNode
+from programming_language.syntax.nodes import InputNode
+from programming_language.syntax.nodes import ListNode
+from programming_language.syntax.nodes import OrNode
+from programming_language.syntax.nodes import ReuseNode
+from programming_language.syntax.nodes import SaveNode
+from programming_language.syntax.nodes import TypedBinaryOperatorNode
+from programming_language.syntax.nodes import UnaryOperatorNode
+from programming_language.syntax.nodes import VarAccessNode
+from programming_language.syntax.nodes import VarAssignNode
+from programming_language.syntax.nodes import WhileNode
+
+class Resolver:
+
+    # gives every variable a slot of the frame the engines run on, the declared
+    # variables come first in declaration order, then the ones only assigned
+
+    def resolve(self, node, var_names):
+        slots = {}
+        for var_name in var_names:
+            slots.setdefault(var_name, len(slots))
+
+        for child in self.walk(node):
+            if type(child) in (VarAccessNode, VarAssignNode):
+                child.slot = slots.setdefault(child.var_name_token.value, len(slots))
+
+        return slots
+
+    def walk(self, node):
+        nodes = [node]
+
+        while nodes:
+            node = nodes.pop()
+            yield node
+
+            if type(node) is ListNode:
+                nodes.extend(reversed(node.element_nodes))
+            elif type(node) is InputNode:
+                nodes.append(node.value_node)
+            elif type(node) is VarAssignNode:
+                nodes.append(node.value_node)
+            elif type(node) in (BinaryOperatorNode, TypedBinaryOperatorNode, AndNode, OrNode):
+                nodes.extend((node.right_node, node.left_node))
+            elif type(node) is UnaryOperatorNode:
+                nodes.append(node.node)
+            elif type(node) is IfNode:
+                if node.else_case:
+                    nodes.append(node.else_case)
+                for condition, expr in reversed(node.cases):
+                    nodes.extend((expr, condition))
+            elif type(node) is WhileNode:
+                nodes.extend(reversed(node.body_node))
+                nodes.append(node.condition_node)
+            elif type(node) in (SaveNode, ReuseNode):
+                nodes.append(node.node)
@@ -3,6 +3,8 @@ from programming_language.semantics.value import Value
 
 class String(Value):
 
+    __slots__ = ('value',)
+
     def __init__(self, value):
         super().__init__()
         self.value = value
@@ -15,10 +17,13 @@ class String(Value):
 
     def concat(self, other):
         if isinstance(other, String) or isinstance(other, Number):
-            return String(self.value + str(other.value)).set_context(self.context), None
+            return self.concat_value(other), None
         else:
             return None, Value.illegal_operation(self, other)
 
+    def concat_value(self, other):
+        return String(self.value + str(other.value)).set_context(self.context)
+
     def copy(self):
         copy = String(self.value)
         copy.set_pos(self.pos_start)
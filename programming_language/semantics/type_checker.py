@@ -0,0 +1,434 @@
+from types import GeneratorType
+
+from programming_language.error_handler.error import IllegalTypeError
+from programming_language.lexical.token import Token
+from programming_language.lexical.token import TokenKind
+from programming_language.semantics.bool import Bool
+from programming_language.semantics.list import List
+from programming_language.semantics.number import Number
+from programming_language.semantics.string import String
+from programming_language.semantics.value import Value
+from programming_language.syntax.nodes import AndNode
+from programming_language.syntax.nodes import BinaryOperatorNode
+from programming_language.syntax.nodes import IfNode
+from programming_language.syntax.nodes import InputNode
+from programming_language.syntax.nodes import ListNode
+from programming_language.syntax.nodes import OrNode
+from programming_language.syntax.nodes import ReuseNode
+from programming_language.syntax.nodes import SaveNode
+from programming_language.syntax.nodes import TypedBinaryOperatorNode
+from programming_language.syntax.nodes import UnaryOperatorNode
+from programming_language.syntax.nodes import VarAssignNode
+from programming_language.syntax.nodes import WhileNode
+
+class TypeChecker:
+
+    # works out the class of the value every node gives, Value when it can be more than one
+    # and None when the node never gives one, a variable has the class of everything
+    # assigned to it, the inputs are bound with the class of their declared value
+
+    def __init__(self):
+        self.specialized = 0
+
+    def check(self, node):
+        # an operator whose operands can never go together fails wherever it runs,
+        # the first one in the source is reported before the program runs
+        self.infer(node)
+        errors = []
+
+        for child in self.nodes:
+            if type(child) in (BinaryOperatorNode, AndNode, OrNode):
+                error = self.check_binary(child)
+            elif type(child) is UnaryOperatorNode:
+                error = self.check_unary(child)
+            else:
+                continue
+            if error:
+                errors.append(error)
+
+        if not errors:
+            return None
+        return min(errors, key=lambda error: error.pos_start.index)
+
+    def check_binary(self, node):
+        left_type = self.types[id(node.left_node)]
+        right_type = self.types[id(node.right_node)]
+        if left_type in (None, Value) or right_type in (None, Value):
+            return None
+
+        operator = node.operator_token.type
+        if right_type in TypeChecker.BINARY_OPERANDS.get((left_type, operator), ()):
+            return None
+
+        return IllegalTypeError(
+            node.pos_start,
+            f"'{TypeChecker.SYMBOLS[operator]}' cannot be used on "
+            f"{TypeChecker.TYPE_NAMES[left_type]} and {TypeChecker.TYPE_NAMES[right_type]}"
+        )
+
+    def check_unary(self, node):
+        operand_type = self.types[id(node.node)]
+        if operand_type in (None, Value):
+            return None
+
+        operator = node.operator_token.type
+        if operator == Token.PLUS or operand_type in TypeChecker.UNARY_OPERANDS[operator]:
+            return None
+
+        return IllegalTypeError(
+            node.pos_start,
+            f"'{TypeChecker.SYMBOLS[operator]}' cannot be used on {TypeChecker.TYPE_NAMES[operand_type]}"
+        )
+
+    def specialize(self, node):
+        # operators whose operand classes are known call the method of that class that
+        # skips checking the other operand and making an error tuple
+        self.infer(node)
+        self.rewritten = {}
+        return self.rewrite(node)
+
+    def walk(self, node):
+        nodes = [node]
+
+        while nodes:
+            node = nodes.pop()
+            yield node
+
+            if type(node) is ListNode:
+                nodes.extend(node.element_nodes)
+            elif type(node) is InputNode:
+                nodes.append(node.value_node)
+            elif type(node) is VarAssignNode:
+                nodes.append(node.value_node)
+            elif type(node) in (BinaryOperatorNode, TypedBinaryOperatorNode, AndNode, OrNode):
+                nodes.extend((node.left_node, node.right_node))
+            elif type(node) is UnaryOperatorNode:
+                nodes.append(node.node)
+            elif type(node) is IfNode:
+                for condition, expr in node.cases:
+                    nodes.extend((condition, expr))
+                if node.else_case:
+                    nodes.append(node.else_case)
+            elif type(node) is WhileNode:
+                nodes.append(node.condition_node)
+                nodes.extend(node.body_node)
+            elif type(node) in (SaveNode, ReuseNode):
+                nodes.append(node.node)
+
+    def join(self, first, second):
+        if first == None:
+            return second
+        if second == None or first is second:
+            return first
+        if first in TypeChecker.NUMBERS and second in TypeChecker.NUMBERS:
+            return TypeChecker.MIXED_NUMBER
+        return Value
+
+    def infer(self, node):
+        # children come before their parents, the variables start with no class and
+        # take the classes assigned to them until nothing changes
+        self.nodes = list(self.walk(node))
+        self.nodes.reverse()
+        assigns = [child for child in self.nodes if type(child) is VarAssignNode]
+        infer_methods = {}
+        self.variables = {}
+
+        while True:
+            self.types = {}
+            for child in self.nodes:
+                method = infer_methods.get(type(child))
+                if method == None:
+                    method = infer_methods[type(child)] = getattr(self, f'infer_{type(child).__name__}', self.infer_value)
+                self.types[id(child)] = method(child)
+
+            variables = {}
+            for assign in assigns:
+                var_name = assign.var_name_token.value
+                variables[var_name] = self.join(variables.get(var_name), self.types[id(assign.value_node)])
+
+            if variables == self.variables:
+                return
+            self.variables = variables
+
+    def infer_value(self, node):
+        return Value
+
+    def infer_NumberNode(self, node):
+        # the Optimizer folds a comparison or an & of literals into a number holding text
+        if isinstance(node.token.value, str):
+            return TypeChecker.COMPARISON if node.token.value in Token.BOOL_VALUES else TypeChecker.CONCATENATION
+        return Number
+
+    def infer_StringNode(self, node):
+        # the & written as a value is a String without text
+        return String if isinstance(node.token.value, str) else Value
+
+    def infer_BoolNode(self, node):
+        return Bool
+
+    def infer_ListNode(self, node):
+        return List
+
+    def infer_InputNode(self, node):
+        return self.types[id(node.value_node)]
+
+    def infer_VarAccessNode(self, node):
+        return self.variables.get(node.var_name_token.value)
+
+    def infer_VarAssignNode(self, node):
+        return self.types[id(node.value_node)]
+
+    def infer_BinaryOperatorNode(self, node):
+        # every method of a class gives a value of one class whatever the other operand is
+        left_type = self.types[id(node.left_node)]
+        if left_type in (None, Value):
+            return left_type
+        return TypeChecker.BINARY_RESULTS[left_type].get(node.operator_token.type)
+
+    def infer_AndNode(self, node):
+        return self.infer_BinaryOperatorNode(node)
+
+    def infer_OrNode(self, node):
+        return self.infer_BinaryOperatorNode(node)
+
+    def infer_UnaryOperatorNode(self, node):
+        operand_type = self.types[id(node.node)]
+        operator = node.operator_token.type
+        if operand_type in (None, Value) or operator == Token.PLUS:
+            return operand_type
+        return TypeChecker.UNARY_RESULTS.get((operator, operand_type))
+
+    def infer_IfNode(self, node):
+        # an IF without a true case and without an ELSE gives Number(0)
+        value_type = self.types[id(node.else_case)] if node.else_case else Number
+        for condition, expr in node.cases:
+            value_type = self.join(value_type, self.types[id(expr)])
+        return value_type
+
+    def infer_WhileNode(self, node):
+        return List
+
+    def infer_SaveNode(self, node):
+        return self.types[id(node.node)]
+
+    def infer_ReuseNode(self, node):
+        return self.types[id(node.node)]
+
+    def rewrite(self, node):
+        # like Interpreter.visit, methods of nodes with children are generators that
+        # yield a child and receive its rewritten node
+        rewrites = []
+        result = self.rewrite_method(node)(node)
+
+        while True:
+            if type(result) is GeneratorType:
+                rewrites.append(result)
+                result = None
+            elif not rewrites:
+                return result
+
+            try:
+                node = rewrites[-1].send(result)
+            except StopIteration as stop:
+                rewrites.pop()
+                result = stop.value
+            else:
+                result = self.rewrite_method(node)(node)
+
+    def rewrite_method(self, node):
+        return getattr(self, f'rewrite_{type(node).__name__}', self.keep)
+
+    def keep(self, node):
+        return node
+
+    def rewrite_ListNode(self, node):
+        for index, element_node in enumerate(node.element_nodes):
+            node.element_nodes[index] = yield element_node
+        return node
+
+    def rewrite_VarAssignNode(self, node):
+        node.value_node = yield node.value_node
+        return node
+
+    def rewrite_BinaryOperatorNode(self, node):
+        # the cases of an IF share their condition, it is rewritten once
+        if id(node) in self.rewritten:
+            return self.rewritten[id(node)]
+
+        key = (self.types[id(node.left_node)], node.operator_token.type, self.types[id(node.right_node)])
+        node.left_node = yield node.left_node
+        node.right_node = yield node.right_node
+
+        operation = TypeChecker.OPERATIONS.get(key)
+        if operation != None:
+            self.specialized += 1
+            self.rewritten[id(node)] = TypedBinaryOperatorNode(node.left_node, node.operator_token, node.right_node, operation)
+        else:
+            self.rewritten[id(node)] = node
+        return self.rewritten[id(node)]
+
+    def rewrite_AndNode(self, node):
+        node.left_node = yield node.left_node
+        node.right_node = yield node.right_node
+        return node
+
+    def rewrite_OrNode(self, node):
+        return self.rewrite_AndNode(node)
+
+    def rewrite_UnaryOperatorNode(self, node):
+        node.node = yield node.node
+        return node
+
+    def rewrite_IfNode(self, node):
+        cases = []
+        for condition, expr in node.cases:
+            cases.append(((yield condition), (yield expr)))
+        node.cases = cases
+
+        if node.else_case:
+            node.else_case = yield node.else_case
+        return node
+
+    def rewrite_WhileNode(self, node):
+        node.condition_node = yield node.condition_node
+        for index, expr in enumerate(node.body_node):
+            node.body_node[index] = yield expr
+        return node
+
+    def rewrite_SaveNode(self, node):
+        node.node = yield node.node
+        return node
+
+    def rewrite_ReuseNode(self, node):
+        return self.rewrite_SaveNode(node)
+
+
+# a Number made by a comparison, AND, OR or NOT holds TRUE or FALSE and one made by & holds
+# text, they go wherever a Number goes but into arithmetic and are only ordered among themselves,
+# a variable given more than one of them holds a mixed number that is only checked against the rest
+TypeChecker.COMPARISON = 'COMPARISON'
+TypeChecker.CONCATENATION = 'CONCATENATION'
+TypeChecker.MIXED_NUMBER = 'MIXED_NUMBER'
+
+TypeChecker.TEXT_NUMBERS = (TypeChecker.COMPARISON, TypeChecker.CONCATENATION)
+TypeChecker.NUMBERS = (Number,) + TypeChecker.TEXT_NUMBERS + (TypeChecker.MIXED_NUMBER,)
+
+TypeChecker.ARITHMETIC_OPERATORS = (Token.PLUS, Token.MINUS, Token.MUL, Token.DIV, Token.MOD)
+TypeChecker.ORDER_OPERATORS = (Token.LT, Token.GT, Token.LTE, Token.GTE)
+TypeChecker.EQUALITY_OPERATORS = (Token.EE, Token.NE)
+TypeChecker.LOGIC_OPERATORS = (TokenKind.AND, TokenKind.OR)
+
+# the class of the value an operator gives for the class of its left operand
+TypeChecker.BINARY_RESULTS = {
+    Number: {operator: Number for operator in TypeChecker.ARITHMETIC_OPERATORS},
+    TypeChecker.COMPARISON: {},
+    TypeChecker.CONCATENATION: {},
+    TypeChecker.MIXED_NUMBER: {operator: Number for operator in TypeChecker.ARITHMETIC_OPERATORS},
+    String: {Token.CONCAT: String},
+    Bool: {TokenKind.AND: Bool, TokenKind.OR: Bool},
+    List: {Token.PLUS: List, Token.MINUS: List, Token.MUL: List, Token.DIV: Value}
+}
+
+# the classes of right operand an operator can work with for the class of its left operand
+TypeChecker.BINARY_OPERANDS = {}
+for operator in TypeChecker.ARITHMETIC_OPERATORS:
+    TypeChecker.BINARY_OPERANDS[(Number, operator)] = (Number, TypeChecker.MIXED_NUMBER)
+    TypeChecker.BINARY_OPERANDS[(TypeChecker.MIXED_NUMBER, operator)] = (Number, TypeChecker.MIXED_NUMBER)
+TypeChecker.BINARY_OPERANDS.update({
+    (String, Token.CONCAT): (String,) + TypeChecker.NUMBERS,
+    (Bool, TokenKind.AND): (Bool,),
+    (Bool, TokenKind.OR): (Bool,),
+    (List, Token.PLUS): TypeChecker.NUMBERS + (String, Bool, List),
+    (List, Token.MINUS): TypeChecker.NUMBERS,
+    (List, Token.MUL): (List,),
+    (List, Token.DIV): TypeChecker.NUMBERS
+})
+
+for number_type in TypeChecker.NUMBERS:
+    if number_type is TypeChecker.MIXED_NUMBER:
+        ordered_types = TypeChecker.NUMBERS
+    elif number_type is Number:
+        ordered_types = (Number, TypeChecker.MIXED_NUMBER)
+    else:
+        ordered_types = TypeChecker.TEXT_NUMBERS + (TypeChecker.MIXED_NUMBER,)
+    TypeChecker.BINARY_RESULTS[number_type][Token.CONCAT] = TypeChecker.CONCATENATION
+    TypeChecker.BINARY_OPERANDS[(number_type, Token.CONCAT)] = TypeChecker.NUMBERS + (String, Bool)
+    for operator in TypeChecker.ORDER_OPERATORS:
+        TypeChecker.BINARY_RESULTS[number_type][operator] = TypeChecker.COMPARISON
+        TypeChecker.BINARY_OPERANDS[(number_type, operator)] = ordered_types
+    for operator in TypeChecker.EQUALITY_OPERATORS + TypeChecker.LOGIC_OPERATORS:
+        TypeChecker.BINARY_RESULTS[number_type][operator] = TypeChecker.COMPARISON
+        TypeChecker.BINARY_OPERANDS[(number_type, operator)] = TypeChecker.NUMBERS
+
+TypeChecker.UNARY_OPERANDS = {
+    Token.MINUS: (Number, TypeChecker.MIXED_NUMBER),
+    TokenKind.NOT: TypeChecker.NUMBERS + (Bool,)
+}
+
+# NOT compares a number with FALSE and gives a comparison
+TypeChecker.UNARY_RESULTS = {(TokenKind.NOT, number_type): TypeChecker.COMPARISON for number_type in TypeChecker.NUMBERS}
+TypeChecker.UNARY_RESULTS.update({
+    (Token.MINUS, Number): Number,
+    (Token.MINUS, TypeChecker.MIXED_NUMBER): Number,
+    (TokenKind.NOT, Bool): Bool
+})
+
+# division keeps its check for zero, a List is left to the generic methods
+TypeChecker.OPERATIONS = {
+    (Number, Token.PLUS, Number): Number.add_number,
+    (Number, Token.MINUS, Number): Number.subtract_number,
+    (Number, Token.MUL, Number): Number.multiply_number,
+    (Number, Token.MOD, Number): Number.modulo_number,
+    (String, Token.CONCAT, String): String.concat_value,
+    (Bool, TokenKind.AND, Bool): Bool.get_comparison_and_bool,
+    (Bool, TokenKind.OR, Bool): Bool.get_comparison_or_bool
+}
+
+# the methods of a Number that work on any Number, whatever it holds, a mixed number is left
+# to the generic methods
+TypeChecker.NUMBER_OPERATIONS = {
+    Token.CONCAT: Number.concat_value,
+    Token.EE: Number.get_comparison_eq_number,
+    Token.NE: Number.get_comparison_ne_number,
+    Token.LT: Number.get_comparison_lt_number,
+    Token.GT: Number.get_comparison_gt_number,
+    Token.LTE: Number.get_comparison_lte_number,
+    Token.GTE: Number.get_comparison_gte_number,
+    TokenKind.AND: Number.get_comparison_and_number,
+    TokenKind.OR: Number.get_comparison_or_number
+}
+
+for number_type in (Number,) + TypeChecker.TEXT_NUMBERS:
+    TypeChecker.OPERATIONS[(String, Token.CONCAT, number_type)] = String.concat_value
+    for operator, operation in TypeChecker.NUMBER_OPERATIONS.items():
+        for right_type in TypeChecker.BINARY_OPERANDS[(number_type, operator)]:
+            if right_type is not TypeChecker.MIXED_NUMBER:
+                TypeChecker.OPERATIONS[(number_type, operator, right_type)] = operation
+
+TypeChecker.SYMBOLS = {
+    Token.PLUS: '+',
+    Token.MINUS: '-',
+    Token.MUL: '*',
+    Token.DIV: '/',
+    Token.MOD: '%',
+    Token.CONCAT: '&',
+    Token.EE: '==',
+    Token.NE: '<>',
+    Token.LT: '<',
+    Token.GT: '>',
+    Token.LTE: '<=',
+    Token.GTE: '>=',
+    TokenKind.AND: 'AND',
+    TokenKind.OR: 'OR',
+    TokenKind.NOT: 'NOT'
+}
+
+TypeChecker.TYPE_NAMES = {
+    Number: 'a number',
+    TypeChecker.COMPARISON: 'a comparison',
+    TypeChecker.CONCATENATION: 'a number joined with &',
+    TypeChecker.MIXED_NUMBER: 'a number',
+    String: 'a CHAR',
+    Bool: 'a BOOL',
+    List: 'a list'
+}
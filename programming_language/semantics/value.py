@@ -3,6 +3,11 @@ from programming_language.semantics.runtime_result import RuntimeResult
 
 class Value:
 
+    # a value is not changed once it is made, set_pos and set_context are only called
+    # on a new value, so variables and saved values can be read without a copy
+
+    __slots__ = ('pos_start', 'context')
+
     def __init__(self):
         self.set_pos()
         self.set_context()
@@ -57,6 +62,13 @@ class Value:
     def get_comparison_or(self, other):
         return None, self.illegal_operation(other)
 
+    def decide_and(self):
+        # the value of AND when this left operand decides it, None when the right operand is needed
+        return None
+
+    def decide_or(self):
+        return None
+
     def execute(self, args):
         return RuntimeResult().failure(self.illegal_operation())
 
@@ -66,10 +78,18 @@ class Value:
     def is_true(self):
         return False
 
+    def locate(self, error, read_pos):
+        # a value read without a copy keeps the position it was made at, an error
+        # about it points at the node that read it, read_pos is None for a node that
+        # made the value itself
+        if error.pos_start is self.pos_start and read_pos != None:
+            error.pos_start = read_pos
+        return error
+
     def illegal_operation(self, other=None):
         if not other: other = self
         return RuntimeError(
             self.pos_start,
             'Illegal operation',
             self.context
-        )
\ No newline at end of file
+        )
@@ -0,0 +1,167 @@
+from programming_language.error_handler.error import RuntimeError
+from programming_language.semantics.bool import Bool
+from programming_language.semantics.bytecode import APPEND
+from programming_language.semantics.bytecode import BINARY
+from programming_language.semantics.bytecode import BOOL
+from programming_language.semantics.bytecode import Code
+from programming_language.semantics.bytecode import DECIDE_AND
+from programming_language.semantics.bytecode import DECIDE_OR
+from programming_language.semantics.bytecode import FORGET
+from programming_language.semantics.bytecode import INPUT
+from programming_language.semantics.bytecode import JUMP
+from programming_language.semantics.bytecode import JUMP_IF_FALSE
+from programming_language.semantics.bytecode import JUMP_IF_VALUE
+from programming_language.semantics.bytecode import LOAD
+from programming_language.semantics.bytecode import MAKE_LIST
+from programming_language.semantics.bytecode import NEGATE
+from programming_language.semantics.bytecode import NEW_LIST
+from programming_language.semantics.bytecode import NONE
+from programming_language.semantics.bytecode import NOT
+from programming_language.semantics.bytecode import NUMBER
+from programming_language.semantics.bytecode import POP
+from programming_language.semantics.bytecode import REUSE
+from programming_language.semantics.bytecode import SAVE
+from programming_language.semantics.bytecode import STORE
+from programming_language.semantics.bytecode import STRING
+from programming_language.semantics.bytecode import TYPED
+from programming_language.semantics.bytecode import ZERO
+from programming_language.semantics.list import List
+from programming_language.semantics.number import Number
+from programming_language.semantics.operations import BINARY_OPERATIONS
+from programming_language.semantics.string import String
+from programming_language.syntax.nodes import BoolNode
+from programming_language.syntax.nodes import NumberNode
+from programming_language.syntax.nodes import StringNode
+
+class VirtualMachine:
+
+    def run(self, code, context):
+        ops = code.ops
+        args = code.args
+        positions = code.positions
+        constants = code.constants
+        binary_operations = VirtualMachine.BINARY_OPERATIONS
+        variables = context.frame
+        saved = context.saved
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        pc = 0
+        end = len(ops)
+
+        # the most frequent instructions are tested first
+        while pc < end:
+            op = ops[pc]
+            arg = args[pc]
+            pos_start = positions[pc]
+            pc += 1
+
+            if op == LOAD:
+                value = variables[arg]
+                if value is None:
+                    return None, RuntimeError(
+                        pos_start,
+                        f"'{code.names[arg]}' is not defined",
+                        context
+                    )
+                push(value)
+            elif op == NUMBER:
+                value = Number(constants[arg])
+                value.context = context
+                value.pos_start = pos_start
+                push(value)
+            elif op == TYPED:
+                right = pop()
+                answer = constants[arg](stack[-1], right)
+                answer.pos_start = pos_start
+                stack[-1] = answer
+            elif op == BINARY:
+                right = pop()
+                answer, error = binary_operations[arg](stack[-1], right)
+                if error:
+                    return None, self.locate(code, pc - 1, error, stack[-1], right)
+                answer.pos_start = pos_start
+                stack[-1] = answer
+            elif op == STORE:
+                variables[arg] = stack[-1]
+            elif op == JUMP_IF_FALSE:
+                if not pop().is_true():
+                    pc = arg
+            elif op == JUMP:
+                pc = arg
+            elif op == POP:
+                pop()
+            elif op == APPEND:
+                value = pop()
+                stack[-1].append(value)
+            elif op == REUSE:
+                value = saved.get(arg)
+                if value == None:
+                    pc += 1
+                else:
+                    push(value)
+            elif op == SAVE:
+                saved[arg] = stack[-1]
+            elif op == DECIDE_AND:
+                answer = stack[-1].decide_and()
+                if answer is not None:
+                    answer.pos_start = pos_start
+                    stack[-1] = answer
+                    pc = arg
+            elif op == DECIDE_OR:
+                answer = stack[-1].decide_or()
+                if answer is not None:
+                    answer.pos_start = pos_start
+                    stack[-1] = answer
+                    pc = arg
+            elif op == STRING:
+                push(String(constants[arg]).set_context(context).set_pos(pos_start))
+            elif op == BOOL:
+                push(Bool(constants[arg]).set_context(context).set_pos(pos_start))
+            elif op == NONE:
+                push(None)
+            elif op == JUMP_IF_VALUE:
+                if stack[-1] != None:
+                    pc = arg
+            elif op == ZERO:
+                push(Number(0).set_context(context))
+            elif op == NEW_LIST:
+                push([])
+            elif op == MAKE_LIST:
+                stack[-1] = List(stack[-1]).set_context(context).set_pos(pos_start)
+            elif op == NEGATE:
+                answer, error = stack[-1].multiply(Number(-1))
+                if error:
+                    return None, self.locate(code, pc - 1, error, stack[-1])
+                stack[-1] = answer.set_pos(pos_start)
+            elif op == NOT:
+                answer, error = stack[-1].get_comparison_not()
+                if error:
+                    return None, self.locate(code, pc - 1, error, stack[-1])
+                stack[-1] = answer.set_pos(pos_start)
+            elif op == FORGET:
+                saved.pop(arg, None)
+            elif op == INPUT:
+                if context.inputs and context.inputs[arg] != None:
+                    node = context.inputs[arg]
+                    push(VirtualMachine.INPUT_VALUES[type(node)](node.token.value).set_context(context).set_pos(node.pos_start))
+                    # the declared value is not evaluated
+                    pc += 1
+            else:
+                raise Exception(f'Unknown opcode {op} at {pc - 1}')
+
+        return stack.pop(), None
+
+    def locate(self, code, index, error, *operands):
+        for value, read_pos in zip(operands, code.operand_positions[index]):
+            error = value.locate(error, read_pos)
+        return error
+
+
+VirtualMachine.BINARY_OPERATIONS = tuple(BINARY_OPERATIONS[kind] for kind in Code.BINARY_OPERATORS)
+
+VirtualMachine.INPUT_VALUES = {
+    NumberNode: Number,
+    StringNode: String,
+    BoolNode: Bool
+}
@@ -0,0 +1,9 @@
+class ExpressionFrame:
+    __slots__ = ('min_power', 'comparison_operand', 'nodes', 'operators', 'powers')
+
+    def __init__(self, min_power, comparison_operand):
+        self.min_power = min_power
+        self.comparison_operand = comparison_operand
+        self.nodes = []
+        self.operators = []
+        self.powers = []
@@ -0,0 +1,221 @@
+import re
+
+from programming_language.lexical.token import TokenKind
+
+class Grammar:
+
+    def __init__(self, text):
+        self.rules = {}
+        self.errors = {}
+        self.externals = {}
+        self.conflicts = []
+        self.read_rules(text)
+        self.nullable = set()
+        self.first = {name: set() for name in self.rules}
+        self.follow = {name: set() for name in self.rules}
+        self.make_first_sets()
+        self.make_follow_sets()
+
+    def read_rules(self, text):
+        name = None
+
+        for line in text.splitlines():
+            stripped = line.strip()
+            if not stripped or stripped.startswith('#'):
+                continue
+
+            if stripped.startswith('%external'):
+                external, kinds = stripped[len('%external'):].split(':', 1)
+                self.externals[external.strip()] = set(self.kind(kind) for kind in kinds.split())
+            elif stripped.startswith('|'):
+                self.rules[name].append(self.read_alternative(stripped[1:]))
+            elif stripped.startswith('!'):
+                self.errors[name] = self.read_message(stripped[1:].strip())
+            else:
+                name, alternative = line.split(':', 1)
+                name = name.strip()
+                if name in self.rules:
+                    raise ValueError(f"'{name}' is defined twice")
+                self.rules[name] = [self.read_alternative(alternative)]
+
+        for alternatives in self.rules.values():
+            for lookahead, symbols in alternatives:
+                for symbol in symbols:
+                    if symbol[0] == 'N' and symbol[1] not in self.rules:
+                        raise ValueError(f"'{symbol[1]}' is not defined")
+
+    def read_alternative(self, text):
+        lookahead = None
+        symbols = []
+
+        for part in Grammar.SYMBOL.findall(text):
+            if part.startswith('"'):
+                if not symbols or symbols[-1][0] not in ('T', 'X'):
+                    raise ValueError(f'{part} does not follow a token or an external symbol')
+                symbols[-1] = symbols[-1][:3] + (self.read_message(part),)
+            elif part.startswith('['):
+                lookahead = set(self.kind(kind) for kind in part[1:-1].split())
+            elif part.startswith('{'):
+                symbols.append(('A', part[1:-1]))
+            elif part[0].isupper():
+                kind = self.kind(part.rstrip('^'))
+                symbols.append(('T', kind, part.endswith('^'), f"Expected '{part.rstrip('^')}'"))
+            elif part in self.externals:
+                symbols.append(('X', part, False, None))
+            else:
+                symbols.append(('N', part))
+
+        return lookahead, symbols
+
+    def read_message(self, text):
+        if not (len(text) > 1 and text.startswith('"') and text.endswith('"')):
+            raise ValueError(f'{text} is not a quoted message')
+        return text[1:-1]
+
+    def kind(self, name):
+        if not hasattr(TokenKind, name):
+            raise ValueError(f"'{name}' is not a token kind")
+        return name
+
+    def make_first_sets(self):
+        changed = True
+        while changed:
+            changed = False
+            for name, alternatives in self.rules.items():
+                for lookahead, symbols in alternatives:
+                    if lookahead != None:
+                        first, nullable = lookahead, False
+                    else:
+                        first, nullable = self.first_of(symbols)
+                    if not first <= self.first[name]:
+                        self.first[name] |= first
+                        changed = True
+                    if nullable and name not in self.nullable:
+                        self.nullable.add(name)
+                        changed = True
+
+    def first_of(self, symbols):
+        first = set()
+        for symbol in symbols:
+            if symbol[0] == 'T':
+                first.add(symbol[1])
+                return first, False
+            elif symbol[0] == 'X':
+                first |= self.externals[symbol[1]]
+                return first, False
+            elif symbol[0] == 'N':
+                first |= self.first[symbol[1]]
+                if symbol[1] not in self.nullable:
+                    return first, False
+        return first, True
+
+    def make_follow_sets(self):
+        changed = True
+        while changed:
+            changed = False
+            for name, alternatives in self.rules.items():
+                for lookahead, symbols in alternatives:
+                    for index, symbol in enumerate(symbols):
+                        if symbol[0] != 'N': continue
+                        follow, nullable = self.first_of(symbols[index + 1:])
+                        if nullable:
+                            follow |= self.follow[name]
+                        if not follow <= self.follow[symbol[1]]:
+                            self.follow[symbol[1]] |= follow
+                            changed = True
+
+    def predict(self, name, lookahead, symbols):
+        if lookahead != None:
+            return lookahead
+        first, nullable = self.first_of(symbols)
+        if nullable:
+            first |= self.follow[name]
+        return first
+
+    def make_table(self):
+        productions = []
+        table = []
+        self.conflicts = []
+
+        for name, alternatives in self.rules.items():
+            row = {}
+            empty = None
+
+            for lookahead, symbols in alternatives:
+                production = len(productions)
+                productions.append(symbols)
+                # the earlier alternative wins a shared lookahead, like the hand-written checks did
+                for kind in sorted(self.predict(name, lookahead, symbols)):
+                    if kind in row:
+                        self.conflicts.append((name, kind))
+                    else:
+                        row[kind] = production
+                if lookahead == None and self.first_of(symbols)[1]:
+                    empty = production
+
+            # without an error message any other token takes the empty or the last alternative
+            if name in self.errors:
+                default = None
+            elif empty != None:
+                default = empty
+            else:
+                default = production
+            table.append((default, {kind: production for kind, production in row.items() if production != default}))
+
+        return productions, table
+
+    def start_symbols(self):
+        used = set()
+        for alternatives in self.rules.values():
+            for lookahead, symbols in alternatives:
+                used.update(symbol[1] for symbol in symbols if symbol[0] == 'N')
+        return [name for name in self.rules if name not in used]
+
+    def generate(self):
+        productions, table = self.make_table()
+        names = list(self.rules)
+        lines = [
+            '# Generated from grammar.txt by `python manage.py generate_parser`, do not edit.',
+            '',
+            'from programming_language.lexical.token import TokenKind',
+            '',
+            'MATCH   = 0',
+            'CAPTURE = 1',
+            'PREDICT = 2',
+            'EXPR    = 3',
+            'ACTION  = 4',
+            '',
+            'START_SYMBOLS = {'
+        ]
+        lines.extend(f'    {name!r}: {names.index(name)},' for name in self.start_symbols())
+        lines.append('}')
+
+        lines.extend(['', '# (default production, {token kind: production}) for every nonterminal', 'TABLE = ('])
+        for name, (default, row) in zip(names, table):
+            entries = ', '.join(f'TokenKind.{kind}: {production}' for kind, production in row.items())
+            lines.append(f'    ({default}, {{{entries}}}),  # {name}')
+        lines.append(')')
+
+        lines.extend(['', '# error reported when a nonterminal has no production for the token', 'ERRORS = ('])
+        lines.extend(f'    {self.errors.get(name)!r},  # {name}' for name in names)
+        lines.append(')')
+
+        lines.extend(['', '# the symbols of every production in reverse order, ready to be pushed on the stack', 'PRODUCTIONS = ('])
+        for symbols in productions:
+            instructions = []
+            for symbol in reversed(symbols):
+                if symbol[0] == 'T':
+                    instructions.append(f"({'CAPTURE' if symbol[2] else 'MATCH'}, TokenKind.{symbol[1]}, {symbol[3]!r})")
+                elif symbol[0] == 'X':
+                    instructions.append(f'(EXPR, None, {symbol[3]!r})')
+                elif symbol[0] == 'N':
+                    instructions.append(f'(PREDICT, {names.index(symbol[1])}, None)')
+                else:
+                    instructions.append(f'(ACTION, {symbol[1]!r}, None)')
+            lines.append(f"    ({', '.join(instructions)}{',' if len(instructions) == 1 else ''}),")
+        lines.append(')')
+
+        return '\n'.join(lines) + '\n'
+
+
+Grammar.SYMBOL = re.compile(r'"[^"]*"|\[[^\]]*\]|\{[\w-]+\}|[A-Z_]+\^?|[a-z][a-z-]*')
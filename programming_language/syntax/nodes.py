@@ -35,10 +35,19 @@ class ListNode:
 
         self.pos_start = pos_start
 
+class InputNode:
+
+    def __init__(self, slot, value_node):
+        self.slot = slot
+        self.value_node = value_node
+
+        self.pos_start = self.value_node.pos_start
+
 class VarAccessNode:
 
     def __init__(self, var_name_token):
         self.var_name_token = var_name_token
+        self.slot = None
 
         self.pos_start = self.var_name_token.pos_start
 
@@ -47,6 +56,7 @@ class VarAssignNode:
     def __init__(self, var_name_token, value_node):
         self.var_name_token = var_name_token
         self.value_node = value_node
+        self.slot = None
 
         self.pos_start = self.var_name_token.pos_start
 
@@ -62,6 +72,48 @@ class BinaryOperatorNode:
     def __repr__(self):
         return f'({self.left_node}, {self.operator_token}, {self.right_node})'
 
+class TypedBinaryOperatorNode:
+
+    # an operator whose operands are known to be of one class, the operation
+    # is the method of that class that skips checking the other operand
+
+    def __init__(self, left_node, operator_token, right_node, operation):
+        self.left_node = left_node
+        self.operator_token = operator_token
+        self.right_node = right_node
+        self.operation = operation
+
+        self.pos_start = self.left_node.pos_start
+    
+    def __repr__(self):
+        return f'({self.left_node}, {self.operator_token}, {self.right_node})'
+
+class AndNode:
+
+    # AND and OR only evaluate the right operand when the left one does not decide the value
+
+    def __init__(self, left_node, operator_token, right_node):
+        self.left_node = left_node
+        self.operator_token = operator_token
+        self.right_node = right_node
+
+        self.pos_start = self.left_node.pos_start
+    
+    def __repr__(self):
+        return f'({self.left_node}, {self.operator_token}, {self.right_node})'
+
+class OrNode:
+
+    def __init__(self, left_node, operator_token, right_node):
+        self.left_node = left_node
+        self.operator_token = operator_token
+        self.right_node = right_node
+
+        self.pos_start = self.left_node.pos_start
+    
+    def __repr__(self):
+        return f'({self.left_node}, {self.operator_token}, {self.right_node})'
+
 class UnaryOperatorNode:
 
     def __init__(self, operator_token, node):
@@ -86,5 +138,31 @@ class WhileNode:
     def __init__(self, condition_node, body_node):
         self.condition_node = condition_node
         self.body_node = body_node
+        self.saved_slots = ()
+
+        self.pos_start = self.condition_node.pos_start
+
+class SaveNode:
+
+    def __init__(self, slot, node):
+        self.slot = slot
+        self.node = node
+
+        self.pos_start = self.node.pos_start
+
+class ReuseNode:
+
+    def __init__(self, slot, node):
+        self.slot = slot
+        self.node = node
+
+        self.pos_start = self.node.pos_start
+
+
+# the nodes that give a value made somewhere else
+READ_NODES = (VarAccessNode, UnaryOperatorNode, ReuseNode)
 
-        self.pos_start = self.condition_node.pos_start
\ No newline at end of file
+def read_position(node):
+    # the position Value.locate moves an error about the value of the node to, None
+    # when the node made the value itself
+    return node.pos_start if type(node) in READ_NODES else None
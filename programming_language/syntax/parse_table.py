@@ -0,0 +1,142 @@
+# Generated from grammar.txt by `python manage.py generate_parser`, do not edit.
+
+from programming_language.lexical.token import TokenKind
+
+MATCH   = 0
+CAPTURE = 1
+PREDICT = 2
+EXPR    = 3
+ACTION  = 4
+
+START_SYMBOLS = {
+    'parse': 0,
+    'if-expr': 19,
+    'while-expr': 26,
+}
+
+# (default production, {token kind: production}) for every nonterminal
+TABLE = (
+    (0, {}),  # parse
+    (None, {TokenKind.START: 1, TokenKind.VAR: 2}),  # statements
+    (None, {TokenKind.NEWLINE: 3, TokenKind.COMMENT: 4, TokenKind.START: 5, TokenKind.EOL: 6}),  # var-rest
+    (None, {TokenKind.START: 7, TokenKind.VAR: 8}),  # var-more
+    (9, {}),  # var-statement
+    (None, {TokenKind.COMMA: 10, TokenKind.AS: 11}),  # var-assigns
+    (12, {}),  # var-assign
+    (14, {TokenKind.EQUAL: 13}),  # var-value
+    (None, {TokenKind.INT: 15, TokenKind.FLOAT: 16, TokenKind.CHAR: 17, TokenKind.BOOL: 18, TokenKind.IDENTIFIER: 19}),  # var-literal
+    (20, {}),  # block
+    (22, {TokenKind.OUTPUT: 21}),  # block-start
+    (25, {TokenKind.NEWLINE: 23, TokenKind.COMMENT: 24}),  # block-loop
+    (27, {TokenKind.OUTPUT: 26}),  # block-end
+    (29, {TokenKind.OUTPUT: 28}),  # block-more
+    (31, {TokenKind.EOL: 30, TokenKind.STOP: 30}),  # block-more-end
+    (32, {}),  # block-stop
+    (33, {}),  # output-statement
+    (34, {}),  # statement
+    (None, {TokenKind.IDENTIFIER: 35, TokenKind.AND: 36, TokenKind.AS: 36, TokenKind.BOOL: 36, TokenKind.ELIF: 36, TokenKind.ELSE: 36, TokenKind.FALSE: 36, TokenKind.IF: 36, TokenKind.NOT: 36, TokenKind.OR: 36, TokenKind.OUTPUT: 36, TokenKind.START: 36, TokenKind.STOP: 36, TokenKind.TRUE: 36, TokenKind.VAR: 36, TokenKind.WHILE: 36}),  # statement-start
+    (37, {}),  # if-expr
+    (38, {}),  # if-case
+    (39, {}),  # case-statements
+    (41, {TokenKind.STOP: 40}),  # case-more
+    (44, {TokenKind.ELIF: 42, TokenKind.ELSE: 43}),  # if-next
+    (45, {}),  # else-statements
+    (47, {TokenKind.STOP: 46}),  # else-more
+    (48, {}),  # while-expr
+    (49, {}),  # while-statements
+    (51, {TokenKind.STOP: 50}),  # while-more
+    (54, {TokenKind.NEWLINE: 52, TokenKind.COMMENT: 53}),  # skip
+)
+
+# error reported when a nonterminal has no production for the token
+ERRORS = (
+    None,  # parse
+    "Expected 'VAR'",  # statements
+    "Expected 'START'",  # var-rest
+    "Expected 'VAR'",  # var-more
+    None,  # var-statement
+    "Expected 'AS'",  # var-assigns
+    None,  # var-assign
+    None,  # var-value
+    'Expected int, float, char, bool, or identifier',  # var-literal
+    None,  # block
+    None,  # block-start
+    None,  # block-loop
+    None,  # block-end
+    None,  # block-more
+    None,  # block-more-end
+    None,  # block-stop
+    None,  # output-statement
+    None,  # statement
+    'Expected identifier',  # statement-start
+    None,  # if-expr
+    None,  # if-case
+    None,  # case-statements
+    None,  # case-more
+    None,  # if-next
+    None,  # else-statements
+    None,  # else-more
+    None,  # while-expr
+    None,  # while-statements
+    None,  # while-more
+    None,  # skip
+)
+
+# the symbols of every production in reverse order, ready to be pushed on the stack
+PRODUCTIONS = (
+    ((MATCH, TokenKind.EOL, 'Invalid statement'), (ACTION, 'end_statements', None), (PREDICT, 1, None), (PREDICT, 29, None), (ACTION, 'statements', None)),
+    ((PREDICT, 9, None),),
+    ((PREDICT, 2, None), (PREDICT, 4, None)),
+    ((PREDICT, 3, None), (PREDICT, 29, None), (MATCH, TokenKind.NEWLINE, "Expected 'NEWLINE'")),
+    ((PREDICT, 3, None), (PREDICT, 29, None), (MATCH, TokenKind.COMMENT, "Expected 'COMMENT'")),
+    ((PREDICT, 9, None),),
+    (),
+    ((PREDICT, 9, None),),
+    ((PREDICT, 2, None), (PREDICT, 4, None)),
+    ((ACTION, 'extend', None), (PREDICT, 5, None), (PREDICT, 6, None), (ACTION, 'declarations', None), (MATCH, TokenKind.VAR, "Expected 'VAR'")),
+    ((PREDICT, 5, None), (PREDICT, 6, None), (MATCH, TokenKind.COMMA, "Expected 'COMMA'")),
+    ((ACTION, 'declare', None), (CAPTURE, TokenKind.DATA_TYPE, "Invalid 'DATA_TYPE'"), (MATCH, TokenKind.AS, "Expected 'AS'")),
+    ((ACTION, 'variable', None), (PREDICT, 7, None), (CAPTURE, TokenKind.IDENTIFIER, 'Expected identifier')),
+    ((PREDICT, 8, None), (MATCH, TokenKind.EQUAL, "Expected 'EQUAL'")),
+    ((ACTION, 'no_value', None),),
+    ((CAPTURE, TokenKind.INT, "Expected 'INT'"),),
+    ((CAPTURE, TokenKind.FLOAT, "Expected 'FLOAT'"),),
+    ((CAPTURE, TokenKind.CHAR, "Expected 'CHAR'"),),
+    ((CAPTURE, TokenKind.BOOL, "Expected 'BOOL'"),),
+    ((CAPTURE, TokenKind.IDENTIFIER, "Expected 'IDENTIFIER'"),),
+    ((PREDICT, 10, None), (PREDICT, 29, None), (MATCH, TokenKind.NEWLINE, "Expected 'NEWLINE'"), (MATCH, TokenKind.START, "Expected 'START'"), (ACTION, 'block', None)),
+    ((PREDICT, 15, None), (PREDICT, 16, None)),
+    ((PREDICT, 11, None), (ACTION, 'append', None), (PREDICT, 17, None)),
+    ((PREDICT, 13, None), (PREDICT, 29, None), (MATCH, TokenKind.NEWLINE, "Expected 'NEWLINE'")),
+    ((PREDICT, 13, None), (PREDICT, 29, None), (MATCH, TokenKind.COMMENT, "Expected 'COMMENT'")),
+    ((PREDICT, 12, None),),
+    ((PREDICT, 15, None), (PREDICT, 16, None)),
+    ((PREDICT, 15, None),),
+    ((PREDICT, 14, None), (PREDICT, 16, None)),
+    ((PREDICT, 14, None),),
+    ((PREDICT, 15, None),),
+    ((PREDICT, 11, None), (ACTION, 'append', None), (PREDICT, 17, None)),
+    ((PREDICT, 29, None), (MATCH, TokenKind.STOP, "Expected 'STOP'")),
+    ((MATCH, TokenKind.NEWLINE, "Expected 'NEWLINE'"), (ACTION, 'output', None), (EXPR, None, 'Invalid output statement'), (MATCH, TokenKind.COLON, "Expected 'COLON'"), (CAPTURE, TokenKind.OUTPUT, "Expected 'OUTPUT'")),
+    ((PREDICT, 18, None), (PREDICT, 29, None)),
+    ((ACTION, 'assign', None), (EXPR, None, 'Invalid statement'), (MATCH, TokenKind.EQUAL, "Expected '='"), (CAPTURE, TokenKind.IDENTIFIER, "Expected 'IDENTIFIER'")),
+    ((EXPR, None, 'Invalid expr'),),
+    ((ACTION, 'end_if', None), (PREDICT, 20, None), (ACTION, 'if', None), (MATCH, TokenKind.IF, "Expected 'IF'")),
+    ((PREDICT, 23, None), (ACTION, 'end_case', None), (PREDICT, 29, None), (MATCH, TokenKind.NEWLINE, "Expected 'NEWLINE'"), (PREDICT, 21, None), (PREDICT, 29, None), (MATCH, TokenKind.NEWLINE, "Expected 'NEWLINE'"), (MATCH, TokenKind.START, "Expected 'START'"), (PREDICT, 29, None), (MATCH, TokenKind.NEWLINE, "Expected 'NEWLINE'"), (EXPR, None, None)),
+    ((PREDICT, 22, None), (PREDICT, 29, None), (MATCH, TokenKind.NEWLINE, "Expected 'NEWLINE'"), (ACTION, 'case', None), (PREDICT, 17, None)),
+    ((MATCH, TokenKind.STOP, "Expected 'STOP'"),),
+    ((PREDICT, 21, None),),
+    ((PREDICT, 20, None), (MATCH, TokenKind.ELIF, "Expected 'ELIF'")),
+    ((PREDICT, 29, None), (MATCH, TokenKind.NEWLINE, "Expected 'NEWLINE'"), (PREDICT, 24, None), (PREDICT, 29, None), (MATCH, TokenKind.NEWLINE, "Expected 'NEWLINE'"), (MATCH, TokenKind.START, "Expected 'START'"), (PREDICT, 29, None), (MATCH, TokenKind.NEWLINE, "Expected 'NEWLINE'"), (MATCH, TokenKind.ELSE, "Expected 'ELSE'")),
+    (),
+    ((PREDICT, 25, None), (PREDICT, 29, None), (MATCH, TokenKind.NEWLINE, "Expected 'NEWLINE'"), (ACTION, 'else', None), (PREDICT, 17, None)),
+    ((MATCH, TokenKind.STOP, "Expected 'STOP'"),),
+    ((PREDICT, 24, None),),
+    ((ACTION, 'while', None), (PREDICT, 29, None), (MATCH, TokenKind.NEWLINE, "Expected 'NEWLINE'"), (PREDICT, 27, None), (ACTION, 'body', None), (PREDICT, 29, None), (MATCH, TokenKind.NEWLINE, "Expected 'NEWLINE'"), (MATCH, TokenKind.START, "Expected 'START'"), (PREDICT, 29, None), (MATCH, TokenKind.NEWLINE, "Expected 'NEWLINE'"), (EXPR, None, None), (MATCH, TokenKind.WHILE, "Expected 'WHILE'")),
+    ((PREDICT, 28, None), (PREDICT, 29, None), (MATCH, TokenKind.NEWLINE, "Expected 'NEWLINE'"), (ACTION, 'append', None), (PREDICT, 17, None)),
+    ((MATCH, TokenKind.STOP, "Expected 'STOP'"),),
+    ((PREDICT, 27, None),),
+    ((PREDICT, 29, None), (MATCH, TokenKind.NEWLINE, "Expected 'NEWLINE'")),
+    ((PREDICT, 29, None), (MATCH, TokenKind.COMMENT, "Expected 'COMMENT'")),
+    (),
+)
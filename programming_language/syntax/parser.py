@@ -1,764 +1,387 @@
+from programming_language.error_handler.error import IllegalVariableDeclarationError
 from programming_language.error_handler.error import InvalidSyntaxError
 from programming_language.lexical.token import Token
+from programming_language.lexical.token import TokenKind
+from programming_language.lexical.token_buffer import TokenBuffer
+from programming_language.lexical.token_buffer import TokenCursor
+from programming_language.lexical.token_stream import TokenStream
+from programming_language.syntax.expression_frame import ExpressionFrame
+from programming_language.syntax.nodes import AndNode
 from programming_language.syntax.nodes import BinaryOperatorNode
 from programming_language.syntax.nodes import BoolNode
 from programming_language.syntax.nodes import IfNode
+from programming_language.syntax.nodes import InputNode
 from programming_language.syntax.nodes import ListNode
 from programming_language.syntax.nodes import NumberNode
+from programming_language.syntax.nodes import OrNode
 from programming_language.syntax.nodes import StringNode
 from programming_language.syntax.nodes import UnaryOperatorNode
 from programming_language.syntax.nodes import VarAccessNode
 from programming_language.syntax.nodes import VarAssignNode
 from programming_language.syntax.nodes import WhileNode
 from programming_language.syntax.parse_result import ParseResult
+from programming_language.syntax.parse_table import ACTION
+from programming_language.syntax.parse_table import CAPTURE
+from programming_language.syntax.parse_table import ERRORS
+from programming_language.syntax.parse_table import EXPR
+from programming_language.syntax.parse_table import MATCH
+from programming_language.syntax.parse_table import PREDICT
+from programming_language.syntax.parse_table import PRODUCTIONS
+from programming_language.syntax.parse_table import START_SYMBOLS
+from programming_language.syntax.parse_table import TABLE
 
 class Parser:
 
-    def __init__(self, tokens, input_tokens):
+    def __init__(self, tokens):
+        if isinstance(tokens, TokenBuffer):
+            tokens = tokens.cursor()
         self.tokens = tokens
-        # TODO update tokens in view with the input tokens
-        self.input_tokens = input_tokens
+        self.token_stream = tokens if isinstance(tokens, (TokenStream, TokenCursor)) else None
+        self.input_slots = []
         self.token_index = -1
-        self.input_token_index = -1
         self.advance()
-        self.input_advance()
 
     def advance(self, ):
         self.token_index += 1
-        if self.token_index >= 0 and self.token_index < len(self.tokens):
+        if self.token_stream != None:
+            self.current_token = self.token_stream.next()
+        elif self.token_index >= 0 and self.token_index < len(self.tokens):
             self.current_token = self.tokens[self.token_index]
         return self.current_token
 
-    def input_advance(self, ):
-        self.input_token_index += 1
-        if self.input_token_index >= 0 and self.input_token_index < len(self.input_tokens):
-            self.current_input_token = self.input_tokens[self.input_token_index]
-        return self.current_input_token
-
     def parse(self):
-        result = self.statements()
-        if not result.error and self.current_token.type != Token.EOL:
-            return result.failure(InvalidSyntaxError(
-                self.current_token.pos_start,
-                "Invalid statement"
-            ))
+        result = self.parse_table('parse')
+        if self.token_stream != None:
+            # make_tokens reports a lexer error before the parser starts, a stream the parser
+            # stopped early is lexed to the end so the same error wins over a syntax error
+            if result.error and type(self.token_stream) is TokenStream:
+                self.token_stream.finish()
+            if self.token_stream.error:
+                return ParseResult().failure(self.token_stream.error)
         return result
 
-    def statements(self):
-        result = ParseResult()
-        statements = []
-        pos_start = self.current_token.pos_start.copy()
-
-        while self.current_token.type == Token.NEWLINE or self.current_token.type == Token.COMMENT:
-            result.register_advancement()
-            self.advance()
+    def parse_table(self, start_symbol):
+        return self.parse_instructions([(PREDICT, START_SYMBOLS[start_symbol], None)])
 
-        if not self.current_token.matches(Token.KEYWORD, Token.START):
-            statement = result.register(self.var_statement())
-            if result.error: return result
-            statements.extend(statement)
+    def expr(self):
+        return self.parse_instructions([(EXPR, None, None)])
 
-            more_var_statements = True
+    def parse_instructions(self, stack):
+        # statements, expressions and nested IF/WHILE blocks share one stack, nothing recurses
+        result = ParseResult()
+        token_index = self.token_index
+        values = []
 
-            while True:
-                newline_count = 0
-                while self.current_token.type == Token.NEWLINE or self.current_token.type == Token.COMMENT:
-                    result.register_advancement()
-                    self.advance()
-                    newline_count += 1
-                if newline_count == 0:
-                    more_var_statements = False
-
-                if not more_var_statements or self.current_token.matches(Token.KEYWORD, Token.START): break
-                statement = result.register(self.var_statement())
-                if result.error: return result
-                statements.extend(statement)
-
-        if self.current_token.type == Token.EOL:
-            return result.success(ListNode(statements, pos_start))
-            
-        pos_start = self.current_token.pos_start.copy()
-
-        if not self.current_token.matches(Token.KEYWORD, Token.START):
-            return result.failure(InvalidSyntaxError(
-                self.current_token.pos_start,
-                "Expected 'START'"
-            ))
-        
-        result.register_advancement()
-        self.advance()
+        while stack:
+            operation, argument, message = stack.pop()
 
-        if self.current_token.type != Token.NEWLINE:
-            return result.failure(InvalidSyntaxError(
-                self.current_token.pos_start,
-                "Expected 'NEWLINE'"
-            ))
+            if operation == Parser.OPERATOR:
+                self.operator(argument, stack, values)
 
-        result.register_advancement()
-        self.advance()
+            elif operation == Parser.OPERAND:
+                error = self.operand(argument, stack, values)
+                if error: return self.unwind(result, stack, token_index, error)
 
-        while self.current_token.type == Token.NEWLINE or self.current_token.type == Token.COMMENT:
-            result.register_advancement()
-            self.advance()
-        
-        if not self.current_token.matches(Token.KEYWORD, Token.OUTPUT):
-            statement = result.register(self.statement())
-            if result.error: return result
-            statements.append(statement)
-
-        more_statements = True
-
-        while True:
-            newline_count = 0
-            while self.current_token.type == Token.NEWLINE or self.current_token.type == Token.COMMENT:
-                result.register_advancement()
-                self.advance()
-                newline_count += 1
-            if newline_count == 0:
-                more_statements = False
-
-            # TODO evaluate the output variables with its data types
-            if self.current_token.matches(Token.KEYWORD, Token.OUTPUT):
-                var_name = self.current_token
-                result.register_advancement()
-                self.advance()
-
-                if self.current_token.type != Token.COLON:
-                    return result.failure(InvalidSyntaxError(
+            elif operation == MATCH or operation == CAPTURE:
+                if self.current_token.type != argument:
+                    return self.unwind(result, stack, token_index, InvalidSyntaxError(
                         self.current_token.pos_start,
-                        "Expected 'COLON'"
+                        message
                     ))
-
-                result.register_advancement()
+                if operation == CAPTURE:
+                    values.append(self.current_token)
                 self.advance()
 
-                output = result.register(self.expr())
-                if result.error:
-                    return result.failure(InvalidSyntaxError(
+            elif operation == PREDICT:
+                default, productions = TABLE[argument]
+                production = productions.get(self.current_token.type, default)
+                if production == None:
+                    return self.unwind(result, stack, token_index, InvalidSyntaxError(
                         self.current_token.pos_start,
-                        "Invalid output statement"
+                        ERRORS[argument]
                     ))
+                stack.extend(PRODUCTIONS[production])
+
+            elif operation == Parser.ASSIGN:
+                if self.current_token.type == Token.EQ:
+                    # only an expression starting with an identifier can be assigned to,
+                    # which is reported at the '=' once the value has been parsed
+                    if argument == None:
+                        stack.append((Parser.ASSIGNED, self.current_token, "Expected identifier"))
+                    else:
+                        stack.append((Parser.ASSIGNED, argument, None))
+                    values.pop()
+                    self.advance()
+                    self.push_expr(stack)
 
-                statements.append(VarAssignNode(var_name, output))
-
-                if self.current_token.type != Token.NEWLINE:
-                    return result.failure(InvalidSyntaxError(
-                        self.current_token.pos_start,
-                        "Expected 'NEWLINE'"
+            elif operation == Parser.ASSIGNED:
+                if message != None:
+                    return self.unwind(result, stack, token_index, InvalidSyntaxError(
+                        argument.pos_start,
+                        message
                     ))
+                values.append(VarAssignNode(argument, values.pop()))
 
-                result.register_advancement()
-                self.advance()
-
-            if self.current_token.type == Token.EOL:
-                return result.failure(InvalidSyntaxError(
-                    self.current_token.pos_start,
-                    "Expected 'STOP'"
-                ))
-
-            if not more_statements or self.current_token.matches(Token.KEYWORD, Token.STOP): break
-            statement = result.register(self.statement())
-            if result.error: return result
-            statements.append(statement)
-
-        if not self.current_token.matches(Token.KEYWORD, Token.STOP):
-            return result.failure(InvalidSyntaxError(
-                self.current_token.pos_start,
-                "Expected 'STOP'"
-            ))
-        
-        result.register_advancement()
-        self.advance()
-
-        while self.current_token.type == Token.NEWLINE or self.current_token.type == Token.COMMENT:
-            result.register_advancement()
-            self.advance()
-            if self.current_token.type == Token.EOL: break
-        
-        return result.success(ListNode(statements, pos_start))
-
-    def var_statement(self):
-        result = ParseResult()
-        variables = []
-
-        while self.current_token.type == Token.NEWLINE or self.current_token.type == Token.COMMENT:
-            result.register_advancement()
-            self.advance()
-
-        if not self.current_token.matches(Token.KEYWORD, Token.VAR):
-            return result.failure(InvalidSyntaxError(
-                self.current_token.pos_start,
-                "Expected 'VAR'"
-            ))
-
-        result.register_advancement()
-        self.advance()
-
-        while True:
-            var_assign = result.register(self.var_assign())
-            if result.error: return result
-            variables.append(var_assign)
+            elif operation == Parser.UNARY:
+                values.append(UnaryOperatorNode(argument, values.pop()))
 
-            if self.current_token.type == Token.COMMA:
-                result.register_advancement()
-                self.advance()
-            else:
-                if not self.current_token.matches(Token.KEYWORD, Token.AS):
-                    return result.failure(InvalidSyntaxError(
+            elif operation == Parser.CLOSE:
+                if self.current_token.type != Token.RPAREN:
+                    return self.unwind(result, stack, token_index, InvalidSyntaxError(
                         self.current_token.pos_start,
-                        "Expected 'AS'"
+                        "Expected ')'"
                     ))
-
-                result.register_advancement()
                 self.advance()
 
-                if self.current_token.type != Token.DATA_TYPE:
-                    return result.failure(InvalidSyntaxError(
-                        self.current_token.pos_start,
-                        "Invalid 'DATA_TYPE'"
-                    ))
+            elif operation == EXPR:
+                self.push_expr(stack, message)
 
-                result.register_advancement()
-                self.advance()
+            elif operation == ACTION:
+                error = getattr(self, 'action_' + argument)(values)
+                if error: return self.unwind(result, stack, token_index, error)
 
-                return result.success(variables)
+        result.advance_count = self.token_index - token_index
+        return result.success(values.pop())
 
-        return result.failure(InvalidSyntaxError(
-            self.current_token.pos_start,
-            "Expected 'VAR', int, float, char, bool, identifier, 'AS', 'DATA_TYPE'"
-        ))
-    
-    def var_assign(self):
-        result = ParseResult()
+    def unwind(self, result, stack, token_index, error):
+        # the outermost expression that failed before consuming a token reports its own message
+        for operation, argument, message in stack:
+            if operation == Parser.END_EXPR and argument == self.token_index:
+                error = InvalidSyntaxError(self.current_token.pos_start, message)
+                break
 
-        if self.current_token.type != Token.IDENTIFIER:
-            return result.failure(InvalidSyntaxError(
-                self.current_token.pos_start,
-                'Expected identifier'
-            ))
+        result.advance_count = self.token_index - token_index
+        return result.failure(error)
 
-        var_name = self.current_token
-        result.register_advancement()
-        self.advance()
+    def action_statements(self, values):
+        values.append(self.current_token.pos_start.copy())
+        values.append([])
 
-        if self.current_token.type != Token.EQ:
-            return result.failure(InvalidSyntaxError(
-                self.current_token.pos_start,
-                "Expected '='"
-            ))
+    def action_block(self, values):
+        values[-2] = self.current_token.pos_start.copy()
 
-        result.register_advancement()
-        self.advance()
+    def action_end_statements(self, values):
+        statements = values.pop()
+        values.append(ListNode(statements, values.pop()))
 
-        var_value = result.register(self.var_value())
-        if result.error: return result
+    def action_append(self, values):
+        statement = values.pop()
+        values[-1].append(statement)
 
-        if self.current_input_token.type == Token.COMMA and self.current_input_token != Token.EOL:
-            self.input_advance()
+    def action_extend(self, values):
+        statements = values.pop()
+        values[-1].extend(statements)
 
-        return result.success(VarAssignNode(var_name, var_value))
+    def action_declarations(self, values):
+        values.append([])
 
-    def var_value(self):
-        result = ParseResult()
-        token = self.current_token
-        if self.current_input_token.type in (Token.INT, Token.FLOAT, Token.CHAR, Token.BOOL) and self.current_input_token != Token.EOL:
-            token = self.current_input_token
-            self.input_advance()
+    def action_no_value(self, values):
+        values.append(None)
 
-        if token.type in (Token.INT, Token.FLOAT):
-            result.register_advancement()
-            self.advance()
-            return result.success(NumberNode(token))
-        elif token.type == Token.CHAR:
-            result.register_advancement()
-            self.advance()
-            return result.success(StringNode(token))
-        elif token.type == Token.BOOL:
-            result.register_advancement()
-            self.advance()
-            return result.success(BoolNode(token))
-        elif token.type == Token.IDENTIFIER:
-            result.register_advancement()
-            self.advance()
-            return result.success(VarAccessNode(token))
-        else:
-            return result.failure(InvalidSyntaxError(
-                token.pos_start,
-                "Expected int, float, char, bool, or identifier"
-            ))
+    def action_variable(self, values):
+        value_token = values.pop()
+        var_name = values.pop()
+        values[-1].append((var_name, value_token))
 
-    def statement(self):
-        result = ParseResult()
-        
-        while self.current_token.type == Token.NEWLINE or self.current_token.type == Token.COMMENT:
-            result.register_advancement()
-            self.advance()
-        
-        if self.current_token.value in Token.KEYWORDS:
-            expr = result.register(self.expr())
-            if result.error:
-                return result.failure(InvalidSyntaxError(
-                    self.current_token.pos_start,
-                    "Invalid expr"
-                ))
-
-            return result.success(expr)
-
-        if self.current_token.type != Token.IDENTIFIER:
-            return result.failure(InvalidSyntaxError(
-                self.current_token.pos_start,
-                "Expected identifier"
-            ))
-
-        var_name = self.current_token
-        result.register_advancement()
-        self.advance()
+    def action_declare(self, values):
+        data_type = values.pop()
+        declarations = values.pop()
+        variables = []
 
-        if self.current_token.type != Token.EQ:
-            return result.failure(InvalidSyntaxError(
-                self.current_token.pos_start,
-                "Expected '='"
-            ))
+        for var_name, value_token in reversed(declarations):
+            if value_token != None and value_token.type != Token.DATA_TYPE_KINDS[data_type.value]:
+                return IllegalVariableDeclarationError(
+                    data_type.pos_start,
+                    "'" + var_name.value + "'"
+                )
 
-        result.register_advancement()
-        self.advance()
+        default_token = Token(Token.DATA_TYPE_KINDS[data_type.value], Token.DEFAULT_VALUES[data_type.value], data_type.pos_start)
 
-        expr = result.register(self.expr())
-        if result.error:
-            return result.failure(InvalidSyntaxError(
-                self.current_token.pos_start,
-                "Invalid statement"
-            ))
+        # every declared variable is an input slot, bound when the program is run
+        for var_name, value_token in declarations:
+            value_node = self.var_value(value_token or default_token)
+            variables.append(VarAssignNode(var_name, InputNode(len(self.input_slots), value_node)))
+            self.input_slots.append((var_name, data_type.value))
 
-        return result.success(VarAssignNode(var_name, expr))
-    
-    def expr(self):
-        result = ParseResult()
+        values.append(variables)
 
-        if self.current_token.type == Token.IDENTIFIER:
-            var_name = self.current_token
+    def action_output(self, values):
+        output = values.pop()
+        var_name = values.pop()
+        # TODO evaluate the output variables with its data types
+        values[-1].append(VarAssignNode(var_name, output))
 
-        node = result.register(self.binary_operation(self.comp_expr, ((Token.KEYWORD, Token.AND), (Token.KEYWORD, Token.OR))))
-        if result.error: return result
+    def action_assign(self, values):
+        expr = values.pop()
+        var_name = values.pop()
+        values.append(VarAssignNode(var_name, expr))
 
-        if self.current_token.type == Token.EQ:
-            result.register_advancement()
-            self.advance()
-            
-            expr = result.register(self.expr())
-            if result.error: return result
-            return result.success(VarAssignNode(var_name, expr))
+    def action_if(self, values):
+        values.append([[], None])
 
-        return result.success(node)
+    def action_case(self, values):
+        statement = values.pop()
+        values[-2][0].append((values[-1], statement))
 
-    def comp_expr(self):
-        result = ParseResult()
+    def action_end_case(self, values):
+        values.pop()
 
-        if self.current_token.matches(Token.KEYWORD, Token.NOT):
-            operator_token = self.current_token
-            result.register_advancement()
-            self.advance()
+    def action_else(self, values):
+        # only the last statement of the ELSE block is kept
+        values[-1][1] = values.pop()
 
-            node = result.register(self.comp_expr())
-            if result.error: return result
-            return result.success(UnaryOperatorNode(operator_token, node))
+    def action_end_if(self, values):
+        cases, else_case = values.pop()
+        values.append(IfNode(cases, else_case))
 
-        node = result.register(self.binary_operation(self.arith_expr, (Token.EE, Token.NE, Token.LT, Token.GT, Token.LTE, Token.GTE)))
+    def action_body(self, values):
+        values.append([])
 
-        if result.error:
-            return result.failure(InvalidSyntaxError(
-                self.current_token.pos_start,
-                "Expected int, float, char, bool, identifier, '+', '-', '(', 'NOT', 'IF', or 'WHILE'"
-            ))
+    def action_while(self, values):
+        body = values.pop()
+        condition = values.pop()
+        values.append(WhileNode(condition, body))
 
-        return result.success(node)
+    def var_value(self, token):
+        if token.type in (Token.INT, Token.FLOAT):
+            return NumberNode(token)
+        elif token.type == Token.CHAR:
+            return StringNode(token)
+        else:
+            return BoolNode(token)
 
-    def arith_expr(self):
-        return self.binary_operation(self.term, (Token.PLUS, Token.MINUS, Token.CONCAT))
+    def push_expr(self, stack, message=None):
+        if message != None:
+            stack.append((Parser.END_EXPR, self.token_index, message))
 
-    def term(self):
-        return self.binary_operation(self.factor, (Token.MUL, Token.DIV, Token.MOD))
+        var_name = self.current_token if self.current_token.type == Token.IDENTIFIER else None
+        stack.append((Parser.ASSIGN, var_name, None))
+        stack.append((Parser.OPERAND, ExpressionFrame(Parser.LOGIC_POWER, True), None))
 
-    def factor(self):
-        result = ParseResult()
+    def operand(self, frame, stack, values):
         token = self.current_token
+        literal_node = Parser.LITERAL_NODES.get(token.type)
 
-        if token.type in (Token.PLUS, Token.MINUS):
-            result.register_advancement()
+        # a literal or variable without a sign goes straight to the operator loop
+        if literal_node != None:
+            values.append(literal_node(token))
             self.advance()
-            factor = result.register(self.factor())
-            if result.error: return result
-            return result.success(UnaryOperatorNode(token, factor))
-        
-        return self.atom()
+            self.operator(frame, stack, values)
+            return None
 
-    def atom(self):
-        result = ParseResult()
-        token = self.current_token
-
-        if token.type in (Token.INT, Token.FLOAT):
-            result.register_advancement()
-            self.advance()
-            return result.success(NumberNode(token))
+        stack.append((Parser.OPERATOR, frame, None))
 
-        elif token.type in (Token.CHAR, Token.CONCAT):
-            result.register_advancement()
+        # NOT is only allowed where a whole comparison can start: first, or after AND/OR
+        if frame.comparison_operand and token.type == TokenKind.NOT:
             self.advance()
-            return result.success(StringNode(token))
+            stack.append((Parser.UNARY, token, None))
+            stack.append((Parser.OPERAND, ExpressionFrame(Parser.COMPARISON_POWER, True), None))
+            return None
 
-        elif token.type == Token.BOOL:
-            result.register_advancement()
+        operand_index = self.token_index
+        while token.type == Token.PLUS or token.type == Token.MINUS:
+            stack.append((Parser.UNARY, token, None))
             self.advance()
-            return result.success(BoolNode(token))
+            token = self.current_token
 
-        elif token.type == Token.IDENTIFIER:
-            result.register_advancement()
+        literal_node = Parser.LITERAL_NODES.get(token.type)
+        if literal_node != None:
+            values.append(literal_node(token))
             self.advance()
-            return result.success(VarAccessNode(token))
-
         elif token.type == Token.LPAREN:
-            result.register_advancement()
-            self.advance()
-
-            expr = result.register(self.expr())
-            if result.error: return result
-
-            if self.current_token.type != Token.RPAREN:
-                return result.failure(InvalidSyntaxError(
-                    self.current_token.pos_start,
-                    "Expected ')'"
-                ))
-                
-            result.register_advancement()
-            self.advance()
-            return result.success(expr)
-                
-        elif token.matches(Token.KEYWORD, Token.IF):
-            if_expr = result.register(self.if_expr())
-            if result.error: return result
-            return result.success(if_expr)
-
-        elif token.matches(Token.KEYWORD, Token.WHILE):
-            while_expr = result.register(self.while_expr())
-            if result.error: return result
-            return result.success(while_expr)
-
-        return result.failure(InvalidSyntaxError(
-            token.pos_start,
-            "Expected expr"
-        ))
-
-    def if_expr(self):
-        result = ParseResult()
-        all_cases = result.register(self.if_expr_cases(Token.IF))
-        if result.error: return result
-        cases, else_case = all_cases
-        return result.success(IfNode(cases, else_case))
-
-    def if_expr_b(self):
-        return self.if_expr_cases(Token.ELIF)
-
-    def if_expr_c(self):
-        result = ParseResult()
-        else_case = None
-        
-        if not self.current_token.matches(Token.KEYWORD, Token.ELSE):
-            return result.failure(InvalidSyntaxError(
-                self.current_token.pos_start,
-                "Expected 'ELSE'"
-            ))
-
-        result.register_advancement()
-        self.advance()
-
-        if self.current_token.type != Token.NEWLINE:
-            return result.failure(InvalidSyntaxError(
-                self.current_token.pos_start,
-                "Expected 'NEWLINE'"
-            ))
-
-        result.register_advancement()
-        self.advance()
-
-        while self.current_token.type == Token.NEWLINE or self.current_token.type == Token.COMMENT:
-            result.register_advancement()
-            self.advance()
-
-        if not self.current_token.matches(Token.KEYWORD, Token.START):
-            return result.failure(InvalidSyntaxError(
-                self.current_token.pos_start,
-                "Expected 'START'"
-            ))
-
-        result.register_advancement()
-        self.advance()
-
-        if self.current_token.type != Token.NEWLINE:
-            return result.failure(InvalidSyntaxError(
-                self.current_token.pos_start,
-                "Expected 'NEWLINE'"
-            ))
-
-        result.register_advancement()
-        self.advance()
-
-        while self.current_token.type == Token.NEWLINE or self.current_token.type == Token.COMMENT:
-            result.register_advancement()
+            stack.append((Parser.CLOSE, None, None))
             self.advance()
-
-        while True:
-            # TODO proceed else conditional without statements
-            statement = result.register(self.statement())
-            if result.error: return result
-            else_case = statement
-
-            if self.current_token.type != Token.NEWLINE:
-                return result.failure(InvalidSyntaxError(
-                    self.current_token.pos_start,
-                    "Expected 'NEWLINE'"
-                ))
-
-            result.register_advancement()
-            self.advance()
-
-            while self.current_token.type == Token.NEWLINE or self.current_token.type == Token.COMMENT:
-                result.register_advancement()
-                self.advance()
-
-            if self.current_token.matches(Token.KEYWORD, Token.STOP):
-                result.register_advancement()
-                self.advance()
-                break
-
-        if self.current_token.type != Token.NEWLINE:
-            return result.failure(InvalidSyntaxError(
-                self.current_token.pos_start,
-                "Expected 'NEWLINE'"
-            ))
-
-        result.register_advancement()
-        self.advance()
-
-        while self.current_token.type == Token.NEWLINE or self.current_token.type == Token.COMMENT:
-            result.register_advancement()
-            self.advance()
-
-        return result.success(else_case)
-
-    def if_expr_b_or_c(self):
-        result = ParseResult()
-        cases, else_case = [], None
-
-        if self.current_token.matches(Token.KEYWORD, Token.ELIF):
-            all_cases = result.register(self.if_expr_b())
-            if result.error: return result
-            cases, else_case = all_cases
-        elif self.current_token.matches(Token.KEYWORD, Token.ELSE):
-            else_case = result.register(self.if_expr_c())
-            if result.error: return result
-
-        return result.success((cases, else_case))
-
-    def if_expr_cases(self, case_keyword):
-        result = ParseResult()
-        cases = []
-        else_case = None
-
-        if not self.current_token.matches(Token.KEYWORD, case_keyword):
-            return result.failure(InvalidSyntaxError(
-                self.current_token.pos_start,
-                f"Expected '{case_keyword}'"
-            ))
-
-        result.register_advancement()
-        self.advance()
-
-        condition = result.register(self.expr())
-        if result.error: return result
-
-        if self.current_token.type != Token.NEWLINE:
-            return result.failure(InvalidSyntaxError(
-                self.current_token.pos_start,
-                "Expected 'NEWLINE'"
-            ))
-
-        result.register_advancement()
-        self.advance()
-
-        while self.current_token.type == Token.NEWLINE or self.current_token.type == Token.COMMENT:
-            result.register_advancement()
-            self.advance()
-
-        if not self.current_token.matches(Token.KEYWORD, Token.START):
-            return result.failure(InvalidSyntaxError(
-                self.current_token.pos_start,
-                "Expected 'START'"
-            ))
-
-        result.register_advancement()
-        self.advance()
-
-        if self.current_token.type != Token.NEWLINE:
-            return result.failure(InvalidSyntaxError(
-                self.current_token.pos_start,
-                "Expected 'NEWLINE'"
-            ))
-
-        result.register_advancement()
-        self.advance()
-
-        while self.current_token.type == Token.NEWLINE or self.current_token.type == Token.COMMENT:
-            result.register_advancement()
-            self.advance()
-
-        while True:
-            # TODO proceed if-elif conditionals without statements
-            statement = result.register(self.statement())
-            if result.error: return result
-            cases.append((condition, statement))
-
-            if self.current_token.type != Token.NEWLINE:
-                return result.failure(InvalidSyntaxError(
-                    self.current_token.pos_start,
-                    "Expected 'NEWLINE'"
-                ))
-
-            result.register_advancement()
-            self.advance()
-
-            while self.current_token.type == Token.NEWLINE or self.current_token.type == Token.COMMENT:
-                result.register_advancement()
-                self.advance()
-
-            if self.current_token.matches(Token.KEYWORD, Token.STOP):
-                result.register_advancement()
-                self.advance()
-                break
-
-        if self.current_token.type != Token.NEWLINE:
-            return result.failure(InvalidSyntaxError(
-                self.current_token.pos_start,
-                "Expected 'NEWLINE'"
-            ))
-
-        result.register_advancement()
-        self.advance()
-
-        while self.current_token.type == Token.NEWLINE or self.current_token.type == Token.COMMENT:
-            result.register_advancement()
-            self.advance()
-
-        all_cases = result.register(self.if_expr_b_or_c())
-        if result.error: return result
-        new_cases, else_case = all_cases
-        cases.extend(new_cases)
-        
-        return result.success((cases, else_case))
-
-    def while_expr(self):
-        result = ParseResult()
-        body = []
-        
-        if not self.current_token.matches(Token.KEYWORD, Token.WHILE):
-            return result.failure(InvalidSyntaxError(
-                self.current_token.pos_start,
-                "Expected 'WHILE'"
-            ))
-
-        result.register_advancement()
-        self.advance()
-
-        condition = result.register(self.expr())
-        if result.error: return result
-
-        if self.current_token.type != Token.NEWLINE:
-            return result.failure(InvalidSyntaxError(
-                self.current_token.pos_start,
-                "Expected 'NEWLINE'"
-            ))
-
-        result.register_advancement()
-        self.advance()
-
-        while self.current_token.type == Token.NEWLINE or self.current_token.type == Token.COMMENT:
-            result.register_advancement()
-            self.advance()
-
-        if not self.current_token.matches(Token.KEYWORD, Token.START):
-            return result.failure(InvalidSyntaxError(
-                self.current_token.pos_start,
-                "Expected 'START'"
-            ))
-
-        result.register_advancement()
-        self.advance()
-
-        if self.current_token.type != Token.NEWLINE:
-            return result.failure(InvalidSyntaxError(
-                self.current_token.pos_start,
-                "Expected 'NEWLINE'"
-            ))
-
-        result.register_advancement()
-        self.advance()
-
-        while self.current_token.type == Token.NEWLINE or self.current_token.type == Token.COMMENT:
-            result.register_advancement()
-            self.advance()
-
-        while True:
-            # TODO check bool expr if it has a counter in the body
-            statement = result.register(self.statement())
-            if result.error: return result
-            body.append(statement)
-
-            if self.current_token.type != Token.NEWLINE:
-                return result.failure(InvalidSyntaxError(
-                    self.current_token.pos_start,
-                    "Expected 'NEWLINE'"
-                ))
-
-            result.register_advancement()
-            self.advance()
-
-            while self.current_token.type == Token.NEWLINE or self.current_token.type == Token.COMMENT:
-                result.register_advancement()
-                self.advance()
-
-            if self.current_token.matches(Token.KEYWORD, Token.STOP):
-                result.register_advancement()
-                self.advance()
-                break
-
-        if self.current_token.type != Token.NEWLINE:
-            return result.failure(InvalidSyntaxError(
-                self.current_token.pos_start,
-                "Expected 'NEWLINE'"
-            ))
-
-        result.register_advancement()
+            self.push_expr(stack)
+        elif token.type == TokenKind.IF:
+            stack.append((PREDICT, START_SYMBOLS['if-expr'], None))
+        elif token.type == TokenKind.WHILE:
+            stack.append((PREDICT, START_SYMBOLS['while-expr'], None))
+        elif frame.comparison_operand and self.token_index == operand_index:
+            return InvalidSyntaxError(
+                token.pos_start,
+                "Expected int, float, char, bool, identifier, '+', '-', '(', 'NOT', 'IF', or 'WHILE'"
+            )
+        else:
+            return InvalidSyntaxError(
+                token.pos_start,
+                "Expected expr"
+            )
+
+        return None
+
+    def operator_node(self, left_node, operator_token, right_node):
+        node_class = Parser.OPERATOR_NODES.get(operator_token.type, BinaryOperatorNode)
+        return node_class(left_node, operator_token, right_node)
+
+    def operator(self, frame, stack, values):
+        nodes = frame.nodes
+        operators = frame.operators
+        powers = frame.powers
+        nodes.append(values.pop())
+
+        power = Parser.BINDING_POWERS.get(self.current_token.type)
+        if power == None or power < frame.min_power:
+            while operators:
+                right = nodes.pop()
+                nodes[-1] = self.operator_node(nodes[-1], operators.pop(), right)
+            values.append(nodes[0])
+            return
+
+        # operators of the same power are left associative
+        while powers and powers[-1] >= power:
+            powers.pop()
+            right = nodes.pop()
+            nodes[-1] = self.operator_node(nodes[-1], operators.pop(), right)
+
+        operators.append(self.current_token)
+        powers.append(power)
+        frame.comparison_operand = power == Parser.LOGIC_POWER
         self.advance()
-
-        while self.current_token.type == Token.NEWLINE or self.current_token.type == Token.COMMENT:
-            result.register_advancement()
-            self.advance()
-        
-        return result.success(WhileNode(condition, body))
-
-    def binary_operation(self, func_a, ops, func_b=None):
-        if func_b == None: func_b = func_a
-
-        result = ParseResult()
-        left = result.register(func_a())
-        if result.error: return result
-
-        while self.current_token.type in ops or (self.current_token.type, self.current_token.value) in ops:
-            operator_token = self.current_token
-            result.register_advancement()
-            self.advance()
-            
-            right = result.register(func_b())
-            if result.error: return result
-            left = BinaryOperatorNode(left, operator_token, right)
-            
-        return result.success(left)
\ No newline at end of file
+        stack.append((Parser.OPERAND, frame, None))
+
+
+Parser.LOGIC_POWER      = 1
+Parser.COMPARISON_POWER = 2
+Parser.ARITH_POWER      = 3
+Parser.TERM_POWER       = 4
+
+# expression instructions, numbered after the ones of parse_table
+Parser.OPERAND  = 5
+Parser.OPERATOR = 6
+Parser.UNARY    = 7
+Parser.CLOSE    = 8
+Parser.ASSIGN   = 9
+Parser.ASSIGNED = 10
+Parser.END_EXPR = 11
+
+Parser.LITERAL_NODES = {
+    Token.INT: NumberNode,
+    Token.FLOAT: NumberNode,
+    Token.CHAR: StringNode,
+    Token.CONCAT: StringNode,
+    Token.BOOL: BoolNode,
+    Token.IDENTIFIER: VarAccessNode
+}
+
+# the operators that do not always evaluate their right operand
+Parser.OPERATOR_NODES = {
+    TokenKind.AND: AndNode,
+    TokenKind.OR: OrNode
+}
+
+Parser.BINDING_POWERS = {
+    TokenKind.AND: Parser.LOGIC_POWER,
+    TokenKind.OR: Parser.LOGIC_POWER,
+    Token.EE: Parser.COMPARISON_POWER,
+    Token.NE: Parser.COMPARISON_POWER,
+    Token.LT: Parser.COMPARISON_POWER,
+    Token.GT: Parser.COMPARISON_POWER,
+    Token.LTE: Parser.COMPARISON_POWER,
+    Token.GTE: Parser.COMPARISON_POWER,
+    Token.PLUS: Parser.ARITH_POWER,
+    Token.MINUS: Parser.ARITH_POWER,
+    Token.CONCAT: Parser.ARITH_POWER,
+    Token.MUL: Parser.TERM_POWER,
+    Token.DIV: Parser.TERM_POWER,
+    Token.MOD: Parser.TERM_POWER
+}
@@ -1,17 +1,31 @@
 class SymbolTable:
 
-    def __init__(self, parent=None):
-        self.symbols = {}
+    # a view by name over the frame the engines run on, a variable is
+    # in the slot the Resolver gave it
+
+    def __init__(self, frame=None, slots=None, parent=None):
+        self.frame = frame if frame != None else []
+        self.slots = slots if slots != None else {}
         self.parent = parent
 
+    @property
+    def symbols(self):
+        return {name: self.frame[slot] for name, slot in self.slots.items() if self.frame[slot] is not None}
+
     def get(self, name):
-        value = self.symbols.get(name, None)
-        if value == None and self.parent:
+        slot = self.slots.get(name)
+        value = self.frame[slot] if slot != None else None
+        if value is None and self.parent:
             return self.parent.get(name)
         return value
 
     def set(self, name, value):
-        self.symbols[name] = value
+        if name not in self.slots:
+            # the slots are shared by every run of a program, a new name gets a copy
+            self.slots = dict(self.slots)
+            self.slots[name] = len(self.frame)
+            self.frame.append(None)
+        self.frame[self.slots[name]] = value
 
     def remove(self, name):
-        del self.symbols[name]
\ No newline at end of file
+        self.frame[self.slots[name]] = None
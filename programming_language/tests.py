@@ -1,3 +1,586 @@
+import os
+import pickle
+import threading
+import time
+from unittest import mock
+
+from django.conf import settings
+from django.db.models import Sum
+from django.test import SimpleTestCase
 from django.test import TestCase
+from django.test import override_settings
+
+from programming_language import views
+from programming_language.lexical.lexer import Lexer
+from programming_language.lexical.token import SourceToken
+from programming_language.lexical.token import Token
+from programming_language.lexical.token_buffer import TokenBuffer
+from programming_language.lexical.token_stream import TokenStream
+from programming_language.error_handler.error import IllegalTypeError
+from programming_language.error_handler.error import RuntimeError
+from programming_language.error_handler.position import Position
+from programming_language.models import CompiledProgram
+from programming_language.program_cache import ProgramCache
+from programming_language.semantics.closure_compiler import ClosureCompiler
+from programming_language.semantics.native_compiler import NativeCompiler
+from programming_language.semantics.program import Program
+from programming_language.semantics.python_compiler import PythonCompiler
+from programming_language.syntax.grammar import Grammar
+from programming_language.syntax.parser import Parser
+
+def token_keys(tokens):
+    # what the parser reads of a token, both scanners and relex have to agree on it
+    return [
+        (token.type, token.value, token.pos_start.index, token.pos_start.line)
+        for token in tokens
+    ]
+
+def node_keys(node):
+    # what a parsed tree holds, tokens and positions are compared by value
+    if type(node) in (list, tuple):
+        return [node_keys(item) for item in node]
+    if type(node) in (Token, SourceToken):
+        return token_keys([node])[0]
+    if type(node) is Position:
+        return (node.index, node.line)
+    if hasattr(node, '__dict__'):
+        return (type(node).__name__, {name: node_keys(value) for name, value in vars(node).items()})
+    return node
+
+def error_keys(error):
+    return error and (type(error), error.pos_start.index, error.message())
+
+def parse_list(source):
+    # the tree and error of parsing from a make_tokens list, a lexer error comes first
+    tokens, error = Lexer(source).make_tokens()
+    if error:
+        return None, error
+    result = Parser(tokens).parse()
+    return result.node, result.error
+
+class LexerTests(SimpleTestCase):
+
+    SOURCE = (
+        '* my first program in CFPL\n'
+        'VAR abc, b, c AS INT\n'
+        "VAR x, w_23='w' AS CHAR\n"
+        'VAR t="TRUE" AS BOOL\n'
+        'START\n'
+        '    abc=b=10 * 2\n'
+        "    w_23='a'\n"
+        '    * this is a comment\n'
+        '    OUTPUT: abc & "hi" & b & "#" & w_23 & "[#]"\n'
+        'STOP'
+    )
+
+    def assert_relexes(self, source, old, new):
+        offset = source.index(old)
+        lexer = Lexer(source, Lexer.REGEX_SCANNER)
+        tokens, error = lexer.make_tokens()
+        self.assertIsNone(error)
+
+        relexed, relex_error = lexer.relex(tokens, offset, len(old), new)
+        edited = source[:offset] + new + source[offset + len(old):]
+        scanned, scan_error = Lexer(edited, Lexer.REGEX_SCANNER).make_tokens()
+
+        self.assertEqual(lexer.text, edited)
+        self.assertEqual(token_keys(relexed), token_keys(scanned))
+        self.assertEqual(type(relex_error), type(scan_error))
+
+    def test_relex_at_start(self):
+        self.assert_relexes(self.SOURCE, '* my', 'VAR q AS INT\n* my')
+        self.assert_relexes(self.SOURCE, '* my first program in CFPL\n', '')
+        self.assert_relexes(self.SOURCE, '*', '')
+
+    def test_relex_in_middle(self):
+        self.assert_relexes(self.SOURCE, 'abc=b=10', 'abc=b=1234')
+        self.assert_relexes(self.SOURCE, "    w_23='a'\n", '')
+        self.assert_relexes(self.SOURCE, '10 * 2', '10\n    * 2')
+        self.assert_relexes(self.SOURCE, 'AS CHAR', 'AS CHAR; VAR y AS FLOAT')
+
+    def test_relex_at_end(self):
+        self.assert_relexes(self.SOURCE, 'STOP', 'STOP\n')
+        self.assert_relexes(self.SOURCE, 'STOP', 'STOP\n* trailing comment')
+        self.assert_relexes(self.SOURCE, '\nSTOP', '')
+
+    def test_relex_in_comment(self):
+        self.assert_relexes(self.SOURCE, 'this is', 'this "is')
+        self.assert_relexes(self.SOURCE, 'this is', "this\nis")
+        self.assert_relexes(self.SOURCE, 'this is', 'this; is')
+        self.assert_relexes(self.SOURCE, '* this', 'this')
+
+    def test_relex_in_string(self):
+        self.assert_relexes(self.SOURCE, '"hi"', '"h;i"')
+        self.assert_relexes(self.SOURCE, '"hi"', '"h\ni"')
+        self.assert_relexes(self.SOURCE, '"[#]"', '"[#"')
+        self.assert_relexes(self.SOURCE, "'a'", "'a")
+        self.assert_relexes(self.SOURCE, '"TRUE"', '"FALSE"')
+
+    def test_relex_to_illegal_character(self):
+        self.assert_relexes(self.SOURCE, 'abc=b=10', 'abc=b=$10')
+
+    def test_scanners_agree(self):
+        sources = [
+            self.SOURCE,
+            self.SOURCE.replace('\n', '\r\n'),
+            'VAR a AS INT\nSTART\n    a = 2 * 3 * -4 % 5 / 6\nSTOP',
+            'VAR a AS BOOL\nSTART; a = 1 <= 2 AND 3 >= 4 OR 5 <> 6 AND NOT 7 == 7; STOP',
+            '* only a comment',
+            'START\n    OUTPUT: "unterminated\nSTOP',
+            'VAR a AS INT\nSTART\n    a = 1.5 $ 2\nSTOP',
+            ''
+        ]
+
+        for source in sources:
+            with self.subTest(source=source):
+                scanned, scan_error = Lexer(source, Lexer.REGEX_SCANNER).make_tokens()
+                characters, character_error = Lexer(source, Lexer.CHARACTER_SCANNER).make_tokens()
+                self.assertEqual(token_keys(scanned), token_keys(characters))
+                self.assertEqual(type(scan_error), type(character_error))
+                if scan_error:
+                    self.assertEqual(scan_error.pos_start.index, character_error.pos_start.index)
+
+    def test_iter_tokens_matches_make_tokens(self):
+        lexer = Lexer(self.SOURCE, Lexer.REGEX_SCANNER)
+        streamed = list(lexer.iter_tokens())
+        characters, error = Lexer(self.SOURCE, Lexer.CHARACTER_SCANNER).make_tokens()
+        self.assertIsNone(error)
+        self.assertEqual(token_keys(streamed), token_keys(characters))
+
+class TokenStreamTests(SimpleTestCase):
+
+    SOURCES = [
+        LexerTests.SOURCE,
+        'VAR a=1, b AS INT\nSTART\n    WHILE (a < 3)\n    START\n        a = a + 1\n    STOP\n    OUTPUT: a & b\nSTOP',
+        'VAR a AS INT\nSTART\n    a = (1 + \nSTOP',
+        'VAR a AS INT\nSTART\n    a = 1 $ 2\n    OUTPUT: a\nSTOP',
+        'START\n    OUTPUT: "unterminated\nSTOP',
+        # a syntax error comes before the lexer error in the source
+        'VAR a AS INT\nSTART\n    a = (1 +\n    a = $\nSTOP',
+        'VAR a AS INT\nSTART\nSTOP $'
+    ]
+
+    def test_stream_parses_like_token_list(self):
+        for source in TokenStreamTests.SOURCES:
+            with self.subTest(source=source):
+                node, error = parse_list(source)
+                result = Parser(TokenStream(Lexer(source))).parse()
+                self.assertEqual(node_keys(result.node), node_keys(node))
+                self.assertEqual(error_keys(result.error), error_keys(error))
+
+class TokenBufferTests(SimpleTestCase):
+
+    def test_cursor_peeks_and_advances_over_buffer(self):
+        tokens, error = Lexer(LexerTests.SOURCE).make_tokens()
+        buffer = TokenBuffer(Lexer(LexerTests.SOURCE))
+        self.assertIsNone(buffer.error)
+        self.assertEqual(len(buffer), len(tokens))
+        self.assertEqual(token_keys(buffer), token_keys(tokens))
+
+        cursor = buffer.cursor()
+        for index in range(len(tokens)):
+            self.assertEqual(token_keys([cursor.peek()]), token_keys(tokens[index:index + 1]))
+            self.assertEqual(token_keys([cursor.peek(1)]), token_keys(tokens[index + 1:index + 2] or tokens[-1:]))
+            self.assertEqual(token_keys([cursor.next()]), token_keys(tokens[index:index + 1]))
+
+        # past the end the cursor keeps giving the last token
+        end_token = cursor.next()
+        self.assertIs(cursor.peek(), end_token)
+        self.assertIs(cursor.next(), end_token)
+        self.assertEqual(token_keys([end_token]), token_keys(tokens[-1:]))
+
+    def test_cursor_ends_at_lexer_error(self):
+        source = 'VAR a AS INT\nSTART\n    a = 1 $ 2\nSTOP'
+        cursor = TokenBuffer(Lexer(source)).cursor()
+        self.assertEqual(type(cursor.error), type(Lexer(source).make_tokens()[1]))
+
+        while cursor.peek() is not cursor.final_token():
+            cursor.next()
+        self.assertEqual(cursor.next().type, Token.EOL)
+        self.assertEqual(cursor.peek().pos_start.index, source.index('$'))
+
+    def test_buffer_parses_like_token_list(self):
+        for source in TokenStreamTests.SOURCES:
+            with self.subTest(source=source):
+                node, error = parse_list(source)
+                result = Parser(TokenBuffer(Lexer(source))).parse()
+                self.assertEqual(node_keys(result.node), node_keys(node))
+                self.assertEqual(error_keys(result.error), error_keys(error))
+
+    def test_buffer_survives_pickle(self):
+        # the cache of compiled programs stores what the lexer made with pickle
+        for source in TokenStreamTests.SOURCES:
+            with self.subTest(source=source):
+                buffer = TokenBuffer(Lexer(source))
+                loaded = pickle.loads(pickle.dumps(buffer, pickle.HIGHEST_PROTOCOL))
+                self.assertEqual(token_keys(loaded), token_keys(buffer))
+                self.assertEqual(error_keys(loaded.error), error_keys(buffer.error))
+
+                result = Parser(loaded).parse()
+                expected = Parser(buffer).parse()
+                self.assertEqual(node_keys(result.node), node_keys(expected.node))
+                self.assertEqual(error_keys(result.error), error_keys(expected.error))
+
+class GrammarTests(SimpleTestCase):
+
+    def test_parse_table_is_generated_from_grammar(self):
+        # run `python manage.py generate_parser` and commit parse_table.py when this fails
+        with open(os.path.join(settings.BASE_DIR, 'grammar.txt')) as grammar_file:
+            grammar = Grammar(grammar_file.read())
+        with open(os.path.join(settings.BASE_DIR, 'programming_language', 'syntax', 'parse_table.py')) as table_file:
+            self.assertEqual(grammar.generate(), table_file.read())
+
+    def test_earlier_alternative_wins_conflict(self):
+        grammar = Grammar(
+            'start : INT^ first\n'
+            '      | INT second\n'
+            '      | COLON\n'
+            'first : COMMA\n'
+            'second: COLON\n'
+        )
+        productions, table = grammar.make_table()
+
+        self.assertEqual(grammar.conflicts, [('start', 'INT')])
+        default, row = table[0]
+        self.assertEqual(row['INT'], 0)
+        self.assertEqual(default, 2)
+
+    def test_output_statement_wins_over_statement(self):
+        # block-start and block-more both predict OUTPUT for a statement and an output-statement
+        for source in ('START\nOUTPUT: 1\nSTOP', 'VAR a AS INT\nSTART\n* c\na = 1\n* d\nOUTPUT: a\nSTOP'):
+            with self.subTest(source=source):
+                tokens, error = Lexer(source).make_tokens()
+                self.assertIsNone(error)
+                self.assertIsNone(Parser(tokens).parse().error)
+
+class ProgramCacheTests(SimpleTestCase):
+
+    def compile(self, source_code, source_hash):
+        return source_code.upper()
+
+    def fill(self, program_cache):
+        # a is read again before c pushes the cache past its capacity
+        for source_code in ('a', 'b', 'a', 'c'):
+            program_cache.get(source_code, self.compile)
+        return list(program_cache.entries.values())
+
+    def test_lru_evicts_least_recently_used(self):
+        program_cache = ProgramCache(2, 'LRU')
+        self.assertEqual(self.fill(program_cache), ['A', 'C'])
+        self.assertEqual(
+            program_cache.stats(),
+            {'size': 2, 'capacity': 2, 'hits': 1, 'misses': 3, 'evictions': 1}
+        )
+
+        self.assertEqual(program_cache.get('b', self.compile), 'B')
+        self.assertEqual(list(program_cache.entries.values()), ['C', 'B'])
+        self.assertEqual(program_cache.stats()['misses'], 4)
+        self.assertEqual(program_cache.stats()['evictions'], 2)
+
+    def test_fifo_evicts_first_stored(self):
+        program_cache = ProgramCache(2, 'FIFO')
+        self.assertEqual(self.fill(program_cache), ['B', 'C'])
+        self.assertEqual(
+            program_cache.stats(),
+            {'size': 2, 'capacity': 2, 'hits': 1, 'misses': 3, 'evictions': 1}
+        )
+
+        self.assertEqual(program_cache.get('a', self.compile), 'A')
+        self.assertEqual(list(program_cache.entries.values()), ['C', 'A'])
+        self.assertEqual(program_cache.stats()['evictions'], 2)
+
+    def test_zero_capacity_keeps_nothing(self):
+        program_cache = ProgramCache(0)
+        self.assertEqual(self.fill(program_cache), [])
+        self.assertEqual(
+            program_cache.stats(),
+            {'size': 0, 'capacity': 0, 'hits': 0, 'misses': 4, 'evictions': 0}
+        )
+
+    def test_unknown_eviction_is_rejected(self):
+        with self.assertRaises(ValueError):
+            ProgramCache(2, 'MRU')
+
+    def test_concurrent_first_runs_compile_once(self):
+        tokens, program, error = views.compile_source(LexerTests.SOURCE)
+        compile = ClosureCompiler.compile
+
+        def slow_compile(compiler, node):
+            # keeps the first compile going while the other runs arrive
+            if node is program.node:
+                time.sleep(0.05)
+            return compile(compiler, node)
+
+        barrier = threading.Barrier(4)
+        outputs = []
+
+        def run():
+            barrier.wait()
+            outputs.append(str(program.run('', 'closure')[0]))
+
+        with mock.patch.object(ClosureCompiler, 'compile', autospec=True, side_effect=slow_compile) as closure_compile:
+            threads = [threading.Thread(target=run) for index in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        # the compiler calls itself for the children of the node
+        self.assertEqual(sum(1 for call in closure_compile.call_args_list if call.args[1] is program.node), 1)
+        self.assertEqual(outputs, [CompiledProgramTests.OUTPUT] * 4)
+
+@override_settings(COMPILED_PROGRAM_CACHE={'MAX_SIZE': 64 * 1024})
+class CompiledProgramTests(TestCase):
+
+    SOURCE = LexerTests.SOURCE
+
+    OUTPUT = '20hi20\na#'
+
+    def setUp(self):
+        self.program_cache = ProgramCache(16)
+
+    def get(self, source):
+        tokens, program, error = self.program_cache.get(source, views.load_source)
+        self.assertIsNone(error)
+        return program
+
+    def test_program_is_loaded_after_memory_cache_is_cleared(self):
+        self.assertEqual(str(self.get(self.SOURCE).run('')[0]), self.OUTPUT)
+        self.assertEqual(CompiledProgram.objects.count(), 1)
+
+        self.program_cache.clear()
+        with mock.patch.object(views, 'compile_source', side_effect=AssertionError('compiled again')):
+            program = self.get(self.SOURCE)
+
+        self.assertEqual(self.program_cache.stats()['misses'], 2)
+        for engine in Program.ENGINES:
+            with self.subTest(engine=engine):
+                output, error = program.run('', engine)
+                self.assertIsNone(error)
+                self.assertEqual(str(output), self.OUTPUT)
+
+    def test_eviction_keeps_total_size_under_max_size(self):
+        entry = views.compile_source(self.SOURCE)
+        CompiledProgram.objects.store('0' * 64, Program.COMPILER_VERSION, entry, 1 << 30)
+        size = CompiledProgram.objects.get().size
+        max_size = size * 3 + size // 2
+
+        for index in range(1, 10):
+            CompiledProgram.objects.store(f'{index:064}', Program.COMPILER_VERSION, entry, max_size)
+            total_size = CompiledProgram.objects.aggregate(total_size=Sum('size'))['total_size']
+            self.assertLessEqual(total_size, max_size)
+
+        # the oldest programs went first
+        self.assertEqual(
+            list(CompiledProgram.objects.order_by('id').values_list('source_hash', flat=True)),
+            [f'{index:064}' for index in (7, 8, 9)]
+        )
+
+    def test_program_larger_than_max_size_is_not_stored(self):
+        entry = views.compile_source(self.SOURCE)
+        CompiledProgram.objects.store('0' * 64, Program.COMPILER_VERSION, entry, 16)
+        self.assertEqual(CompiledProgram.objects.count(), 0)
+
+    def test_compiler_version_mismatch_invalidates_stored_program(self):
+        self.get(self.SOURCE)
+        CompiledProgram.objects.update(compiler_version='old')
+        source_hash = CompiledProgram.objects.get().source_hash
+        self.assertIsNone(CompiledProgram.objects.load(source_hash, Program.COMPILER_VERSION))
+
+        self.program_cache.clear()
+        with mock.patch.object(views, 'compile_source', wraps=views.compile_source) as compile_source:
+            program = self.get(self.SOURCE)
+
+        compile_source.assert_called_once()
+        self.assertEqual(str(program.run('')[0]), self.OUTPUT)
+        self.assertEqual(
+            sorted(CompiledProgram.objects.values_list('compiler_version', flat=True)),
+            sorted([Program.COMPILER_VERSION, 'old'])
+        )
+
+class EngineTests(SimpleTestCase):
+
+    # (source, inputs, output, error class), every engine has to give what the tree-walker gives
+    PROGRAMS = [
+        (LexerTests.SOURCE, '', '20hi20\na#', None),
+        (
+            'VAR xyz, abc=100 AS INT\n'
+            'START\n'
+            '    xyz= ((abc *5)/10 + 10) * -1\n'
+            '    OUTPUT: "[[]" & xyz & "[]]"\n'
+            'STOP',
+            '', '[-60.0]', None
+        ),
+        (
+            'VAR a=100, b=200, c=300 AS INT\n'
+            'VAR d="FALSE" AS BOOL\n'
+            'START\n'
+            '    d = (a < b AND c <>200)\n'
+            '    OUTPUT: d\n'
+            'STOP',
+            '', 'TRUE', None
+        ),
+        (
+            'VAR a=3 AS INT\n'
+            'START\n'
+            '    WHILE (a > 0)\n'
+            '    START\n'
+            '        a = a - 1\n'
+            '    STOP\n'
+            '    OUTPUT: a\n'
+            'STOP',
+            '', '0', None
+        ),
+        ('VAR a=1, b=0 AS INT\nSTART\n    a = a / b\nSTOP', '', None, RuntimeError),
+        ('VAR a=1, b AS INT\nSTART\n    OUTPUT: a / b\nSTOP', '', None, RuntimeError),
+        ('VAR a=1, b AS INT\nSTART\n    OUTPUT: a > 2 AND a / b > 0\nSTOP', '', 'FALSE', None),
+        ('VAR a=1, b AS INT\nSTART\n    OUTPUT: a < 2 AND a / b > 0\nSTOP', '', None, RuntimeError),
+        ('VAR a, b AS INT\nVAR c AS CHAR\nSTART\n    OUTPUT: a & "+" & b & c\nSTOP', '3, 4, "x"', '3+4x', None),
+        ('VAR a, b AS INT\nVAR c AS CHAR\nSTART\n    OUTPUT: a & "+" & b & c\nSTOP', '3', '3+0', None),
+        ('VAR a, b AS INT\nSTART\n    OUTPUT: a + b\nSTOP', '3, "x"', None, IllegalTypeError),
+        ('VAR a=1 AS INT\nSTART\n    OUTPUT: (a < 2) < (a & 1) AND NOT a == (a & "")\nSTOP', '', 'FALSE', None),
+        ('VAR a=1 AS INT\nSTART\n    a = a < 2\n    OUTPUT: a & "!"\nSTOP', '', 'TRUE!', None),
+        # a holds a number or a comparison, the generic methods report what they cannot take
+        ('VAR a=1 AS INT\nSTART\n    a = a < 5\n    OUTPUT: a + 1\nSTOP', '', None, RuntimeError),
+        ('VAR a=1 AS INT\nSTART\n    a = a < 5\n    OUTPUT: a < 3\nSTOP', '', None, RuntimeError),
+        ('VAR a=1 AS INT\nSTART\n    a = a < 5\n    OUTPUT: -a\nSTOP', '', None, RuntimeError),
+        ('VAR a=1 AS INT\nSTART\n    a = a < 5\n    OUTPUT: a == 1\nSTOP', '', 'FALSE', None),
+        (
+            'VAR a=1, i AS INT\n'
+            'START\n'
+            '    WHILE (i < 2)\n'
+            '    START\n'
+            '        i = i + a\n'
+            '        a = a < 5\n'
+            '    STOP\n'
+            'STOP',
+            '', None, RuntimeError
+        ),
+        (
+            'VAR a AS INT\n'
+            'VAR c AS CHAR\n'
+            'START\n'
+            '    c = "x" & IF (a > 0)\n'
+            '    START\n'
+            '        c = "pos"\n'
+            '    STOP\n'
+            '    OUTPUT: c\n'
+            'STOP',
+            '1', 'xpos', None
+        ),
+        (
+            'VAR a AS INT\n'
+            'VAR c AS CHAR\n'
+            'START\n'
+            '    c = "x" & IF (a > 0)\n'
+            '    START\n'
+            '        c = "pos"\n'
+            '    STOP\n'
+            '    OUTPUT: c\n'
+            'STOP',
+            '0', 'x0', None
+        )
+    ]
+
+    def compile(self, source):
+        tokens, program, error = views.compile_source(source)
+        self.assertIsNone(error)
+        return program
+
+    def run_program(self, program, inputs, engine):
+        output, error = program.run(inputs, engine)
+        if error:
+            return None, type(error), error.message(), error.pos_start.index
+        return str(output), None, None, None
+
+    def test_engines_agree_with_tree(self):
+        for source, inputs, output, error_class in EngineTests.PROGRAMS:
+            expected = self.run_program(self.compile(source), inputs, 'tree')
+            self.assertEqual(expected[:2], (output, error_class))
+
+            for engine in Program.ENGINES:
+                with self.subTest(source=source, inputs=inputs, engine=engine):
+                    # a new program for every engine, so no engine runs on what another compiled
+                    self.assertEqual(self.run_program(self.compile(source), inputs, engine), expected)
+
+    def test_illegal_type_is_reported_before_running(self):
+        # a comparison or an & gives a number holding text, which arithmetic cannot take
+        sources = [
+            'VAR a AS INT\nVAR c AS CHAR\nSTART\n    c = a - "x"\nSTOP',
+            'VAR a=1, b=2, c AS INT\nSTART\n    c = (a < b) + 1\nSTOP',
+            'VAR a=1, c AS INT\nSTART\n    c = (NOT a) * 2\nSTOP',
+            'VAR a=1, c AS INT\nSTART\n    c = (a & 2) - 1\nSTOP',
+            'VAR a=1, c AS INT\nSTART\n    c = -(a == 1)\nSTOP',
+            'VAR a=1 AS INT\nSTART\n    OUTPUT: (a < 2) < 3\nSTOP',
+            'VAR a=1 AS INT\nSTART\n    a = a < 2\n    OUTPUT: a == "x"\nSTOP'
+        ]
+
+        for source in sources:
+            with self.subTest(source=source):
+                tokens, program, error = views.compile_source(source)
+                self.assertIsNone(program)
+                self.assertIsInstance(error, IllegalTypeError)
+
+    def test_native_falls_back_to_python_compiler(self):
+        # c holds a CHAR or the Number(0) of an IF without an ELSE, which is not one native kind
+        source, inputs, output, error_class = EngineTests.PROGRAMS[-1]
+        program = self.compile(source)
+        self.assertIsNone(NativeCompiler().compile(program.node))
+
+        with mock.patch.object(PythonCompiler, 'compile', autospec=True, side_effect=PythonCompiler.compile) as compile:
+            self.assertEqual(self.run_program(program, inputs, 'native'), (output, None, None, None))
+        compile.assert_called_once()
+        self.assertIsNotNone(program.codes['native'])
+
+    def test_quickening_counts_hits_and_misses(self):
+        # c is a CHAR in the first pass and a number after it, so i & c finds no method at first
+        # and one once c holds a number, c & i keeps the method for a CHAR and misses after it
+        program = self.compile(
+            'VAR i AS INT\nVAR c="x", b, d AS CHAR\nSTART\n'
+            '    WHILE (i < 3)\n    START\n        i = i + 1\n'
+            '        b = i & c\n        d = c & i\n        c = i\n    STOP\n'
+            '    OUTPUT: b & d\nSTOP'
+        )
+
+        self.assertEqual(self.run_program(program, '', 'quickening'), ('3223', None, None, None))
+        self.assertEqual((program.hits, program.misses), (4, 2))
+
+        # the second run starts with the caches of the first, i & c now misses on the CHAR
+        self.assertEqual(self.run_program(program, '', 'quickening'), ('3223', None, None, None))
+        self.assertEqual((program.hits, program.misses), (8, 5))
+
+class DeepNestingTests(SimpleTestCase):
+
+    # twice the default recursion limit, nothing between the source and the output may recurse
+    DEPTH = 2000
+
+    def test_deep_programs_run_in_every_engine(self):
+        depth = DeepNestingTests.DEPTH
+        programs = [
+            ('VAR a=1 AS INT\nSTART\n    OUTPUT: ' + 'a + (' * depth + 'a' + ')' * depth + '\nSTOP', str(depth + 1)),
+            ('VAR a=1 AS INT\nSTART\n    OUTPUT: ' + ' & '.join(['a'] * depth) + '\nSTOP', '1' * depth),
+            ('VAR a=1 AS INT\nSTART\n    OUTPUT: ' + ' + '.join(['a'] * depth) + '\nSTOP', str(depth)),
+            ('VAR a=1 AS INT\nSTART\n    OUTPUT: ' + 'NOT ' * depth + '(a > 0)\nSTOP', 'FALSE'),
+            ('VAR a=1 AS INT\nSTART\n    OUTPUT: ' + '-' * depth + 'a\nSTOP', '1'),
+            ('VAR a=1 AS INT\nSTART\n    ' + 'a = ' * depth + '5\n    OUTPUT: a\nSTOP', '5')
+        ]
+
+        for source, output in programs:
+            for engine in Program.ENGINES:
+                with self.subTest(source=source[:60], engine=engine):
+                    tokens, program, error = views.compile_source(source)
+                    self.assertIsNone(error)
+                    self.assertEqual(str(program.run('', engine)[0]), output)
+
+    def test_python_compiler_falls_back_to_tree_walker(self):
+        # Python rejects blocks nested this deep, Program.compile leaves them to the Interpreter
+        depth = DeepNestingTests.DEPTH
+        source = 'VAR a=1 AS INT\nSTART\n' + 'a = (IF (a > 0)\nSTART\n' * depth + 'a = 2' + '\nSTOP\n)' * depth + '\nOUTPUT: a\nSTOP'
 
-# Create your tests here.
+        for engine in Program.ENGINES:
+            with self.subTest(engine=engine):
+                tokens, program, error = views.compile_source(source)
+                self.assertIsNone(error)
+                self.assertEqual(str(program.run('', engine)[0]), '2')
+                if engine in ('python', 'native'):
+                    self.assertIsNone(program.codes[engine])
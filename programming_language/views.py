@@ -1,13 +1,54 @@
 
+from django.conf import settings
 from django.shortcuts import render
 
 from programming_language.lexical.lexer import Lexer
-from programming_language.lexical.token import Token
+from programming_language.models import CompiledProgram
 from programming_language.syntax.parser import Parser
-from programming_language.syntax.symbol_table import SymbolTable
-from programming_language.semantics.context import Context
-from programming_language.semantics.interpreter import Interpreter
-from programming_language.semantics.number import Number
+from programming_language.semantics.optimizer import Optimizer
+from programming_language.semantics.program import Program
+from programming_language.semantics.type_checker import TypeChecker
+from programming_language.program_cache import ProgramCache
+
+program_cache = ProgramCache(settings.PROGRAM_CACHE['CAPACITY'], settings.PROGRAM_CACHE['EVICTION'])
+
+def load_source(source_code, source_hash):
+    max_size = settings.COMPILED_PROGRAM_CACHE['MAX_SIZE']
+    if max_size <= 0:
+        return compile_source(source_code)
+
+    # programs compiled by any worker are shared through the database
+    entry = CompiledProgram.objects.load(source_hash, Program.COMPILER_VERSION)
+    if entry == None:
+        entry = compile_source(source_code)
+        CompiledProgram.objects.store(source_hash, Program.COMPILER_VERSION, entry, max_size)
+    return entry
+
+def compile_source(source_code):
+    # Generate tokens
+    lexer = Lexer(source_code)
+    tokens, lexer_error = lexer.make_tokens()
+    if lexer_error:
+        return tokens, None, lexer_error
+
+    # Generate AST
+    parser = Parser(tokens)
+    ast = parser.parse()
+    if ast.error:
+        return tokens, None, ast.error
+
+    # Check the types
+    type_checker = TypeChecker()
+    type_error = type_checker.check(ast.node)
+    if type_error:
+        return tokens, None, type_error
+
+    # Optimize the AST
+    optimizer = Optimizer()
+    node = optimizer.optimize(ast.node)
+    node = type_checker.specialize(node)
+
+    return tokens, Program(node, parser.input_slots, optimizer.removed), None
 
 def index(request):
     tokens = None
@@ -17,37 +58,15 @@ def index(request):
     if request.POST:
         source_code = request.POST['source_code']
         if source_code.strip():
-            # replace newlines
-            lexemes = source_code.replace('\r\n', ';')
-            # Generate tokens
-            lexer = Lexer(lexemes)
-            tokens, lexer_error = lexer.make_tokens()
-
-            if lexer_error:
-                errors.append(lexer_error.message())
+            tokens, program, error = program_cache.get(source_code, load_source)
+
+            if error:
+                errors.append(error.message())
             else:
-                inputs = request.POST.get('inputs', False)
-                # Generate input tokens
-                lexer = Lexer(inputs)
-                input_tokens, input_lexer_error = lexer.make_tokens()
-
-                if input_lexer_error:
-                    errors.append(input_lexer_error.message())
-                else:
-                    # Generate AST
-                    parser = Parser(tokens, input_tokens)
-                    ast = parser.parse()
-                    if ast.error:
-                        errors.append(ast.error.message())
-                    else:
-                        interpreter = Interpreter()
-                        context = Context('<source-code>')
-                        context.symbol_table = SymbolTable()
-                        result = interpreter.visit(ast.node, context)
-                        if result.error:
-                            errors.append(result.error.message())
-                        else:
-                            output = context.symbol_table.get(Token.OUTPUT)
+                # Bind the inputs and run the program
+                output, error = program.run(request.POST.get('inputs', ''), settings.PROGRAM_ENGINE)
+                if error:
+                    errors.append(error.message())
             
     ctx = {
         'tokens': tokens,